@@ -4,12 +4,14 @@ Primary entry point for construe CLI application
 
 import click
 import platform
+import warnings
 
 from datetime import datetime
 
 from .version import get_version
-from .utils import resolve_exclude
-from .exceptions import DeviceError
+from .operators import SUITES
+from .utils import resolve_exclude, format_table
+from .exceptions import DeviceError, RegressionError
 
 from .datasets.path import get_data_home
 from .datasets.loaders import cleanup_all_datasets
@@ -38,24 +40,27 @@ from .models.download import (
     download_gliner,
 )
 
-
-from .nsfw import NSFW
-from .gliner import GLiNER
-from .whisper import Whisper
-from .lowlight import LowLight
-from .mobilenet import MobileNet
-from .mobilevit import MobileViT
-from .moondream import MoonDream
-from .offensive import Offensive
-from .basic import BasicBenchmark
-
+# Benchmarks (and the frameworks they depend on) are imported from the registry only
+# when a benchmark command is run so that the CLI starts quickly.
 from .benchmark import BenchmarkRunner
+from .benchmark.registry import registered, load_benchmark
+from .cloud.download import WORKERS, PARTS, CONNECTIONS
+from .benchmark.load import POISSON, ARRIVALS
+from .benchmark.workers import BASELINE_LIMIT
+from .models.options import AUTO, OP_RESOLVERS
+from .metrics.store import ResultsStore, COMPARE_BY, STATS
+from .metrics.compare import compare as compare_results
+from .metrics.compare import ALPHA, THRESHOLD, CONFIDENCE, N_BOOTSTRAP
+from .metrics import load as load_results
 
 
 CONTEXT_SETTINGS = {
     "help_option_names": ["-h", "--help"],
 }
 
+# Context meta key that records that shadowed benchmarks have been warned about
+SHADOWED_KEY = "construe.shadowed"
+
 DATASETS = [
     "all",
     "dialects",
@@ -79,20 +84,54 @@ MODELS = [
     "gliner",
 ]
 
-BENCHMARKS = {
-    "whisper": Whisper,
-    "lowlight": LowLight,
-}
 
+class BenchmarkGroup(click.Group):
+    """
+    Adds a command for each registered benchmark that does not have its own command
+    so that benchmarks registered by other packages can be run directly; the
+    benchmark is only imported when its command is invoked. A benchmark registered
+    with the name of a built-in command (e.g. compare) cannot be run by its own
+    command, so a warning is issued and it can only be run with run --include.
+    """
 
-@click.group(context_settings=CONTEXT_SETTINGS)
+    def list_commands(self, ctx):
+        self.check_shadowed(ctx)
+        return sorted(set(super().list_commands(ctx)) | set(registered()))
+
+    def get_command(self, ctx, name):
+        self.check_shadowed(ctx)
+        command = super().get_command(ctx, name)
+        if command is None:
+            entry = registered().get(name)
+            if entry is not None:
+                command = benchmark_command(entry)
+        return command
+
+    def check_shadowed(self, ctx):
+        """
+        Warns once per invocation about registered benchmarks whose names are
+        shadowed by built-in commands.
+        """
+        if ctx.meta.get(SHADOWED_KEY):
+            return
+        ctx.meta[SHADOWED_KEY] = True
+
+        for name in sorted(set(self.commands) & set(registered())):
+            warnings.warn(
+                f"benchmark {name!r} is shadowed by the built-in {name} command "
+                f"and can only be run with 'construe run --include {name}'",
+                stacklevel=2,
+            )
+
+
+@click.group(cls=BenchmarkGroup, context_settings=CONTEXT_SETTINGS)
 @click.version_option(get_version(), message="%(prog)s v%(version)s")
 @click.option(
     "-o",
     "--out",
     default=None,
     type=str,
-    help="specify the path to write the benchmark results to",
+    help="path to write results to (binary format if it ends in .npz)",
 )
 @click.option(
     "-d",
@@ -143,6 +182,12 @@ BENCHMARKS = {
     default=True,
     help="use sample dataset instead of full dataset for benchmark",
 )
+@click.option(
+    "-x",
+    "--extract/--no-extract",
+    default=True,
+    help="extract datasets to disk or read instances directly from the archive",
+)
 @click.option(
     "-C",
     "--cleanup/--no-cleanup",
@@ -155,6 +200,143 @@ BENCHMARKS = {
     default=True,
     help="specify the verbosity of the output and progress bars",
 )
+@click.option(
+    "-m",
+    "--memory/--no-memory",
+    default=False,
+    help="sample peak memory usage during preprocessing and inferencing",
+)
+@click.option(
+    "-H",
+    "--trace-heap/--no-trace-heap",
+    default=False,
+    help="track the python heap with tracemalloc (adds overhead to timings)",
+)
+@click.option(
+    "-w",
+    "--warmup",
+    default="0",
+    type=str,
+    help="number of warmup instances per run or 'auto' to warmup until steady",
+)
+@click.option(
+    "-b",
+    "--batch-size",
+    default=1,
+    type=click.IntRange(min=1),
+    help="number of instances to group into a batch for each inference",
+)
+@click.option(
+    "-p",
+    "--prefetch",
+    default=0,
+    type=click.IntRange(min=0),
+    help="depth of the queue to preprocess batches ahead of inference (0 disables)",
+)
+@click.option(
+    "-W",
+    "--prefetch-workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help="number of background threads to preprocess with when prefetching",
+)
+@click.option(
+    "-n",
+    "--concurrency",
+    default=1,
+    type=click.IntRange(min=1),
+    help="number of model replicas to run concurrently to measure throughput",
+)
+@click.option(
+    "-N",
+    "--baseline-limit",
+    default=BASELINE_LIMIT,
+    type=click.IntRange(min=0),
+    help="instances in the single replica baseline of concurrent runs (0 to skip)",
+)
+@click.option(
+    "-r",
+    "--rate",
+    "rates",
+    default=None,
+    type=click.FloatRange(min=0, min_open=True),
+    multiple=True,
+    help="issue requests in an open loop at the rate per second (specify to sweep)",
+)
+@click.option(
+    "-A",
+    "--arrival",
+    default=POISSON,
+    type=click.Choice(ARRIVALS, case_sensitive=False),
+    help="the arrival process of requests when generating open-loop load",
+)
+@click.option(
+    "-K",
+    "--keep-samples/--sketch-only",
+    default=True,
+    help="keep raw samples in the results or only a fixed-memory quantile sketch",
+)
+@click.option(
+    "-k",
+    "--checkpoint",
+    default=None,
+    type=str,
+    help="stream the measurements of each completed run to a JSON lines file",
+)
+@click.option(
+    "-R",
+    "--resume/--no-resume",
+    default=False,
+    help="skip runs that are already completed in the checkpoint file",
+)
+@click.option(
+    "-P",
+    "--cache",
+    default=None,
+    type=str,
+    envvar="CONSTRUE_CACHE",
+    help="cache preprocessed features in the directory so runs skip preprocessing",
+)
+@click.option(
+    "-O",
+    "--preprocess-once/--preprocess-every-run",
+    default=False,
+    help="measure preprocessing in the first run and only inference in later runs",
+)
+@click.option(
+    "-t",
+    "--num-threads",
+    default=None,
+    type=click.IntRange(min=1),
+    help="number of threads used by the tflite interpreter (default chosen by tflite)",
+)
+@click.option(
+    "-T",
+    "--threads",
+    default=None,
+    type=click.IntRange(min=1),
+    multiple=True,
+    help="run the benchmarks with each number of interpreter threads (to sweep)",
+)
+@click.option(
+    "-X",
+    "--xnnpack/--no-xnnpack",
+    default=True,
+    help="use the xnnpack delegate of the tflite interpreter",
+)
+@click.option(
+    "-u",
+    "--op-resolver",
+    default=AUTO,
+    type=click.Choice(OP_RESOLVERS, case_sensitive=False),
+    help="the experimental op resolver used by the tflite interpreter",
+)
+@click.option(
+    "-V",
+    "--verify/--no-verify",
+    default=None,
+    help="fully verify the signature of cached archives instead of trusting the cache",
+)
 @click.pass_context
 def main(
     ctx,
@@ -166,8 +348,29 @@ def main(
     datadir=None,
     modeldir=None,
     sample=True,
+    extract=True,
     cleanup=True,
     verbose=True,
+    memory=False,
+    trace_heap=False,
+    warmup="0",
+    batch_size=1,
+    prefetch=0,
+    prefetch_workers=1,
+    concurrency=1,
+    baseline_limit=BASELINE_LIMIT,
+    rates=None,
+    arrival=POISSON,
+    keep_samples=True,
+    checkpoint=None,
+    resume=False,
+    cache=None,
+    preprocess_once=False,
+    num_threads=None,
+    threads=None,
+    xnnpack=True,
+    op_resolver=AUTO,
+    verify=None,
 ):
     """
     A utility for executing inferencing benchmarks.
@@ -196,39 +399,66 @@ def main(
     ctx.obj["data_home"] = get_data_home(datadir)
     ctx.obj["model_home"] = get_model_home(modeldir)
     ctx.obj["use_sample"] = sample
+    ctx.obj["extract"] = extract
     ctx.obj["cleanup"] = cleanup
     ctx.obj["verbose"] = verbose
+    ctx.obj["memory"] = memory
+    ctx.obj["trace_heap"] = trace_heap
+    ctx.obj["warmup"] = warmup
+    ctx.obj["batch_size"] = batch_size
+    ctx.obj["prefetch"] = prefetch
+    ctx.obj["prefetch_workers"] = prefetch_workers
+    ctx.obj["concurrency"] = concurrency
+    ctx.obj["baseline_limit"] = baseline_limit
+    ctx.obj["rates"] = list(rates) if rates else None
+    ctx.obj["arrival"] = arrival
+    ctx.obj["keep_samples"] = keep_samples
+    ctx.obj["checkpoint"] = checkpoint
+    ctx.obj["resume"] = resume
+    ctx.obj["cache"] = cache
+    ctx.obj["preprocess_once"] = preprocess_once
+    ctx.obj["num_threads"] = num_threads
+    ctx.obj["threads"] = list(threads) if threads else None
+    ctx.obj["xnnpack"] = xnnpack
+    ctx.obj["op_resolver"] = op_resolver.lower()
+    ctx.obj["verify"] = verify
 
 
 @main.command()
 @click.option(
     "-E",
     "--exclude",
-    default=None,
-    type=click.Choice(BENCHMARKS.keys(), case_sensitive=False),
-    help="specify benchmarks to exclude from runner",
+    multiple=True,
+    help="specify benchmarks to exclude from runner (may be repeated)",
 )
 @click.option(
     "-I",
     "--include",
-    default=None,
-    type=click.Choice(BENCHMARKS.keys(), case_sensitive=False),
-    help="specify benchmarks to include in runner",
+    multiple=True,
+    help="specify benchmarks to include in runner (may be repeated)",
 )
 @click.pass_context
-def run(ctx, **kwargs):
+def run(ctx, exclude=None, include=None):
     """
     Executes all available benchmarks.
     """
-    out = ctx.obj.pop("out")
-    exclude = resolve_exclude(
-        kwargs.pop("exclude"), kwargs.pop("include"), BENCHMARKS.keys()
-    )
-    benchmarks = [bench for name, bench in BENCHMARKS.items() if name not in exclude]
+    benchmarks = registered()
+    for name in (*exclude, *include):
+        if name.strip().lower() not in benchmarks:
+            raise click.BadParameter(
+                f"no benchmark named {name!r}, choose from {', '.join(benchmarks)}"
+            )
 
-    runner = BenchmarkRunner(benchmarks=benchmarks, **ctx.obj)
-    runner.run()
-    runner.save(out)
+    # Benchmarks that are not run by default must be explicitly included
+    exclude = resolve_exclude(exclude, include, benchmarks.keys())
+    names = [
+        name for name, entry in benchmarks.items()
+        if name not in exclude and (include or entry.default)
+    ]
+
+    if not names:
+        raise click.UsageError("no benchmarks selected to run")
+    run_benchmarks(ctx, *names)
 
 
 @main.command()
@@ -245,6 +475,21 @@ def run(ctx, **kwargs):
     type=int,
     help="specify number of threads for benchmark (default to maximum)",
 )
+@click.option(
+    "-T",
+    "--threads-sweep/--no-threads-sweep",
+    default=False,
+    help="sweep powers of two threads up to the number of threads and report scaling",
+)
+@click.option(
+    "-s",
+    "--suite",
+    "suites",
+    multiple=True,
+    default=["dot"],
+    type=click.Choice(["dot", *SUITES, "all"], case_sensitive=False),
+    help="operator suites to benchmark (may be repeated, default is dot)",
+)
 @click.option(
     "-F",
     "--fuzz/--no-fuzz",
@@ -261,108 +506,43 @@ def run(ctx, **kwargs):
 @click.pass_context
 def basic(ctx, **kwargs):
     """
-    Runs basic dot product performance benchmarks.
+    Runs basic dot product and operator performance benchmarks.
     """
     kwargs["env"] = ctx.obj["env"]
+    kwargs["suites"] = [suite.lower() for suite in kwargs["suites"]]
     if kwargs["saveto"] is None:
         kwargs["saveto"] = ctx.obj["out"]
 
+    # Imported here since the basic benchmarks require torch
+    from .basic import BasicBenchmark
+
     benchmark = BasicBenchmark(**kwargs)
     benchmark.run()
 
 
-@main.command()
-@click.pass_context
-def moondream(ctx, **kwargs):
+def benchmark_command(entry):
     """
-    Executes image-to-text inferencing benchmarks.
+    Creates the command that runs a registered benchmark.
     """
-    out = ctx.obj.pop("out")
-    runner = BenchmarkRunner(benchmarks=[MoonDream], **ctx.obj)
-    runner.run()
-    runner.save(out)
-
-
-@main.command()
-@click.pass_context
-def whisper(ctx, **kwargs):
-    """
-    Executes audio-to-text inferencing benchmarks.
-    """
-    out = ctx.obj.pop("out")
-    runner = BenchmarkRunner(benchmarks=[Whisper], **ctx.obj)
-    runner.run()
-    runner.save(out)
-
-
-@main.command()
-@click.pass_context
-def mobilenet(ctx, **kwargs):
-    """
-    Executes image classification inferencing benchmarks.
-    """
-    out = ctx.obj.pop("out")
-    runner = BenchmarkRunner(benchmarks=[MobileNet], **ctx.obj)
-    runner.run()
-    runner.save(out)
-
-
-@main.command()
-@click.pass_context
-def mobilevit(ctx, **kwargs):
-    """
-    Executes object detection inferencing benchmarks.
-    """
-    out = ctx.obj.pop("out")
-    runner = BenchmarkRunner(benchmarks=[MobileViT], **ctx.obj)
-    runner.run()
-    runner.save(out)
-
-
-@main.command()
-@click.pass_context
-def nsfw(ctx, **kwargs):
-    """
-    Executes NSFW image classification inferencing benchmarks.
-    """
-    out = ctx.obj.pop("out")
-    runner = BenchmarkRunner(benchmarks=[NSFW], **ctx.obj)
-    runner.run()
-    runner.save(out)
-
-
-@main.command()
-@click.pass_context
-def lowlight(ctx, **kwargs):
-    """
-    Executes lowlight image enhancement inferencing benchmarks.
-    """
-    out = ctx.obj.pop("out")
-    runner = BenchmarkRunner(benchmarks=[LowLight], **ctx.obj)
-    runner.run()
-    runner.save(out)
-
-
-@main.command()
-@click.pass_context
-def offensive(ctx, **kwargs):
-    """
-    Executes offensive speech text classification inferencing benchmarks.
-    """
-    out = ctx.obj.pop("out")
-    runner = BenchmarkRunner(benchmarks=[Offensive], **ctx.obj)
-    runner.run()
-    runner.save(out)
+    @click.pass_context
+    def command(ctx):
+        run_benchmarks(ctx, entry.name)
+
+    return click.Command(
+        entry.name,
+        callback=command,
+        help=entry.help or f"Executes the {entry.name} benchmark.",
+    )
 
 
-@main.command()
-@click.pass_context
-def gliner(ctx, **kwargs):
+def run_benchmarks(ctx, *names):
     """
-    Executes GLiNER named entity discovery inferencing benchmarks.
+    Loads the named benchmarks from the registry, runs them with the options of the
+    main command and saves the results.
     """
     out = ctx.obj.pop("out")
-    runner = BenchmarkRunner(benchmarks=[GLiNER], **ctx.obj)
+    benchmarks = [load_benchmark(name) for name in names]
+    runner = BenchmarkRunner(benchmarks=benchmarks, **ctx.obj)
     runner.run()
     runner.save(out)
 
@@ -386,6 +566,20 @@ def gliner(ctx, **kwargs):
     default=True,
     help="if downloading a dataset, download only a sample",
 )
+@click.option(
+    "-w",
+    "--workers",
+    default=WORKERS,
+    type=click.IntRange(min=1),
+    help="number of datasets to download concurrently when downloading all",
+)
+@click.option(
+    "-c",
+    "--connections",
+    default=None,
+    type=click.IntRange(min=1),
+    help=f"maximum number of HTTP connections (default {PARTS}, or {CONNECTIONS} for all)",
+)
 @click.option(
     "-v",
     "--verbose/--no-verbose",
@@ -393,7 +587,15 @@ def gliner(ctx, **kwargs):
     help="print verbose info, otherwise just print the datasets path",
 )
 @click.pass_context
-def datasets(ctx, clean=False, download=None, sample=True, verbose=False):
+def datasets(
+    ctx,
+    clean=False,
+    download=None,
+    sample=True,
+    workers=WORKERS,
+    connections=None,
+    verbose=False,
+):
     """
     Helper utility for managing the dataset cache.
     """
@@ -417,7 +619,8 @@ def datasets(ctx, clean=False, download=None, sample=True, verbose=False):
             "nsfw": download_nsfw,
         }[download]
 
-        downloader(sample=sample, data_home=data_home, progress=True)
+        kwargs = download_kwargs(download, workers, connections)
+        downloader(sample=sample, data_home=data_home, progress=True, **kwargs)
         return
 
     # Provide some info
@@ -440,6 +643,20 @@ def datasets(ctx, clean=False, download=None, sample=True, verbose=False):
     default=None,
     type=click.Choice(MODELS, case_sensitive=False),
 )
+@click.option(
+    "-w",
+    "--workers",
+    default=WORKERS,
+    type=click.IntRange(min=1),
+    help="number of models to download concurrently when downloading all",
+)
+@click.option(
+    "-c",
+    "--connections",
+    default=None,
+    type=click.IntRange(min=1),
+    help=f"maximum number of HTTP connections (default {PARTS}, or {CONNECTIONS} for all)",
+)
 @click.option(
     "-v",
     "--verbose/--no-verbose",
@@ -447,7 +664,15 @@ def datasets(ctx, clean=False, download=None, sample=True, verbose=False):
     help="print verbose info, otherwise just print the models path",
 )
 @click.pass_context
-def models(ctx, clean=False, download=None, sample=True, verbose=False):
+def models(
+    ctx,
+    clean=False,
+    download=None,
+    sample=True,
+    workers=WORKERS,
+    connections=None,
+    verbose=False,
+):
     """
     Helper utility for managing the models cache.
     """
@@ -472,7 +697,8 @@ def models(ctx, clean=False, download=None, sample=True, verbose=False):
             "gliner": download_gliner,
         }[download]
 
-        downloader(model_home=model_home, progress=True)
+        kwargs = download_kwargs(download, workers, connections)
+        downloader(model_home=model_home, progress=True, **kwargs)
         return
 
     # Provide some info
@@ -482,6 +708,192 @@ def models(ctx, clean=False, download=None, sample=True, verbose=False):
         print(model_home)
 
 
+def download_kwargs(download, workers, connections):
+    """
+    Returns the keyword arguments of the downloader: when downloading all archives
+    the connections are shared by the concurrent downloads, otherwise they are the
+    number of parallel range requests of the single download.
+    """
+    if download == "all":
+        return {"workers": workers, "connections": connections or CONNECTIONS}
+    return {"parts": connections or PARTS}
+
+
+@main.command()
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "-B",
+    "--db",
+    default=None,
+    type=str,
+    help="path to the results database (default $CONSTRUE_RESULTS_DB)",
+)
+def ingest(paths, db=None):
+    """
+    Adds benchmark results files to the results database.
+    """
+    with ResultsStore(db) as store:
+        for path in paths:
+            if store.ingest(path) is None:
+                click.echo(f"skipped {path}: already ingested")
+            else:
+                click.echo(f"ingested {path}")
+
+
+@main.command()
+@click.option(
+    "-B",
+    "--db",
+    default=None,
+    type=str,
+    help="path to the results database (default $CONSTRUE_RESULTS_DB)",
+)
+@click.option(
+    "-b",
+    "--benchmark",
+    "label",
+    default=None,
+    help="the benchmark to query, e.g. whisper",
+)
+@click.option(
+    "-m",
+    "--metric",
+    "sub_label",
+    default=None,
+    help="the measurement to query, e.g. inferencing",
+)
+@click.option(
+    "-e",
+    "--env",
+    default=None,
+    help="glob pattern of the environments to query, e.g. 'rpi5*'",
+)
+@click.option(
+    "-d",
+    "--device",
+    default=None,
+    help="glob pattern of the devices to query",
+)
+@click.option(
+    "-V",
+    "--version",
+    default=None,
+    help="glob pattern of the construe versions to query",
+)
+@click.option(
+    "-s",
+    "--since",
+    default=None,
+    help="only query runs started on or after this timestamp, e.g. 2025-01-01",
+)
+@click.option(
+    "-n",
+    "--last",
+    default=None,
+    type=click.IntRange(min=1),
+    help="only query the last N runs of each benchmark in each env and device",
+)
+@click.option(
+    "-c",
+    "--compare",
+    default=None,
+    type=click.Choice(COMPARE_BY, case_sensitive=False),
+    help="summarize the median of the runs grouped by env, device, or version",
+)
+def query(db=None, compare=None, **kwargs):
+    """
+    Queries measurements from the results database.
+    """
+    with ResultsStore(db) as store:
+        if compare is not None:
+            rows = store.compare(by=compare, **kwargs)
+            columns = ["label", "sub_label", compare, "units", "runs", "median", "min", "max"]
+        else:
+            rows = store.query(**kwargs)
+            columns = ["label", "sub_label", "env", "device", "started", "units"]
+            columns += [stat for stat in STATS if stat not in ("mean", "stddev")]
+
+    if not rows:
+        click.echo("no measurements matched the query")
+        return
+    click.echo(format_table(rows, columns))
+
+
+@main.command()
+@click.argument("baseline", type=click.Path(exists=True, dir_okay=False))
+@click.argument("candidate", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "-t",
+    "--threshold",
+    default=THRESHOLD,
+    type=click.FloatRange(min=0),
+    help="relative change in the median that is a regression if significant",
+)
+@click.option(
+    "-a",
+    "--alpha",
+    default=ALPHA,
+    type=click.FloatRange(min=0, max=1),
+    help="significance level of the Mann-Whitney U test",
+)
+@click.option(
+    "-c",
+    "--confidence",
+    default=CONFIDENCE,
+    type=click.FloatRange(min=0, max=1, min_open=True, max_open=True),
+    help="confidence level of the bootstrap interval of the change",
+)
+@click.option(
+    "-n",
+    "--bootstrap",
+    "n_bootstrap",
+    default=N_BOOTSTRAP,
+    type=click.IntRange(min=1),
+    help="number of bootstrap resamples",
+)
+@click.option(
+    "-S",
+    "--seed",
+    default=None,
+    type=int,
+    help="set the random seed for bootstrap resampling",
+)
+def compare(baseline, candidate, **kwargs):
+    """
+    Compares candidate results to baseline results and exits with status 3 if any
+    measurement has a significant regression beyond the threshold.
+    """
+    baseline = load_results(baseline)["measurements"] or []
+    candidate = load_results(candidate)["measurements"] or []
+    comparisons = compare_results(baseline, candidate, **kwargs)
+
+    if not comparisons:
+        raise click.ClickException("no measurements in common to compare")
+
+    rows = []
+    for c in comparisons:
+        row = c.dump()
+        row["change"] = f"{c.change:+.2%}"
+        if c.ci_low is not None:
+            row["ci"] = f"[{c.ci_low:+.2%}, {c.ci_high:+.2%}]"
+        row["result"] = "REGRESSION" if c.regression else (
+            ("improved" if (c.change > 0) == c.higher_is_better else "changed")
+            if c.significant else ""
+        )
+        rows.append(row)
+
+    click.echo(format_table(rows, [
+        "label", "sub_label", "units", "baseline", "candidate", "change", "ci",
+        "p_value", "result",
+    ]))
+
+    regressions = sum(c.regression for c in comparisons)
+    if regressions:
+        raise RegressionError(
+            f"{regressions} significant regression(s) beyond {kwargs['threshold']:.0%}"
+        )
+
+
 if __name__ == "__main__":
     main(
         obj={},
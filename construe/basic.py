@@ -1,5 +1,5 @@
 """
-Benchmarks basic dot product torch operators.
+Benchmarks basic dot product torch operators and the operator microbenchmarks.
 
 See: https://pytorch.org/tutorials/recipes/recipes/benchmark.html
 """
@@ -10,8 +10,17 @@ import pickle
 import torch.utils.benchmark as benchmark
 
 from itertools import product
+from collections import defaultdict
 from torch.utils.benchmark import Fuzzer, FuzzedParameter, FuzzedTensor
 
+from .utils import format_table
+from .operators import SUITES
+from .exceptions import BenchmarkError
+
+
+# The suite of batched dot product benchmarks (the other suites are operators)
+DOT = "dot"
+
 
 def batched_dot_mul_sum(a, b):
     """
@@ -29,25 +38,159 @@ def batched_dot_bmm(a, b):
     return torch.bmm(a, b).flatten(-3)
 
 
+def sweep_threads(max_threads):
+    """
+    Returns the thread counts to sweep: the powers of two up to max_threads and
+    max_threads itself if it is not a power of two.
+    """
+    counts = []
+    n = 1
+    while n < max_threads:
+        counts.append(n)
+        n *= 2
+    counts.append(max_threads)
+    return counts
+
+
+def thread_scaling(results):
+    """
+    Computes the speedup and parallel efficiency of each operation (identified by
+    its sub label and description) at each thread count from the median times of
+    the measurements relative to the measurement with the fewest threads. Returns
+    the speedup rows, the efficiency rows, and the thread counts.
+    """
+    medians = defaultdict(dict)
+    for result in results:
+        key = (result.task_spec.sub_label, result.task_spec.description)
+        medians[key][result.task_spec.num_threads] = result.median
+
+    threads = sorted({n for times in medians.values() for n in times})
+    speedups, efficiencies = [], []
+    for (sub_label, description), times in medians.items():
+        base = min(times)
+        speedup = {"op": description, "size": sub_label.strip()}
+        efficiency = dict(speedup)
+        for n, median in times.items():
+            if median > 0:
+                speedup[str(n)] = times[base] / median
+                efficiency[str(n)] = speedup[str(n)] * base / n
+        speedups.append(speedup)
+        efficiencies.append(efficiency)
+
+    return speedups, efficiencies, threads
+
+
+def throughput(results):
+    """
+    Computes the GFLOP/s of each operation at each thread count from the median
+    times of the measurements that record their FLOPs in their metadata (e.g. the
+    operator microbenchmarks). Returns the rows and the thread counts.
+    """
+    rows = {}
+    threads = set()
+    for result in results:
+        flops = (result.metadata or {}).get("flops")
+        if not flops or result.median <= 0:
+            continue
+
+        spec = result.task_spec
+        key = (spec.sub_label, spec.description)
+        if key not in rows:
+            rows[key] = {
+                "op": spec.description, "size": spec.sub_label, "GFLOP": flops / 1e9,
+            }
+        rows[key][str(spec.num_threads)] = flops / result.median / 1e9
+        threads.add(spec.num_threads)
+
+    return list(rows.values()), sorted(threads)
+
+
 class BasicBenchmark(object):
 
-    def __init__(self, env=None, saveto=None, num_threads=None, fuzz=False, seed=None):
+    def __init__(
+        self,
+        env=None,
+        saveto=None,
+        num_threads=None,
+        fuzz=False,
+        seed=None,
+        threads_sweep=False,
+        min_run_time=1,
+        suites=(DOT,),
+    ):
         if num_threads is None:
             num_threads = torch.get_num_threads()
 
+        suites = [DOT, *SUITES] if "all" in suites else list(suites)
+        for suite in suites:
+            if suite != DOT and suite not in SUITES:
+                raise BenchmarkError(f"unknown basic benchmark suite {suite!r}")
+
         self.env = env
         self.saveto = saveto
         self.num_threads = num_threads
         self.fuzz = fuzz
         self.seed = seed
+        self.threads_sweep = threads_sweep
+        self.min_run_time = min_run_time
+        self.suites = suites
 
     def run(self):
+        """
+        Times the batched dot operators on each dataset (if the dot suite is
+        selected) and the operators of the other selected suites, printing the
+        GFLOP/s of the operators. If sweeping threads, the operators are timed with
+        each thread count up to num_threads and the speedup and parallel efficiency
+        of each thread count are printed.
+        """
         results = []
-        dataset = self.fuzzer().take(10) if self.fuzz else list(self.static())
+        dataset = []
+        if DOT in self.suites:
+            dataset = self.fuzzer().take(10) if self.fuzz else list(self.static())
+
+        operators = [
+            op for suite in self.suites if suite != DOT for op in SUITES[suite]
+        ]
 
+        if self.threads_sweep:
+            counts = sweep_threads(self.num_threads)
+        else:
+            counts = [self.num_threads]
+
+        for num_threads in counts:
+            results.extend(self.time_operators(dataset, num_threads))
+            results.extend(self.time_suites(operators, num_threads))
+
+        if self.saveto is not None:
+            with open(self.saveto, "wb") as f:
+                pickle.dump(results, f)
+
+        compare = benchmark.Compare(results)
+        compare.print()
+
+        if operators:
+            rows, threads = throughput(results)
+            columns = ["op", "size", "GFLOP"] + [str(n) for n in threads]
+
+            print("\nThroughput (GFLOP/s) by number of threads\n")
+            print(format_table(rows, columns))
+
+        if self.threads_sweep:
+            speedups, efficiencies, threads = thread_scaling(results)
+            columns = ["op", "size"] + [str(n) for n in threads]
+
+            print("\nSpeedup by number of threads\n")
+            print(format_table(speedups, columns))
+            print("\nParallel efficiency by number of threads\n")
+            print(format_table(efficiencies, columns))
+
+        return results
+
+    def time_operators(self, dataset, num_threads):
+        results = []
         kwargs = {
             "label": "Batched Dot",
-            "num_threads": self.num_threads,
+            "num_threads": num_threads,
             "env": self.env,
         }
 
@@ -61,7 +204,7 @@ class BasicBenchmark(object):
                     sub_label=sub_label,
                     description="mul/sum",
                     **kwargs
-                ).blocked_autorange(min_run_time=1)
+                ).blocked_autorange(min_run_time=self.min_run_time)
             )
             results.append(
                 benchmark.Timer(
@@ -71,15 +214,31 @@ class BasicBenchmark(object):
                     sub_label=sub_label,
                     description="bmm",
                     **kwargs
-                ).blocked_autorange(min_run_time=1)
+                ).blocked_autorange(min_run_time=self.min_run_time)
             )
 
-        if self.saveto is not None:
-            with open(self.saveto, "wb") as f:
-                pickle.dump(results, f)
+        return results
 
-        compare = benchmark.Compare(results)
-        compare.print()
+    def time_suites(self, operators, num_threads):
+        """
+        Times each operator with freshly created inputs, recording the FLOPs of the
+        operator in the metadata of its measurement.
+        """
+        results = []
+        for operator in tqdm.tqdm(operators, leave=False):
+            result = benchmark.Timer(
+                stmt=operator.stmt,
+                globals=operator.globals(),
+                label=operator.suite,
+                sub_label=operator.name,
+                description=operator.op,
+                num_threads=num_threads,
+                env=self.env,
+            ).blocked_autorange(min_run_time=self.min_run_time)
+
+            result.metadata = {"flops": operator.flops}
+            results.append(result)
+        return results
 
     def fuzzer(self):
         """
@@ -3,5 +3,5 @@ Manages benchmark execution in the construe library.
 """
 
 from .base import Benchmark
-from .limit import limit_generator
+from .limit import limit_generator, batch_generator
 from .runner import BenchmarkRunner
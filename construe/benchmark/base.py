@@ -3,11 +3,18 @@ Defines the base class for all Benchmarks.
 """
 
 import abc
+import numpy as np
 
-from ..models import get_model_home
+from collections.abc import Mapping
+from ..models import get_model_home, InterpreterOptions
+from ..models.options import AUTO
 from ..datasets import get_data_home
 
-from typing import Any, Generator, Dict, Union
+from typing import Any, Generator, Dict, List, Optional, Union
+
+
+# Name of the array when the preprocessed features are a single array
+FEATURES = "features"
 
 
 class Benchmark(abc.ABC):
@@ -31,6 +38,14 @@ class Benchmark(abc.ABC):
         self._model_home = get_model_home(kwargs.pop("model_home", None))
         self._use_sample = kwargs.pop("use_sample", True)
         self._progress = kwargs.pop("progress", True)
+        self._batch_size = kwargs.pop("batch_size", 1)
+        self._extract = kwargs.pop("extract", True)
+        self._verify = kwargs.pop("verify", None)
+        self._interpreter_options = InterpreterOptions(
+            num_threads=kwargs.pop("num_threads", None),
+            xnnpack=kwargs.pop("xnnpack", True),
+            op_resolver=kwargs.pop("op_resolver", AUTO),
+        )
         self._options = kwargs
 
     @property
@@ -49,6 +64,22 @@ class Benchmark(abc.ABC):
     def use_sample(self) -> bool:
         return getattr(self, "_use_sample", True)
 
+    @property
+    def batch_size(self) -> int:
+        return getattr(self, "_batch_size", 1)
+
+    @property
+    def extract(self) -> bool:
+        return getattr(self, "_extract", True)
+
+    @property
+    def verify(self) -> Optional[bool]:
+        return getattr(self, "_verify", None)
+
+    @property
+    def interpreter_options(self) -> InterpreterOptions:
+        return getattr(self, "_interpreter_options", InterpreterOptions())
+
     @property
     def metadata(self) -> Dict:
         return getattr(self, "_metadata", None)
@@ -100,3 +131,75 @@ class Benchmark(abc.ABC):
         latency and memory usage to add to the metrics.
         """
         pass
+
+    def preprocess_batch(self, instances: List[Any]) -> Any:
+        """
+        Preprocesses a batch of instances for batched inference when the runner is
+        configured with a batch size greater than one. By default each instance is
+        preprocessed individually; subclasses should override this method to combine
+        the instances into a single input tensor for the model.
+        """
+        return [self.preprocess(instance) for instance in instances]
+
+    def inference_batch(self, batch: Any) -> Any:
+        """
+        Performs inference on the output of ``preprocess_batch``. By default each
+        preprocessed instance is inferenced individually; subclasses that override
+        ``preprocess_batch`` must also override this method to run the batch through
+        the model in a single invocation.
+        """
+        return [self.inference(instance) for instance in batch]
+
+    def padded(self, size: int) -> bool:
+        """
+        Returns True if ``preprocess_batch`` pads a batch of the specified number of
+        instances up to the batch size (e.g. for a model with a fixed input shape).
+        The timings of padded batches are not amortized over their instances since
+        they include the padding; by default batches are not padded.
+        """
+        return False
+
+    @property
+    def fingerprint(self) -> Dict:
+        """
+        Describes everything that determines the output of preprocessing so that
+        cached features are invalidated when it changes. Subclasses should extend
+        this with e.g. the configuration of their processor and the signature of
+        their dataset; it is computed after ``before`` is called.
+        """
+        return {
+            "benchmark": self.__class__.__name__,
+            "use_sample": self.use_sample,
+            "batch_size": self.batch_size,
+        }
+
+    def to_arrays(self, features: Any) -> Dict[str, np.ndarray]:
+        """
+        Converts the preprocessed features of an instance or batch to named numeric
+        arrays so that they can be cached. By default features may be an array or a
+        mapping of names to arrays; a TypeError is raised if they cannot be converted.
+        """
+        if isinstance(features, Mapping):
+            items = features.items()
+        else:
+            items = [(FEATURES, features)]
+
+        arrays = {}
+        for name, value in items:
+            try:
+                arrays[name] = np.asarray(value)
+            except ValueError as e:
+                raise TypeError(f"cannot convert {name} to an array") from e
+
+            if arrays[name].dtype.hasobject:
+                raise TypeError(f"cannot cache {name} with non-numeric values")
+        return arrays
+
+    def from_arrays(self, arrays: Dict[str, np.ndarray]) -> Any:
+        """
+        Converts cached arrays back into features that can be passed to inference;
+        the inverse of ``to_arrays``.
+        """
+        if list(arrays.keys()) == [FEATURES]:
+            return arrays[FEATURES]
+        return dict(arrays)
@@ -0,0 +1,137 @@
+"""
+An on-disk cache of preprocessed features so that repeated runs skip decoding.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import threading
+import numpy as np
+
+from ..datasets.archive import ArchiveMember
+
+from typing import Any, Dict, List, Optional
+
+
+# Incremented if the layout of the cache changes to invalidate old entries
+CACHE_VERSION = 1
+
+# Files in each cache entry
+NAMES = "names.json"
+SHARD_EXT = ".npy"
+
+
+class FeatureCache(object):
+    """
+    Stores the preprocessed features of each batch of a benchmark as .npy shards so
+    that runs after the first only have to read the features into memory rather
+    than decoding and preprocessing each instance again. Entries are
+    keyed by the fingerprint of the benchmark (e.g. its processor configuration and
+    the signature of its dataset) and the instances in the batch, so a change to
+    either invalidates the entry.
+
+    Each entry is a directory containing one shard per named array in the features;
+    entries are written to a temporary directory and renamed into place so that a
+    partially written entry is never read.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(path, exist_ok=True)
+
+    def fingerprint(self, benchmark) -> str:
+        """
+        Returns the digest of the benchmark's fingerprint, which should be computed
+        once the benchmark has been setup (e.g. after its processor is loaded).
+        """
+        return digest({"version": CACHE_VERSION, **benchmark.fingerprint})
+
+    def key(self, fingerprint: str, batch: List[Any]) -> str:
+        """
+        Returns the key of the batch of instances for the benchmark fingerprint.
+        """
+        return digest({
+            "fingerprint": fingerprint,
+            "instances": [instance_key(instance) for instance in batch],
+        })
+
+    def entry(self, benchmark, key: str) -> str:
+        return os.path.join(self.path, benchmark.__class__.__name__, key)
+
+    def get(self, benchmark, key: str) -> Optional[Any]:
+        """
+        Returns the features of the entry or None if it is not cached. The shards
+        are read into memory rather than memory mapped so that the time to read them
+        from disk is measured as loading the cache rather than during inference.
+        """
+        path = self.entry(benchmark, key)
+        try:
+            with open(os.path.join(path, NAMES), "r") as f:
+                names = json.load(f)
+
+            arrays = {
+                name: np.load(os.path.join(path, f"{i}{SHARD_EXT}"))
+                for i, name in enumerate(names)
+            }
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return benchmark.from_arrays(arrays)
+
+    def put(self, benchmark, key: str, features: Any) -> bool:
+        """
+        Stores the features in the cache, returning False if the features could not
+        be converted to numeric arrays (in which case they are not cached).
+        """
+        try:
+            arrays = benchmark.to_arrays(features)
+        except TypeError:
+            return False
+
+        path = self.entry(benchmark, key)
+        if os.path.exists(path):
+            return True
+
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        os.makedirs(tmp, exist_ok=True)
+        try:
+            for i, array in enumerate(arrays.values()):
+                np.save(os.path.join(tmp, f"{i}{SHARD_EXT}"), array)
+
+            with open(os.path.join(tmp, NAMES), "w") as f:
+                json.dump(list(arrays.keys()), f)
+
+            os.replace(tmp, path)
+        except OSError:
+            # Another writer stored the entry first
+            shutil.rmtree(tmp, ignore_errors=True)
+            return os.path.exists(path)
+        return True
+
+    def clear(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def __repr__(self):
+        return f"<FeatureCache {self.path!r} hits={self.hits} misses={self.misses}>"
+
+
+def instance_key(instance: Any) -> str:
+    """
+    Identifies an instance: archive members by their name in the archive, files by
+    their path, and other instances (e.g. rows of JSON lines) by their content.
+    """
+    if isinstance(instance, ArchiveMember):
+        return instance.name
+    if isinstance(instance, (str, os.PathLike)):
+        return os.fspath(instance)
+    return json.dumps(instance, sort_keys=True, default=str)
+
+
+def digest(obj: Dict) -> str:
+    data = json.dumps(obj, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
@@ -1,8 +1,8 @@
 """
-Handles limiting the output of generators.
+Handles limiting and batching the output of generators.
 """
 
-from typing import Generator, Optional
+from typing import Generator, List, Optional
 
 
 def limit_generator(generator: Generator, limit: Optional[int] = None) -> Generator:
@@ -17,3 +17,22 @@ def limit_generator(generator: Generator, limit: Optional[int] = None) -> Genera
         if i >= limit:
             return
         yield item
+
+
+def batch_generator(generator: Generator, batch_size: int = 1) -> Generator[List, None, None]:
+    """
+    Group the output of a generator into lists of batch_size items; the last batch
+    will be smaller if the generator is exhausted before it is filled.
+    """
+    if batch_size < 1:
+        raise ValueError("batch size must be greater than zero")
+
+    batch = []
+    for item in generator:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
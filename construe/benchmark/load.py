@@ -0,0 +1,180 @@
+"""
+Open-loop load generation for measuring latency under an offered request rate.
+"""
+
+import time
+import queue
+import threading
+import dataclasses
+import numpy as np
+
+from .base import Benchmark
+
+from typing import Any, Callable, List, Optional
+
+
+# Arrival processes for the open-loop load generator
+POISSON = "poisson"
+CONSTANT = "constant"
+ARRIVALS = (POISSON, CONSTANT)
+
+
+def arrivals(
+    rate: float, n: int, distribution: str = POISSON, seed: Optional[int] = None
+) -> np.ndarray:
+    """
+    Returns the arrival offsets in seconds from the start of the run of n requests at
+    the given rate (requests per second). Poisson arrivals have exponentially
+    distributed inter-arrival times; constant arrivals are evenly spaced.
+    """
+    if rate <= 0:
+        raise ValueError("arrival rate must be greater than zero")
+
+    if distribution == CONSTANT:
+        return np.arange(n, dtype=np.float64) / rate
+
+    if distribution == POISSON:
+        rng = np.random.default_rng(seed)
+        gaps = rng.exponential(1.0 / rate, size=n)
+        gaps[0] = 0.0
+        return np.cumsum(gaps)
+
+    raise ValueError(f"unknown arrival distribution {distribution!r}")
+
+
+@dataclasses.dataclass(init=True, repr=False, eq=True)
+class LoadTimings:
+    """
+    The queue wait, service time and total latency in seconds of each request issued
+    at an offered rate along with the achieved throughput.
+    """
+
+    rate: float
+    wait: List[float] = dataclasses.field(default_factory=list)
+    service: List[float] = dataclasses.field(default_factory=list)
+    sizes: List[int] = dataclasses.field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def latency(self) -> List[float]:
+        return [w + s for w, s in zip(self.wait, self.service)]
+
+    @property
+    def throughput(self) -> Optional[float]:
+        if self.elapsed <= 0:
+            return None
+        return sum(self.sizes) / self.elapsed
+
+
+class LoadGenerator(object):
+    """
+    Issues requests to one or more benchmark replicas at a target arrival rate
+    regardless of whether previous requests have completed (an open loop). Requests
+    wait in a FIFO queue until a replica is available so that the queueing delay and
+    the service time (preprocessing and inference) can be measured separately.
+    """
+
+    def __init__(
+        self,
+        benchmarks: List[Benchmark],
+        preprocess: Callable[[Benchmark, List], Any],
+        inference: Callable[[Benchmark, Any], Any],
+        distribution: str = POISSON,
+        seed: Optional[int] = None,
+    ):
+        if not benchmarks:
+            raise ValueError("at least one benchmark replica is required")
+        if distribution not in ARRIVALS:
+            raise ValueError(f"unknown arrival distribution {distribution!r}")
+
+        self.benchmarks = benchmarks
+        self.preprocess = preprocess
+        self.inference = inference
+        self.distribution = distribution
+        self.seed = seed
+
+    def run(self, batches: List[List], rate: float, progress=None) -> LoadTimings:
+        """
+        Issues each batch as a request at the specified rate and returns the timings.
+        """
+        offsets = arrivals(rate, len(batches), self.distribution, self.seed)
+        timings = LoadTimings(rate=rate)
+
+        lock = threading.Lock()
+        errors = []
+        requests = queue.Queue()
+
+        def serve(benchmark: Benchmark):
+            while True:
+                request = requests.get()
+                if request is None:
+                    return
+
+                arrived, batch = request
+                if errors:
+                    continue
+
+                try:
+                    started = time.perf_counter()
+                    self.inference(benchmark, self.preprocess(benchmark, batch))
+                    finished = time.perf_counter()
+                except Exception as e:
+                    errors.append(e)
+                    continue
+
+                with lock:
+                    timings.wait.append(started - arrived)
+                    timings.service.append(finished - started)
+                    timings.sizes.append(len(batch))
+                    if progress is not None:
+                        progress.update(len(batch))
+
+        servers = [
+            threading.Thread(target=serve, args=(benchmark,), daemon=True)
+            for benchmark in self.benchmarks
+        ]
+        for server in servers:
+            server.start()
+
+        # Dispatch the requests at their arrival time (the arrival time is recorded
+        # as the scheduled time so that dispatch jitter is counted as queueing).
+        start = time.perf_counter()
+        for offset, batch in zip(offsets, batches):
+            arrival = start + offset
+            delay = arrival - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            requests.put((arrival, batch))
+
+        for _ in servers:
+            requests.put(None)
+        for server in servers:
+            server.join()
+        timings.elapsed = time.perf_counter() - start
+
+        if errors:
+            raise errors[0]
+        return timings
+
+
+def find_knee(rates: List[float], latencies: List[float]) -> Optional[float]:
+    """
+    Finds the knee of a latency vs. offered load curve: the rate after which latency
+    starts to increase sharply. Both axes are normalized to [0, 1] and the knee is
+    the rate where the curve is furthest below the line connecting its endpoints
+    (the Kneedle method for convex increasing curves). Returns None if there are
+    fewer than three rates or the latency does not increase.
+    """
+    if len(rates) < 3:
+        return None
+
+    order = np.argsort(rates)
+    x = np.asarray(rates, dtype=np.float64)[order]
+    y = np.asarray(latencies, dtype=np.float64)[order]
+
+    if x[-1] == x[0] or y.max() == y.min():
+        return None
+
+    xn = (x - x[0]) / (x[-1] - x[0])
+    yn = (y - y.min()) / (y.max() - y.min())
+    return x[np.argmax(xn - yn)].item()
@@ -0,0 +1,210 @@
+"""
+Samples process memory usage while a benchmark is executing.
+"""
+
+import os
+import sys
+import threading
+import tracemalloc
+import dataclasses
+
+from typing import Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    # The resource module is only available on Unix
+    resource = None
+
+
+# Default interval in seconds between memory samples by the background thread; the
+# sampling thread competes with the benchmark for the GIL so sampling more often
+# inflates the latencies that are being measured.
+SAMPLE_INTERVAL = 0.01
+
+# ru_maxrss is reported in kilobytes on Linux but in bytes on macOS.
+_MAXRSS_SCALE = 1 if sys.platform == "darwin" else 1024
+
+
+def current_rss() -> Optional[int]:
+    """
+    Returns the resident set size of the current process in bytes or None if it
+    cannot be determined on this platform. On Linux /proc is read directly to keep
+    the sampling overhead low, otherwise psutil is used if it is installed.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    return None
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Returns the high-water mark of the resident set size of the process in bytes or
+    None if it cannot be determined on this platform. On platforms without the
+    resource module (e.g. Windows) the peak working set reported by psutil is used
+    if it is installed.
+    """
+    if resource is not None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_SCALE
+
+    if psutil is not None:
+        return getattr(psutil.Process().memory_info(), "peak_wset", None)
+    return None
+
+
+def device_allocated() -> Optional[int]:
+    """
+    Returns the number of bytes allocated by the torch accelerator allocator if torch
+    has already been imported and an accelerator is in use, otherwise None. TFLite
+    allocates its tensor arena on the heap so it is captured by the RSS samples.
+    """
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return None
+
+    if torch.cuda.is_available() and torch.cuda.is_initialized():
+        return torch.cuda.max_memory_allocated()
+
+    if hasattr(torch, "mps") and torch.backends.mps.is_available():
+        return torch.mps.current_allocated_memory()
+    return None
+
+
+def reset_device_peak():
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available() and torch.cuda.is_initialized():
+        torch.cuda.reset_peak_memory_stats()
+
+
+class MemoryTracker(object):
+    """
+    Tracks the peak memory usage of the process during a stage of a benchmark. A
+    background thread samples the RSS at the specified interval so that transient
+    allocations that are freed before the stage ends are still captured; the RSS is
+    also sampled at the start and end of each stage so that stages shorter than the
+    interval are measured. If trace_heap is True, the peak size of the Python heap is
+    also tracked using tracemalloc (note that this adds overhead to timings).
+
+    Usage::
+
+        with MemoryTracker() as tracker:
+            tracker.reset()
+            do_work()
+            usage = tracker.usage()
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL, trace_heap: bool = False):
+        self.interval = interval
+        self.trace_heap = trace_heap
+
+        self._peak = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._started_tracemalloc = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """
+        Starts the background sampling thread and tracemalloc if required.
+        """
+        if self.is_running:
+            return
+
+        if self.trace_heap and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background sampling thread and tracemalloc if it was started by
+        this tracker.
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def reset(self):
+        """
+        Marks the start of a new stage, resetting all peak measurements.
+        """
+        with self._lock:
+            self._peak = current_rss() or 0
+
+        if self.trace_heap and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        reset_device_peak()
+
+    def usage(self) -> "MemoryUsage":
+        """
+        Returns the memory usage observed since the last call to reset.
+        """
+        rss = current_rss()
+        with self._lock:
+            if rss is not None:
+                self._peak = max(self._peak, rss)
+            peak = self._peak
+
+        heap = None
+        if self.trace_heap and tracemalloc.is_tracing():
+            heap = tracemalloc.get_traced_memory()[1]
+
+        return MemoryUsage(
+            rss=rss,
+            peak=peak if rss is not None else None,
+            heap=heap,
+            device=device_allocated(),
+        )
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            rss = current_rss()
+            if rss is None:
+                return
+
+            with self._lock:
+                if rss > self._peak:
+                    self._peak = rss
+
+
+@dataclasses.dataclass(init=True, repr=True, eq=True)
+class MemoryUsage:
+    """
+    The memory observed during a single stage of a benchmark in bytes; fields are
+    None if the measurement is not available on the platform.
+    """
+
+    rss: Optional[int] = None
+    peak: Optional[int] = None
+    heap: Optional[int] = None
+    device: Optional[int] = None
@@ -0,0 +1,133 @@
+"""
+Pipelined preprocessing that prefetches instances ahead of inference.
+"""
+
+import time
+import queue
+import threading
+
+from .timer import Timer, Timing
+
+from typing import Any, Callable, Iterable, List, Tuple
+
+
+# Sentinel put on the queue by each worker when there are no more batches
+_DONE = object()
+
+
+class Prefetcher(object):
+    """
+    Runs preprocessing in a bounded pool of background threads so that reading and
+    decoding instances overlaps with inference in the main thread. Iterating over the
+    prefetcher yields (features, size, timing) tuples for each preprocessed batch in
+    completion order (which may differ from the dataset order if workers > 1).
+
+    The queue depth bounds how many preprocessed batches can be buffered ahead of
+    inference. While iterating, the prefetcher records how long the consumer stalled
+    waiting for a preprocessed batch and the queue depth when each batch was taken.
+
+    Threads are used rather than processes since the benchmark models and processors
+    generally cannot be pickled; file reads, audio decoding, and TensorFlow and NumPy
+    operations release the GIL so they still overlap with inference.
+    """
+
+    def __init__(
+        self,
+        batches: Iterable[List],
+        preprocess: Callable[[List], Any],
+        depth: int = 2,
+        workers: int = 1,
+    ):
+        if depth < 1:
+            raise ValueError("prefetch queue depth must be greater than zero")
+        if workers < 1:
+            raise ValueError("number of prefetch workers must be greater than zero")
+
+        self.batches = iter(batches)
+        self.preprocess = preprocess
+        self.depth = depth
+        self.workers = workers
+
+        self.stalls: List[float] = []
+        self.depths: List[int] = []
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._queue = queue.Queue(maxsize=depth)
+        self._threads = []
+
+    def __iter__(self) -> Iterable[Tuple[Any, int, Timing]]:
+        self._threads = [
+            threading.Thread(target=self._work, daemon=True)
+            for _ in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+        try:
+            done = 0
+            while done < self.workers:
+                depth = self._queue.qsize()
+                started = time.perf_counter()
+                item = self._queue.get()
+                stall = time.perf_counter() - started
+
+                if item is _DONE:
+                    done += 1
+                    continue
+
+                if isinstance(item, BaseException):
+                    raise item
+
+                self.stalls.append(stall)
+                self.depths.append(depth)
+                yield item
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Stops the workers, discarding any prefetched batches that were not consumed.
+        """
+        self._stop.set()
+        while any(thread.is_alive() for thread in self._threads):
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                time.sleep(0.001)
+
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _next(self):
+        # Dataset generators are not thread-safe so access must be serialized
+        with self._lock:
+            return next(self.batches, _DONE)
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _work(self):
+        try:
+            while not self._stop.is_set():
+                batch = self._next()
+                if batch is _DONE:
+                    break
+
+                with Timer() as timer:
+                    features = self.preprocess(batch)
+
+                if not self._put((features, len(batch), timer.timing)):
+                    return
+        except Exception as e:
+            self._put(e)
+            return
+
+        self._put(_DONE)
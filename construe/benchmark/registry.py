@@ -0,0 +1,179 @@
+"""
+A registry of the benchmarks that imports each benchmark only when it is used.
+
+Benchmarks are registered in three ways: the benchmarks that ship with construe are
+registered by the path to their class; other packages can expose benchmarks using
+the ``construe.benchmarks`` entry point group, e.g. in ``setup.py``::
+
+    entry_points={
+        "construe.benchmarks": ["mymodel = mypackage.benchmarks:MyModel"],
+    }
+
+and benchmarks defined in a script or notebook can be registered with the
+``register`` decorator. Registered benchmarks are run by ``construe run`` (and can
+be selected with ``--include`` and ``--exclude``) and each has its own command.
+"""
+
+import importlib
+import dataclasses
+
+from .base import Benchmark
+from ..exceptions import BenchmarkError
+
+from functools import lru_cache
+from importlib.metadata import entry_points, EntryPoint
+from typing import Callable, Dict, Optional, Type, Union
+
+
+# Entry point group that other packages use to register benchmarks
+ENTRY_POINTS = "construe.benchmarks"
+
+
+@dataclasses.dataclass(init=True, repr=False, eq=True)
+class Entry:
+    """
+    A registered benchmark; the target is the path to the benchmark class (in the
+    form "module:Class"), an entry point, or the class itself, and is only imported
+    when the benchmark is loaded. Benchmarks that are not default are only run by
+    ``construe run`` if they are explicitly included.
+    """
+
+    name: str
+    target: Union[str, EntryPoint, Type[Benchmark]]
+    help: Optional[str] = None
+    default: bool = True
+
+    def load(self) -> Type[Benchmark]:
+        if isinstance(self.target, str):
+            module, attr = self.target.split(":")
+            cls = getattr(importlib.import_module(module), attr)
+        elif isinstance(self.target, EntryPoint):
+            cls = self.target.load()
+        else:
+            cls = self.target
+
+        if not isinstance(cls, type) or not issubclass(cls, Benchmark):
+            raise BenchmarkError(f"benchmark {self.name!r} is not a Benchmark subclass")
+        return cls
+
+    def __repr__(self):
+        return f"<Entry {self.name!r}>"
+
+
+# The benchmarks that ship with construe; the benchmarks whose models are not yet
+# implemented are only run when they are explicitly included.
+BENCHMARKS = {
+    entry.name: entry
+    for entry in (
+        Entry(
+            "moondream", "construe.moondream:MoonDream",
+            "Executes image-to-text inferencing benchmarks.", False,
+        ),
+        Entry(
+            "whisper", "construe.whisper:Whisper",
+            "Executes audio-to-text inferencing benchmarks.",
+        ),
+        Entry(
+            "mobilenet", "construe.mobilenet:MobileNet",
+            "Executes image classification inferencing benchmarks.", False,
+        ),
+        Entry(
+            "mobilevit", "construe.mobilevit:MobileViT",
+            "Executes object detection inferencing benchmarks.", False,
+        ),
+        Entry(
+            "nsfw", "construe.nsfw:NSFW",
+            "Executes NSFW image classification inferencing benchmarks.", False,
+        ),
+        Entry(
+            "lowlight", "construe.lowlight:LowLight",
+            "Executes lowlight image enhancement inferencing benchmarks.",
+        ),
+        Entry(
+            "offensive", "construe.offensive:Offensive",
+            "Executes offensive speech text classification inferencing benchmarks.",
+            False,
+        ),
+        Entry(
+            "gliner", "construe.gliner:GLiNER",
+            "Executes GLiNER named entity discovery inferencing benchmarks.", False,
+        ),
+    )
+}
+
+# Benchmarks registered with the decorator
+_registered: Dict[str, Entry] = {}
+
+
+def register(
+    cls: Optional[Type[Benchmark]] = None,
+    name: Optional[str] = None,
+    help: Optional[str] = None,
+    default: bool = True,
+) -> Union[Type[Benchmark], Callable]:
+    """
+    Class decorator that registers a Benchmark subclass so that it is run by
+    ``construe run``. The name defaults to the lowercase class name and the help to
+    the first line of the class docstring. Can be used with or without arguments::
+
+        @register
+        class MyModel(Benchmark): ...
+
+        @register(name="prod", default=False)
+        class ProductionModel(Benchmark): ...
+    """
+    def decorator(cls):
+        if not isinstance(cls, type) or not issubclass(cls, Benchmark):
+            raise BenchmarkError("only Benchmark subclasses can be registered")
+
+        key = _normalize(name or cls.__name__)
+        doc = (cls.__doc__ or "").strip().splitlines()
+        _registered[key] = Entry(key, cls, help or (doc[0] if doc else None), default)
+        return cls
+
+    if cls is not None:
+        return decorator(cls)
+    return decorator
+
+
+def unregister(name: str):
+    """
+    Removes a benchmark registered with the decorator.
+    """
+    _registered.pop(_normalize(name), None)
+
+
+def registered() -> Dict[str, Entry]:
+    """
+    Returns all registered benchmarks by name without importing them. Benchmarks
+    registered with the decorator take precedence over entry points, which take
+    precedence over the benchmarks that ship with construe.
+    """
+    benchmarks = dict(BENCHMARKS)
+    benchmarks.update(_entry_points())
+    benchmarks.update(_registered)
+    return benchmarks
+
+
+def load_benchmark(name: str) -> Type[Benchmark]:
+    """
+    Imports and returns the benchmark class registered with the specified name.
+    """
+    try:
+        entry = registered()[_normalize(name)]
+    except KeyError:
+        raise BenchmarkError(f"no benchmark named {name!r} is registered")
+    return entry.load()
+
+
+@lru_cache(maxsize=None)
+def _entry_points() -> Dict[str, Entry]:
+    # Reading the entry points only reads package metadata, nothing is imported
+    return {
+        _normalize(ep.name): Entry(_normalize(ep.name), ep)
+        for ep in entry_points(group=ENTRY_POINTS)
+    }
+
+
+def _normalize(name: str) -> str:
+    return name.strip().lower()
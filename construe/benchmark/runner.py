@@ -3,16 +3,32 @@ Benchmark ABC and global benchmark runner.
 """
 
 import time
+import tempfile
 import dataclasses
+import numpy as np
 
 from .base import Benchmark
+from .cache import FeatureCache
+from .limit import batch_generator
+from .pipeline import Prefetcher
+from .load import LoadGenerator, LoadTimings, POISSON, find_knee
+from .workers import WorkerPool, WorkerTimings, BASELINE_LIMIT
+from .workers import throughput, scaling_efficiency
+from .timer import Timer, Timing
+from .memory import MemoryTracker, peak_rss
+from .samples import Samples, StageSamples, MemorySamples
+from .warmup import AUTO, WARMUP_MAX, resolve_warmup, is_steady
 from ..utils import humanize_duration
-from ..metrics import Metric, Measurement, dump
+from ..models.options import InterpreterOptions, AUTO as AUTO_RESOLVER
+from ..version import get_version
+from ..metrics import Metric, Measurement, Sketch, dump, dump_binary
+from ..metrics import BINARY_EXT, Checkpoint
 from ..exceptions import ConstrueError, BenchmarkError
 
 from tqdm import tqdm
+from functools import partial
 from datetime import datetime, timezone
-from typing import Iterable, List, Dict, Optional, Type
+from typing import Any, Iterable, List, Dict, Optional, Tuple, Type, Union
 
 
 DATEFMT = "%Y-%m-%dT%H:%M:%S.%fZ"
@@ -34,8 +50,29 @@ class BenchmarkRunner(object):
         data_home: str = None,
         model_home: str = None,
         use_sample: bool = True,
+        extract: bool = True,
         cleanup: bool = True,
         verbose: bool = True,
+        memory: bool = False,
+        trace_heap: bool = False,
+        warmup: Union[int, str] = 0,
+        batch_size: int = 1,
+        prefetch: int = 0,
+        prefetch_workers: int = 1,
+        concurrency: int = 1,
+        baseline_limit: Optional[int] = BASELINE_LIMIT,
+        rates: Optional[List[float]] = None,
+        arrival: str = POISSON,
+        keep_samples: bool = True,
+        checkpoint: Optional[str] = None,
+        resume: bool = False,
+        cache: Optional[str] = None,
+        preprocess_once: bool = False,
+        num_threads: Optional[int] = None,
+        xnnpack: bool = True,
+        op_resolver: str = AUTO_RESOLVER,
+        threads: Optional[List[int]] = None,
+        verify: Optional[bool] = None,
     ):
         self.env = env
         self.device = device
@@ -46,11 +83,82 @@ class BenchmarkRunner(object):
             "model_home": model_home,
             "use_sample": use_sample,
             "progress": verbose,
+            "batch_size": batch_size,
+            "extract": extract,
+            "num_threads": num_threads,
+            "xnnpack": xnnpack,
+            "op_resolver": op_resolver,
+            "verify": verify,
         }
         self.cleanup = cleanup
         self.verbose = verbose
+        self.memory = memory or trace_heap
+        self.trace_heap = trace_heap
+        self.warmup = resolve_warmup(warmup)
+        self.batch_size = batch_size
+        self.prefetch = prefetch
+        self.prefetch_workers = prefetch_workers
+        self.concurrency = concurrency
+        self.baseline_limit = baseline_limit
+        self.rates = sorted(rates) if rates else None
+        self.arrival = arrival
+        self.keep_samples = keep_samples
+        self.checkpoint = checkpoint
+        self.resume = resume
+        self.cache = cache
+        self.preprocess_once = preprocess_once
+        self.threads = sorted(set(threads)) if threads else None
         self.benchmarks = benchmarks
 
+        if self.batch_size < 1:
+            raise BenchmarkError("batch size must be greater than zero")
+
+        if self.prefetch < 0 or self.prefetch_workers < 1:
+            raise BenchmarkError(
+                "prefetch depth must be non-negative and requires at least one worker"
+            )
+
+        if self.concurrency < 1:
+            raise BenchmarkError("concurrency must be greater than zero")
+
+        if self.baseline_limit is not None and self.baseline_limit < 0:
+            raise BenchmarkError("baseline limit must be non-negative")
+
+        if self.concurrency > 1 and self.prefetch:
+            raise BenchmarkError("cannot prefetch when running concurrent workers")
+
+        if self.rates and self.prefetch:
+            raise BenchmarkError("cannot prefetch when generating open-loop load")
+
+        if self.rates and any(rate <= 0 for rate in self.rates):
+            raise BenchmarkError("request rates must be greater than zero")
+
+        if self.resume and not self.checkpoint:
+            raise BenchmarkError("a checkpoint path is required to resume")
+
+        if (self.cache or self.preprocess_once) and (
+            self.prefetch or self.concurrency > 1 or self.rates
+        ):
+            raise BenchmarkError(
+                "cannot cache preprocessed features when prefetching, running "
+                "concurrent workers, or generating open-loop load"
+            )
+
+        if self.threads and (num_threads is not None or any(n < 1 for n in self.threads)):
+            raise BenchmarkError(
+                "thread counts to sweep must be at least one and cannot be combined "
+                "with a fixed number of threads"
+            )
+
+        if self.threads and (self.concurrency > 1 or self.rates):
+            raise BenchmarkError(
+                "cannot sweep threads when running concurrent workers or generating "
+                "open-loop load"
+            )
+
+        # Validate the interpreter options before any benchmarks are run
+        InterpreterOptions(num_threads, xnnpack, op_resolver)
+
         for b in self.benchmarks:
             if not issubclass(b, Benchmark):
                 raise BenchmarkError(f"{b.__name__} is not a Benchmark")
@@ -67,21 +175,68 @@ class BenchmarkRunner(object):
             started=datetime.now(timezone.utc).strftime(DATEFMT),
             env=self.env,
             device=self.device,
+            version=get_version(),
             options=self.benchmark_kwargs,
+            memory=self.memory,
+            warmup=self.warmup,
+            concurrency=self.concurrency,
+            baseline_limit=self.baseline_limit if self.concurrency > 1 else None,
+            rates=self.rates,
+            arrival=self.arrival if self.rates else None,
+            threads=self.threads,
+            keep_samples=self.keep_samples,
+            cache=self.cache,
+            preprocess_once=self.preprocess_once,
             errors=[],
         )
 
         self.run_complete_ = False
         self.measurements_ = []
+        self.checkpoint_ = None
+        self.cache_ = None
+        self.baselines_ = {}
+
+        # If preprocessing once without a cache directory, a temporary cache is used
+        # for the duration of the run so that only the first run preprocesses.
+        if self.cache:
+            self.cache_ = FeatureCache(self.cache)
+        elif self.preprocess_once:
+            self.cache_ = FeatureCache(tempfile.mkdtemp(prefix="construe-cache-"))
 
-        started = time.time()
+        completed = set()
+        if self.checkpoint:
+            self.checkpoint_ = Checkpoint(
+                self.checkpoint, resume=self.resume, config=self.checkpoint_config()
+            ).open()
+            completed = self.checkpoint_.completed
+            self.measurements_.extend(self.checkpoint_.measurements)
+            self.results_.successes += len(self.measurements_)
 
-        for cls in self.benchmarks:
-            total = self.limit or cls.total(**self.benchmark_kwargs)
-            for i in range(self.n_runs):
-                self.run_benchmark(i, total, cls)
+        started = time.perf_counter()
 
-        self.results_.duration = time.time() - started
+        try:
+            for cls in self.benchmarks:
+                total = self.limit or cls.total(**self.benchmark_kwargs)
+                if self.rates:
+                    total *= len(self.rates)
+                if self.threads:
+                    total *= len(self.threads)
+                for i in range(self.n_runs):
+                    if (cls.__name__, i) in completed:
+                        if self.verbose:
+                            print(f"skipping {cls.__name__} run {i+1}: completed in checkpoint")
+                        continue
+                    self.run_benchmark(i, total, cls)
+        finally:
+            if self.checkpoint_ is not None:
+                self.checkpoint_.close()
+
+            if self.cache_ is not None and not self.cache:
+                self.cache_.clear()
+
+        self.results_.duration = time.perf_counter() - started
+        if self.memory:
+            self.results_.peak_memory = peak_rss()
         self.results_.measurements = Measurement.merge(self.measurements_)
         self.run_complete_ = True
 
@@ -90,67 +245,561 @@ class BenchmarkRunner(object):
             if self.cleanup:
                 print("cleaned up data and model caches: all downloaded data removed")
 
+    def checkpoint_config(self) -> Dict[str, Any]:
+        """
+        The options that affect the measurements of a run, which must match for the
+        runs of a checkpoint to be resumed. Options that do not change what is
+        measured (e.g. the data and model directories, verbosity, and the number of
+        runs) are excluded.
+        """
+        options = {
+            key: value for key, value in self.benchmark_kwargs.items()
+            if key not in {"data_home", "model_home", "progress", "verify"}
+        }
+        return {
+            "options": options,
+            "device": self.device,
+            "env": self.env,
+            "limit": self.limit,
+            "memory": self.memory,
+            "trace_heap": self.trace_heap,
+            "warmup": self.warmup,
+            "batch_size": self.batch_size,
+            "prefetch": self.prefetch,
+            "prefetch_workers": self.prefetch_workers,
+            "concurrency": self.concurrency,
+            "baseline_limit": self.baseline_limit,
+            "rates": self.rates,
+            "arrival": self.arrival,
+            "threads": self.threads,
+            "keep_samples": self.keep_samples,
+            "preprocess_once": self.preprocess_once,
+            "cache": self.cache is not None,
+        }
+
     def run_benchmark(self, idx: int, total: int, Runner: Type):
         # TODO: do we need to pass separate metadata to the kwargs?
         progress = tqdm(total=total, desc=f"Running {Runner.__name__} Benchmark {idx+1}", leave=False)
-        benchmark = Runner(**self.benchmark_kwargs)
+        if self.threads:
+            measurements = self.execute_threads(idx, Runner, progress)
+        elif self.rates:
+            measurements = self.execute_load(idx, Runner, progress)
+        elif self.concurrency > 1:
+            measurements = self.execute_concurrent(idx, Runner, progress)
+        else:
+            measurements = self.execute(idx, Runner(**self.benchmark_kwargs), progress)
 
+        completed, errors = [], []
         try:
-            for measurement in self.execute(idx, benchmark, progress):
+            for measurement in measurements:
+                completed.append(measurement)
                 self.measurements_.append(measurement)
                 self.results_.successes += 1
         except ConstrueError as e:
+            errors.append(str(e))
             self.results_.failures += 1
             self.results_.errors.append(str(e))
 
-    def execute(self, idx: int, benchmark: Benchmark, progress: tqdm) -> Iterable[Measurement]:
+        # Stream the measurements of the run to disk as soon as it is complete
+        if self.checkpoint_ is not None:
+            self.checkpoint_.write(Runner.__name__, idx, completed, errors)
+
+    def execute(
+        self, idx: int, benchmark: Benchmark, progress: tqdm, last: bool = True
+    ) -> Iterable[Measurement]:
         # Setup the benchmark
         benchmark.before()
 
-        ptimes = []  # preproccess times
-        itimes = []  # inference times
+        # Samples are added to sketches as they are produced if not keeping samples
+        keep, batched = self.keep_samples, self.batch_size > 1
+        wtimes = []                              # warmup inference times
+        ptimes = StageSamples(keep, batched)     # preproccess timings
+        itimes = StageSamples(keep, batched)     # inference timings
+        ctimes = Samples(keep)                   # cache load times per instance
+        pmem = MemorySamples(keep)               # preprocess memory usage
+        imem = MemorySamples(keep)               # inference memory usage
 
+        tracker = None
+        pipeline = None
         try:
-            # Time each inference
-            # TODO: measure memory usage during inferencing
-            for instance in benchmark.instances(limit=self.limit):
-                t1 = time.time()
-                features = benchmark.preprocess(instance)
-                t2 = time.time()
-                benchmark.inference(features)
-                t3 = time.time()
-
-                ptimes.append(t2 - t1)
-                itimes.append(t3 - t2)
-                progress.update(1)
+            # Warmup the benchmark so that lazy initialization is not measured
+            wtimes = self.run_warmup(benchmark)
+
+            if self.memory:
+                tracker = MemoryTracker(trace_heap=self.trace_heap)
+                tracker.start()
+
+            # If prefetching, preprocessing is run in the background ahead of inference
+            # and memory usage cannot be attributed to the preprocessing stage.
+            if self.prefetch:
+                preprocess = partial(self.preprocess, benchmark)
+                batches = self.batches(benchmark, limit=self.limit)
+                pipeline = Prefetcher(
+                    batches, preprocess, self.prefetch, self.prefetch_workers
+                )
+                stream = (item + (False,) for item in pipeline)
+            else:
+                stream = self.preprocessed(benchmark, tracker, pmem)
+
+            # Time each inference and track peak memory usage for each stage
+            started = time.perf_counter()
+            for features, size, timing, cached in stream:
+                padded = benchmark.padded(size)
+                if cached:
+                    if not padded:
+                        ctimes.add(timing.wall / size)
+                else:
+                    ptimes.add(timing, size, padded)
+
+                if tracker:
+                    tracker.reset()
+
+                with Timer() as timer:
+                    self.inference(benchmark, features)
+                itimes.add(timer.timing, size, padded)
+
+                if tracker:
+                    imem.add(tracker.usage())
+
+                progress.update(size)
+            elapsed = time.perf_counter() - started
         finally:
+            if pipeline:
+                pipeline.close()
+
+            if tracker:
+                tracker.stop()
+
             # Ensure benchmark is cleaned up despite any errors if this is the last
             # run of the benchmark and cleanup is specified (otherwise leave cache).
-            cleanup = self.cleanup and idx == self.n_runs - 1
+            cleanup = self.cleanup and idx == self.n_runs - 1 and last
             benchmark.after(cleanup=cleanup)
 
-        # Create the process times measurement
-        yield Measurement(
-            per_run=1,
-            raw_metrics=ptimes,
-            units="s",
-            metric=Metric(
-                label=benchmark.__class__.__name__,
-                sub_label="preprocessing",
-                description=benchmark.description,
-                device=self.device,
-                env=self.env,
-            ),
+        # Create the warmup times measurement if a warmup was performed
+        if wtimes:
+            yield self.measurement(benchmark, "warmup", wtimes, "s")
+
+        # Create the preprocess and inference wall clock and CPU times measurements;
+        # if all features were loaded from the cache then nothing was preprocessed.
+        if ptimes.instances or not len(ctimes):
+            yield from self.timing_measurements(benchmark, "preprocessing", ptimes)
+        yield from self.timing_measurements(benchmark, "inferencing", itimes)
+
+        if len(ctimes):
+            yield self.measurement(benchmark, "cache-load", ctimes, "s")
+
+        # Create the memory measurements for each stage
+        for stage, usage in (("preprocessing", pmem), ("inferencing", imem)):
+            yield from self.memory_measurements(benchmark, stage, usage)
+
+        # Create the pipeline measurements if preprocessing was prefetched
+        if pipeline is not None:
+            yield from self.pipeline_measurements(
+                benchmark, pipeline, ptimes, itimes, elapsed
+            )
+
+    def execute_threads(
+        self, idx: int, Runner: Type, progress: tqdm
+    ) -> Iterable[Measurement]:
+        """
+        Runs the benchmark with its interpreter configured to use each of the thread
+        counts in turn. The measurements of each thread count are prefixed with the
+        thread count, e.g. threads-4-inferencing.
+        """
+        for i, n_threads in enumerate(self.threads):
+            kwargs = {**self.benchmark_kwargs, "num_threads": n_threads}
+            last = i == len(self.threads) - 1
+
+            for measurement in self.execute(idx, Runner(**kwargs), progress, last):
+                measurement.metric = dataclasses.replace(
+                    measurement.metric,
+                    sub_label=f"threads-{n_threads}-{measurement.metric.sub_label}",
+                )
+                yield measurement
+
+    def execute_concurrent(
+        self, idx: int, Runner: Type, progress: tqdm
+    ) -> Iterable[Measurement]:
+        """
+        Creates a replica of the benchmark (each with its own model interpreter) for
+        each concurrent worker and drives them from a shared queue of instances. A
+        single worker pass over at most baseline_limit instances is run first as the
+        baseline so that the scaling efficiency of the concurrent workers can be
+        computed; the baseline is only computed in the first run of the benchmark
+        and is reused by later runs. Memory is not tracked per stage since the
+        stages of the workers overlap.
+        """
+        replicas = [Runner(**self.benchmark_kwargs) for _ in range(self.concurrency)]
+        prepared = []
+
+        name = Runner.__name__
+        n_baseline = 0
+        if name not in self.baselines_:
+            n_baseline = self.baseline_size(Runner)
+            progress.total += n_baseline
+            progress.refresh()
+
+        wtimes = []  # warmup inference times for all replicas
+        try:
+            # Setup and warmup each replica
+            for replica in replicas:
+                replica.before()
+                prepared.append(replica)
+                wtimes.extend(self.run_warmup(replica))
+
+            primary = replicas[0]
+            if name not in self.baselines_:
+                baseline = None
+                if n_baseline > 0:
+                    pool = WorkerPool(replicas[:1], self.preprocess, self.inference)
+                    timings = pool.run(self.batches(primary, limit=n_baseline), progress)
+                    baseline = throughput(timings, pool.elapsed_)
+                self.baselines_[name] = baseline
+            baseline = self.baselines_[name]
+
+            pool = WorkerPool(replicas, self.preprocess, self.inference)
+            timings = pool.run(self.batches(primary, limit=self.limit), progress)
+        finally:
+            # Only the primary replica cleans up the cached datasets and models and
+            # it does so last so the other replicas can cleanup without errors.
+            cleanup = self.cleanup and idx == self.n_runs - 1
+            for i, replica in reversed(list(enumerate(prepared))):
+                replica.after(cleanup=cleanup and i == 0)
+
+        if wtimes:
+            yield self.measurement(primary, "warmup", wtimes, "s")
+
+        yield from self.concurrent_measurements(primary, timings, pool.elapsed_, baseline)
+
+    def execute_load(
+        self, idx: int, Runner: Type, progress: tqdm
+    ) -> Iterable[Measurement]:
+        """
+        Issues the instances of the benchmark as requests at each of the offered rates
+        in an open loop, serving them with one replica per concurrent worker. The
+        queue wait, service time, and total latency of requests are measured at each
+        rate along with the achieved throughput, and the knee of the p99 latency vs.
+        offered load curve is identified.
+        """
+        replicas = [Runner(**self.benchmark_kwargs) for _ in range(self.concurrency)]
+        prepared = []
+
+        wtimes = []  # warmup inference times for all replicas
+        sweep = []   # load timings for each rate
+        try:
+            for replica in replicas:
+                replica.before()
+                prepared.append(replica)
+                wtimes.extend(self.run_warmup(replica))
+
+            primary = replicas[0]
+            batches = list(self.batches(primary, limit=self.limit))
+            generator = LoadGenerator(
+                replicas, self.preprocess, self.inference, distribution=self.arrival,
+            )
+
+            for rate in self.rates:
+                sweep.append(generator.run(batches, rate, progress))
+        finally:
+            cleanup = self.cleanup and idx == self.n_runs - 1
+            for i, replica in reversed(list(enumerate(prepared))):
+                replica.after(cleanup=cleanup and i == 0)
+
+        if wtimes:
+            yield self.measurement(primary, "warmup", wtimes, "s")
+
+        yield from self.load_measurements(primary, sweep)
+
+    def baseline_size(self, Runner: Type) -> int:
+        """
+        Returns the number of instances in the single worker baseline pass.
+        """
+        limits = [n for n in (self.limit, self.baseline_limit) if n is not None]
+        if not limits:
+            return Runner.total(**self.benchmark_kwargs)
+        return min(limits)
+
+    def run_warmup(self, benchmark: Benchmark) -> List[float]:
+        """
+        Runs instances through the benchmark without measuring them for either the
+        fixed number of warmup instances or, if the warmup is AUTO, until the rolling
+        median inference latency stabilizes. Instances are cycled if the dataset has
+        fewer instances than required. Returns the warmup inference times amortized
+        per instance (like the inferencing latency) for each batch that is not padded.
+        """
+        if not self.warmup:
+            return []
+
+        auto = self.warmup == AUTO
+        n_warmup = WARMUP_MAX if auto else self.warmup
+
+        wtimes = []
+        completed = 0
+        while completed < n_warmup:
+            count = completed
+            for batch in self.batches(benchmark, limit=n_warmup - count):
+                features = self.preprocess(benchmark, batch)
+
+                with Timer() as timer:
+                    self.inference(benchmark, features)
+                completed += len(batch)
+
+                if benchmark.padded(len(batch)):
+                    continue
+                wtimes.append(timer.timing.wall / len(batch))
+
+                if auto and is_steady(wtimes):
+                    return wtimes
+
+            # Prevent an infinite loop if the benchmark has no instances
+            if completed == count:
+                break
+
+        return wtimes
+
+    def preprocessed(
+        self, benchmark: Benchmark, tracker: MemoryTracker, usage: MemorySamples
+    ) -> Iterable[Tuple[Any, int, Timing, bool]]:
+        """
+        Serially preprocesses each batch of the benchmark, yielding the features, the
+        number of instances in the batch, the preprocessing timing and whether the
+        features were loaded from the cache rather than preprocessed; if a memory
+        tracker is specified the memory usage of each preprocess is added to usage.
+        Features that are preprocessed are stored in the cache (if any) after they
+        have been measured.
+        """
+        fingerprint = None
+        if self.cache_ is not None:
+            fingerprint = self.cache_.fingerprint(benchmark)
+
+        for batch in self.batches(benchmark, limit=self.limit):
+            key = None
+            if self.cache_ is not None:
+                key = self.cache_.key(fingerprint, batch)
+                with Timer() as timer:
+                    features = self.cache_.get(benchmark, key)
+
+                if features is not None:
+                    yield features, len(batch), timer.timing, True
+                    continue
+
+            if tracker:
+                tracker.reset()
+
+            with Timer() as timer:
+                features = self.preprocess(benchmark, batch)
+
+            if tracker:
+                usage.add(tracker.usage())
+
+            if key is not None:
+                self.cache_.put(benchmark, key, features)
+
+            yield features, len(batch), timer.timing, False
+
+    def batches(self, benchmark: Benchmark, limit: int = None) -> Iterable[List]:
+        """
+        Groups the instances of the benchmark into batches of the batch size.
+        """
+        return batch_generator(benchmark.instances(limit=limit), self.batch_size)
+
+    def preprocess(self, benchmark: Benchmark, batch: List) -> Any:
+        if self.batch_size == 1:
+            return benchmark.preprocess(batch[0])
+        return benchmark.preprocess_batch(batch)
+
+    def inference(self, benchmark: Benchmark, features: Any) -> Any:
+        if self.batch_size == 1:
+            return benchmark.inference(features)
+        return benchmark.inference_batch(features)
+
+    def timing_measurements(
+        self, benchmark: Benchmark, stage: str, samples: StageSamples
+    ) -> Iterable[Measurement]:
+        """
+        Creates the wall clock latency, process CPU time, and thread CPU time
+        measurements for a stage, amortized per instance. If the runner is batching,
+        the per-batch latency is also reported, and for inferencing the throughput in
+        instances per second.
+        """
+        yield self.measurement(benchmark, stage, samples.wall, "s")
+        yield self.measurement(benchmark, f"{stage}-cpu", samples.cpu, "s")
+        yield self.measurement(benchmark, f"{stage}-thread-cpu", samples.thread, "s")
+
+        if samples.batch is not None:
+            yield self.measurement(benchmark, f"{stage}-batch", samples.batch, "s")
+
+            if stage == "inferencing":
+                yield self.measurement(
+                    benchmark, f"{stage}-throughput", samples.throughput, "items/s"
+                )
+
+    def stage_samples(
+        self, benchmark: Benchmark, timings: Iterable[Timing], sizes: Iterable[int]
+    ) -> StageSamples:
+        """
+        Collects the timings of a stage that were recorded by workers.
+        """
+        samples = StageSamples(self.keep_samples, self.batch_size > 1)
+        for timing, size in zip(timings, sizes):
+            samples.add(timing, size, benchmark.padded(size))
+        return samples
+
+    def concurrent_measurements(
+        self,
+        benchmark: Benchmark,
+        timings: List[WorkerTimings],
+        elapsed: float,
+        baseline: Optional[float],
+    ) -> Iterable[Measurement]:
+        """
+        Creates the timing measurements of all workers combined, the inference
+        latency of each worker, the aggregate throughput of the workers and the
+        scaling efficiency of the workers compared to the single worker baseline.
+        """
+        sizes = [n for worker in timings for n in worker.sizes]
+        for stage in ("preprocessing", "inferencing"):
+            stimes = [t for worker in timings for t in getattr(worker, stage)]
+            samples = self.stage_samples(benchmark, stimes, sizes)
+            yield from self.timing_measurements(benchmark, stage, samples)
+
+        for i, worker in enumerate(timings):
+            latency = [
+                t.wall / n for t, n in zip(worker.inferencing, worker.sizes)
+                if not benchmark.padded(n)
+            ]
+            if latency:
+                yield self.measurement(
+                    benchmark, f"worker-{i}-inferencing", latency, "s"
+                )
+
+        aggregate = throughput(timings, elapsed)
+        if aggregate is not None:
+            yield self.measurement(
+                benchmark, "concurrent-throughput", [aggregate], "items/s"
+            )
+
+        if baseline is not None:
+            yield self.measurement(
+                benchmark, "concurrent-baseline-throughput", [baseline], "items/s"
+            )
+
+        if aggregate is not None and baseline is not None:
+            efficiency = scaling_efficiency(aggregate, baseline, len(timings))
+            if efficiency is not None:
+                yield self.measurement(
+                    benchmark, "concurrent-scaling-efficiency", [efficiency], None
+                )
+
+    def load_measurements(
+        self, benchmark: Benchmark, sweep: List[LoadTimings]
+    ) -> Iterable[Measurement]:
+        """
+        Creates the latency, queue wait, service time and achieved throughput
+        measurements for each offered rate, and the knee of the latency curve.
+        """
+        p99s = []
+        for timings in sweep:
+            prefix = f"load-{timings.rate:g}"
+            yield self.measurement(benchmark, f"{prefix}-latency", timings.latency, "s")
+            yield self.measurement(benchmark, f"{prefix}-wait", timings.wait, "s")
+            yield self.measurement(benchmark, f"{prefix}-service", timings.service, "s")
+
+            if timings.throughput is not None:
+                yield self.measurement(
+                    benchmark, f"{prefix}-throughput", [timings.throughput], "items/s"
+                )
+
+            if timings.latency:
+                p99s.append((timings.rate, np.percentile(timings.latency, 99)))
+
+        if p99s:
+            knee = find_knee(*zip(*p99s))
+            if knee is not None:
+                yield self.measurement(benchmark, "load-knee", [knee], "items/s")
+
+    def pipeline_measurements(
+        self,
+        benchmark: Benchmark,
+        pipeline: Prefetcher,
+        ptimes: StageSamples,
+        itimes: StageSamples,
+        elapsed: float,
+    ) -> Iterable[Measurement]:
+        """
+        Creates the prefetch stall time and queue depth measurements for each batch
+        along with the end-to-end throughput and the overlap efficiency of the run.
+        The overlap efficiency is the fraction of the time of the shorter stage that
+        was hidden by running it concurrently with the longer stage: 1.0 means that
+        the run took only as long as the slowest stage, 0.0 means no overlap at all.
+        """
+        yield self.measurement(benchmark, "pipeline-stall", pipeline.stalls, "s")
+        yield self.measurement(
+            benchmark, "pipeline-queue-depth", pipeline.depths, "batches"
         )
 
-        # Create the inference times measurement
-        yield Measurement(
+        if elapsed > 0:
+            throughput = [itimes.instances / elapsed]
+            yield self.measurement(
+                benchmark, "pipeline-throughput", throughput, "items/s"
+            )
+
+        preprocessing, inferencing = ptimes.total, itimes.total
+        overlappable = min(preprocessing, inferencing)
+        if overlappable > 0:
+            hidden = preprocessing + inferencing - elapsed
+            efficiency = max(0.0, min(1.0, hidden / overlappable))
+            yield self.measurement(benchmark, "pipeline-efficiency", [efficiency], None)
+
+    def memory_measurements(
+        self, benchmark: Benchmark, stage: str, usage: MemorySamples
+    ) -> Iterable[Measurement]:
+        """
+        Creates the peak RSS, steady-state RSS at the end of the stage, Python heap,
+        and device allocator measurements for a stage; measurements that were not
+        available on the platform are omitted.
+        """
+        fields = (
+            ("memory", "peak"),
+            ("rss", "rss"),
+            ("heap", "heap"),
+            ("device-memory", "device"),
+        )
+        for suffix, field in fields:
+            samples = usage.fields.get(field)
+            if not samples:
+                continue
+            yield self.measurement(benchmark, f"{stage}-{suffix}", samples, "B")
+
+    def measurement(
+        self,
+        benchmark: Benchmark,
+        sub_label: str,
+        values: Union[List[float], Samples],
+        units: str,
+    ) -> Measurement:
+        """
+        Creates a measurement of the values for the benchmark; if the runner is not
+        keeping samples, only a fixed-memory sketch of the values is stored so that
+        the memory used by the measurements does not grow with the number of runs.
+        Samples that were sketched as they were produced are stored as is.
+        """
+        sketch = None
+        if isinstance(values, Samples):
+            sketch = values.sketch
+            values = values.values if values.values is not None else []
+        elif not self.keep_samples:
+            sketch = Sketch.from_values(values)
+            values = []
+
+        return Measurement(
             per_run=1,
-            raw_metrics=itimes,
-            units="s",
+            raw_metrics=values,
+            sketch=sketch,
+            units=units,
             metric=Metric(
                 label=benchmark.__class__.__name__,
-                sub_label="inferencing",
+                sub_label=sub_label,
                 description=benchmark.description,
                 device=self.device,
                 env=self.env,
@@ -161,8 +810,12 @@ class BenchmarkRunner(object):
         if not self.is_complete:
             raise BenchmarkError("cannot save benchmarks that haven't been run")
 
-        with open(path, "w") as o:
-            dump(self.results_, o)
+        # Results are saved in the compact binary format if the path ends in .npz
+        if str(path).endswith(BINARY_EXT):
+            dump_binary(self.results_, path)
+        else:
+            with open(path, "w") as o:
+                dump(self.results_, o)
 
         if self.verbose:
             print("benchmark results saved to", path)
@@ -185,4 +838,16 @@ class Results:
     options: Optional[Dict] = None
     successes: Optional[int] = 0
     failures: Optional[int] = 0
+    memory: Optional[bool] = None
+    warmup: Optional[Union[int, str]] = None
+    concurrency: Optional[int] = None
+    baseline_limit: Optional[int] = None
+    rates: Optional[List[float]] = None
+    arrival: Optional[str] = None
+    threads: Optional[List[int]] = None
+    keep_samples: Optional[bool] = None
+    cache: Optional[str] = None
+    preprocess_once: Optional[bool] = None
+    peak_memory: Optional[int] = None
+    version: Optional[str] = None
     measurements: Optional[List[Measurement]] = None
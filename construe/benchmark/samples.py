@@ -0,0 +1,95 @@
+"""
+Collects the values of measurements as they are produced during a benchmark run.
+"""
+
+from .timer import Timing
+from .memory import MemoryUsage
+from ..metrics import Sketch
+
+from typing import Dict, List, Optional
+
+
+class Samples(object):
+    """
+    The values of a measurement. If keep is True the raw values are stored,
+    otherwise each value is added to a fixed-memory quantile sketch as it is
+    produced so that the memory used by a long run does not grow with the number of
+    instances.
+    """
+
+    def __init__(self, keep: bool = True):
+        self.values: Optional[List[float]] = [] if keep else None
+        self.sketch: Optional[Sketch] = None if keep else Sketch()
+
+    def add(self, value: float):
+        if self.values is not None:
+            self.values.append(value)
+        else:
+            self.sketch.add(value)
+
+    def __len__(self):
+        if self.values is not None:
+            return len(self.values)
+        return self.sketch.count
+
+
+class StageSamples(object):
+    """
+    The wall clock, process CPU, and thread CPU times of a stage amortized per
+    instance and, if batching, the per-batch latency and throughput. The total wall
+    clock time and number of instances of the stage are tracked exactly. The per
+    instance and per batch samples of padded batches are omitted since their timings
+    include the padding, but they are counted in the total.
+    """
+
+    def __init__(self, keep: bool = True, batched: bool = False):
+        self.wall = Samples(keep)
+        self.cpu = Samples(keep)
+        self.thread = Samples(keep)
+        self.batch = Samples(keep) if batched else None
+        self.throughput = Samples(keep) if batched else None
+        self.total = 0.0
+        self.instances = 0
+
+    def add(self, timing: Timing, size: int, padded: bool = False):
+        self.total += timing.wall
+        self.instances += size
+        if padded:
+            return
+
+        self.wall.add(timing.wall / size)
+        self.cpu.add(timing.cpu / size)
+        self.thread.add(timing.thread / size)
+
+        if self.batch is not None:
+            self.batch.add(timing.wall)
+            if timing.wall > 0:
+                self.throughput.add(size / timing.wall)
+
+    def __len__(self):
+        return len(self.wall)
+
+
+class MemorySamples(object):
+    """
+    The memory usage of each measured stage by field (e.g. peak); a field that is
+    not available on the platform for any stage is omitted.
+    """
+
+    FIELDS = ("peak", "rss", "heap", "device")
+
+    def __init__(self, keep: bool = True):
+        self.fields: Dict[str, Samples] = {
+            field: Samples(keep) for field in self.FIELDS
+        }
+
+    def add(self, usage: MemoryUsage):
+        for field in list(self.fields):
+            value = getattr(usage, field)
+            if value is None:
+                del self.fields[field]
+            else:
+                self.fields[field].add(value)
+
+    def __len__(self):
+        return max((len(samples) for samples in self.fields.values()), default=0)
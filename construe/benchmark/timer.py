@@ -0,0 +1,48 @@
+"""
+High resolution timing of benchmark stages.
+"""
+
+import time
+import dataclasses
+
+
+@dataclasses.dataclass(init=True, repr=True, eq=True)
+class Timing:
+    """
+    The wall clock, process CPU, and thread CPU time of a benchmark stage in seconds.
+    Process CPU time includes all threads (e.g. interpreter worker threads) so it can
+    exceed the wall clock time; CPU time that is much lower than the wall clock time
+    indicates that the stage is waiting on I/O or contending for resources.
+    """
+
+    wall: float = 0.0
+    cpu: float = 0.0
+    thread: float = 0.0
+
+
+class Timer(object):
+    """
+    Context manager that times the enclosed block using the monotonic, high resolution
+    nanosecond performance counter along with the process and thread CPU clocks.
+
+    Usage::
+
+        with Timer() as timer:
+            do_work()
+        timer.timing.wall
+    """
+
+    def __init__(self):
+        self.timing = None
+
+    def __enter__(self):
+        self._thread = time.thread_time_ns()
+        self._cpu = time.process_time_ns()
+        self._wall = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter_ns() - self._wall
+        cpu = time.process_time_ns() - self._cpu
+        thread = time.thread_time_ns() - self._thread
+        self.timing = Timing(wall=wall / 1e9, cpu=cpu / 1e9, thread=thread / 1e9)
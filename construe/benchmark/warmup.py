@@ -0,0 +1,63 @@
+"""
+Handles warming up a benchmark before its steady-state measurements are taken.
+"""
+
+import numpy as np
+
+from ..exceptions import BenchmarkError
+
+from typing import List, Union
+
+
+# Specify the warmup as AUTO to run instances until the latency stabilizes.
+AUTO = "auto"
+
+# Parameters for automatic steady-state detection: the rolling median of the last
+# window of latencies must be within the tolerance of the previous window's median.
+WARMUP_WINDOW = 5
+WARMUP_TOLERANCE = 0.05
+WARMUP_MAX = 100
+
+
+def resolve_warmup(warmup: Union[int, str, None]) -> Union[int, str]:
+    """
+    Parses a warmup specification from the command line or runner configuration;
+    returns either a non-negative number of warmup instances or AUTO.
+    """
+    if warmup is None:
+        return 0
+
+    if isinstance(warmup, str):
+        warmup = warmup.strip().lower()
+        if warmup == AUTO:
+            return AUTO
+
+        try:
+            warmup = int(warmup)
+        except ValueError:
+            raise BenchmarkError(
+                f"invalid warmup {warmup!r}: specify a number of instances or {AUTO!r}"
+            )
+
+    if warmup < 0:
+        raise BenchmarkError("warmup must be a non-negative number of instances")
+    return warmup
+
+
+def is_steady(
+    times: List[float],
+    window: int = WARMUP_WINDOW,
+    tolerance: float = WARMUP_TOLERANCE,
+) -> bool:
+    """
+    Returns True if the median of the last window of times is within the relative
+    tolerance of the median of the window before it, e.g. the latency has stabilized.
+    """
+    if len(times) < window * 2:
+        return False
+
+    current = np.median(times[-window:])
+    previous = np.median(times[-window * 2:-window])
+    if previous == 0:
+        return current == 0
+    return abs(current - previous) / previous <= tolerance
@@ -0,0 +1,131 @@
+"""
+Drives multiple benchmark replicas concurrently from a shared instance queue.
+"""
+
+import time
+import queue
+import threading
+import dataclasses
+
+from .base import Benchmark
+from .timer import Timer, Timing
+
+from typing import Any, Callable, Iterable, List, Optional
+
+
+# Default number of instances in the single worker baseline pass that the scaling
+# efficiency of concurrent workers is computed against.
+BASELINE_LIMIT = 100
+
+
+@dataclasses.dataclass(init=True, repr=False, eq=True)
+class WorkerTimings:
+    """
+    The preprocessing and inference timings and batch sizes recorded by one worker.
+    """
+
+    preprocessing: List[Timing] = dataclasses.field(default_factory=list)
+    inferencing: List[Timing] = dataclasses.field(default_factory=list)
+    sizes: List[int] = dataclasses.field(default_factory=list)
+
+    @property
+    def instances(self) -> int:
+        return sum(self.sizes)
+
+
+class WorkerPool(object):
+    """
+    Runs one thread per benchmark replica; each thread takes batches from a shared
+    queue then preprocesses and inferences them with its own replica (and therefore
+    its own model interpreter) so that the aggregate throughput of N parallel model
+    replicas on the device can be measured. Threads are used since the interpreters
+    release the GIL during inference and cannot be shared across processes.
+    """
+
+    def __init__(
+        self,
+        benchmarks: List[Benchmark],
+        preprocess: Callable[[Benchmark, List], Any],
+        inference: Callable[[Benchmark, Any], Any],
+    ):
+        if not benchmarks:
+            raise ValueError("at least one benchmark replica is required")
+
+        self.benchmarks = benchmarks
+        self.preprocess = preprocess
+        self.inference = inference
+
+    def run(self, batches: Iterable[List], progress=None) -> List[WorkerTimings]:
+        """
+        Processes all of the batches using every replica and returns the timings of
+        each worker; the wall clock duration of the run is stored on elapsed_.
+        """
+        tasks = queue.Queue()
+        for batch in batches:
+            tasks.put(batch)
+
+        lock = threading.Lock()
+        errors = []
+        stop = threading.Event()
+        timings = [WorkerTimings() for _ in self.benchmarks]
+
+        def work(benchmark: Benchmark, results: WorkerTimings):
+            try:
+                while not stop.is_set():
+                    try:
+                        batch = tasks.get_nowait()
+                    except queue.Empty:
+                        return
+
+                    with Timer() as timer:
+                        features = self.preprocess(benchmark, batch)
+                    results.preprocessing.append(timer.timing)
+
+                    with Timer() as timer:
+                        self.inference(benchmark, features)
+                    results.inferencing.append(timer.timing)
+                    results.sizes.append(len(batch))
+
+                    if progress is not None:
+                        with lock:
+                            progress.update(len(batch))
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+
+        threads = [
+            threading.Thread(target=work, args=(benchmark, results), daemon=True)
+            for benchmark, results in zip(self.benchmarks, timings)
+        ]
+
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.elapsed_ = time.perf_counter() - started
+
+        if errors:
+            raise errors[0]
+        return timings
+
+
+def throughput(timings: List[WorkerTimings], elapsed: float) -> Optional[float]:
+    """
+    Returns the aggregate number of instances processed per second by all workers.
+    """
+    if elapsed <= 0:
+        return None
+    return sum(t.instances for t in timings) / elapsed
+
+
+def scaling_efficiency(
+    throughput: float, baseline: float, n_workers: int
+) -> Optional[float]:
+    """
+    Returns the throughput of N workers as a fraction of N times the throughput of a
+    single worker; 1.0 is perfect linear scaling.
+    """
+    if not baseline or not n_workers:
+        return None
+    return throughput / (baseline * n_workers)
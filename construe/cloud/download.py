@@ -3,26 +3,76 @@ Handle HTTP download requests from content URLs
 """
 
 import os
+import json
+import time
 import shutil
+import hashlib
 import zipfile
+import threading
+import http.client
 
 from tqdm import tqdm
-from urllib.request import urlopen
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import Request, urlopen
 from construe.exceptions import DownloadError
 
-from .signature import sha256sum
+from .signature import write_signature, remove_signature
 
 
 # Download chunk size
 CHUNK = 524288
 
+# Number of parallel HTTP range requests used to download an archive
+PARTS = 4
 
-def download_zip(url, out, signature, replace=False, extract=True, progress=True):
+# Archives are only split into parts that are at least this many bytes
+MIN_PART_SIZE = 16777216
+
+# Number of times a part is retried (with exponential backoff) before failing
+RETRIES = 5
+BACKOFF = 0.5
+
+# Timeout in seconds of each HTTP request
+TIMEOUT = 60
+
+# Maximum number of archives downloaded concurrently and the total number of HTTP
+# connections that are shared between them when downloading many archives
+WORKERS = 4
+CONNECTIONS = 8
+
+# Extension of the partially downloaded archive; its state is stored in a .json file
+PART_EXT = ".part"
+
+# Errors that are retried when downloading a part of an archive
+RETRY_ERRORS = (OSError, http.client.HTTPException)
+
+
+def download_zip(
+    url,
+    out,
+    signature,
+    replace=False,
+    extract=True,
+    progress=True,
+    parts=PARTS,
+    retries=RETRIES,
+    backoff=BACKOFF,
+):
     """
     Download a zipped file at the given URL saving it to the out directory. Once
     downloaded, verify the signature to make sure the download hasn't been tampered
     with or corrupted. If the file already exists it will be overwritten only if
     replace=True. If extract=True then the file will be unzipped.
+
+    If the server supports HTTP range requests, large archives are downloaded in
+    up to ``parts`` parallel ranges to a ``.part`` file. Each range is retried with
+    exponential backoff if the connection fails and the progress of each range is
+    recorded so that a failed or interrupted download is resumed rather than
+    restarted. Otherwise the archive is streamed with a single request.
+
+    When the archive is downloaded in a single stream or range, the signature is
+    computed incrementally as the download is written to disk, so the archive does
+    not have to be read again to verify it.
     """
     # Get the name of the file from the URL
     basename = os.path.basename(url)
@@ -39,38 +89,335 @@ def download_zip(url, out, signature, replace=False, extract=True, progress=True
                 f"file already exists at {archive}, set replace=False to overwrite"
             )
 
-        shutil.rmtree(datadir)
+        if os.path.exists(datadir):
+            shutil.rmtree(datadir)
         os.remove(archive)
+        remove_signature(archive)
 
-    # Create the output directory if it does not exist
-    if not os.path.exists(datadir):
-        os.mkdir(datadir)
-
-    # Fetch the response in a streaming fashion and write it to disk.
-    response = urlopen(url)
-    content_length = int(response.headers["Content-Length"])
+    content_length, accepts_ranges = probe(url)
 
+    # Progress may be shared with other concurrent downloads
     pbar = None
-    if progress:
+    shared = isinstance(progress, DownloadProgress)
+    if shared:
+        pbar = progress
+        pbar.add(content_length)
+    elif progress:
         pbar = tqdm(
             unit="B", total=content_length, desc=f"Downloading {basename}", leave=False
         )
 
-    with open(archive, "wb") as f:
+    try:
+        if accepts_ranges and content_length:
+            digest = _download_ranges(
+                url, archive, content_length, signature, parts, retries, backoff, pbar
+            )
+        else:
+            digest = _download_stream(url, archive, pbar)
+    finally:
+        if pbar and not shared:
+            pbar.close()
+
+    # Compare the signature of the archive to the expected one
+    if digest != signature:
+        raise DownloadError("Download signature does not match hardcoded signature!")
+
+    # If extract, extract the zipfile; otherwise the archive can be read in place.
+    if extract:
+        if not os.path.exists(datadir):
+            os.mkdir(datadir)
+
+        with zipfile.ZipFile(archive) as zf:
+            zf.extractall(path=datadir)
+
+    write_signature(archive, signature)
+
+
+def download_concurrently(
+    downloaders, workers=WORKERS, connections=CONNECTIONS, progress=True, **kwargs
+):
+    """
+    Calls each downloader (e.g. a partial of ``download_zip``) in a pool of at most
+    workers threads so that the total download time is roughly that of the largest
+    download rather than the sum of all of them. The connections are divided
+    between the workers as the number of range parts of each download so that no
+    more than the specified number of HTTP connections are open at once. All of the
+    downloads report to a single aggregated progress bar.
+
+    The kwargs are passed to each downloader. Every download is attempted; if any
+    fail a DownloadError describing all of the failures is raised at the end.
+    """
+    downloaders = list(downloaders)
+    if not downloaders:
+        return
+
+    workers = max(1, min(workers, len(downloaders)))
+    kwargs["parts"] = max(1, connections // workers)
+
+    pbar = DownloadProgress(
+        desc=f"Downloading {len(downloaders)} archives", disable=not progress
+    )
+    kwargs["progress"] = pbar
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(f, **kwargs) for f in downloaders]
+            errors = [future.exception() for future in futures]
+    finally:
+        pbar.close()
+
+    errors = [str(error) for error in errors if error is not None]
+    if errors:
+        raise DownloadError(
+            f"{len(errors)} of {len(downloaders)} downloads failed:\n"
+            + "\n".join(errors)
+        )
+
+
+class DownloadProgress(object):
+    """
+    A thread-safe progress bar that aggregates the bytes downloaded by concurrent
+    downloads; each download adds its size to the total when it starts.
+    """
+
+    def __init__(self, desc="Downloading", disable=False):
+        self.lock = threading.Lock()
+        self.pbar = tqdm(
+            unit="B", unit_scale=True, total=0, desc=desc, leave=False, disable=disable
+        )
+
+    def add(self, nbytes):
+        with self.lock:
+            self.pbar.total += nbytes or 0
+            self.pbar.refresh()
+
+    def update(self, nbytes):
+        with self.lock:
+            self.pbar.update(nbytes)
+
+    def close(self):
+        self.pbar.close()
+
+
+def probe(url):
+    """
+    Returns the content length of the URL (or None if unknown) and whether the server
+    accepts HTTP range requests using a HEAD request.
+    """
+    try:
+        with urlopen(Request(url, method="HEAD"), timeout=TIMEOUT) as response:
+            length = response.headers.get("Content-Length")
+            ranges = response.headers.get("Accept-Ranges", "").strip().lower()
+    except RETRY_ERRORS:
+        return None, False
+
+    length = int(length) if length is not None else None
+    return length, ranges == "bytes"
+
+
+def _download_stream(url, archive, pbar=None):
+    """
+    Streams the URL to the archive with a single request and returns its signature.
+    """
+    response = urlopen(url, timeout=TIMEOUT)
+    if isinstance(pbar, tqdm) and pbar.total is None:
+        pbar.total = int(response.headers.get("Content-Length", 0)) or None
+
+    # Compute the signature from the chunks as they are written to disk so that the
+    # archive does not have to be read a second time to verify it.
+    sig = hashlib.sha256()
+    with response, open(archive, "wb") as f:
         while True:
             chunk = response.read(CHUNK)
             if not chunk:
                 break
             f.write(chunk)
+            sig.update(chunk)
 
             if pbar:
                 pbar.update(len(chunk))
 
-    # Compare the signature of the archive to the expected one
-    if sha256sum(archive) != signature:
-        raise DownloadError("Download signature does not match hardcoded signature!")
+    return sig.hexdigest()
 
-    # If extract, extract the zipfile.
-    if extract:
-        zf = zipfile.ZipFile(archive)
-        zf.extractall(path=datadir)
+
+def _download_ranges(url, archive, size, signature, parts, retries, backoff, pbar=None):
+    """
+    Downloads the URL in parallel HTTP range requests to a .part file, resuming any
+    previously downloaded ranges, then moves the .part file to the archive path and
+    returns its signature.
+    """
+    partpath = archive + PART_EXT
+    statepath = partpath + ".json"
+
+    state = _load_state(statepath, url, size, signature)
+    if state is None or not os.path.exists(partpath) or os.path.getsize(partpath) != size:
+        n_parts = max(1, min(parts, size // MIN_PART_SIZE))
+        step = -(-size // n_parts)
+        state = {
+            "url": url,
+            "size": size,
+            "signature": signature,
+            "parts": [
+                [start, min(start + step, size), start]
+                for start in range(0, size, step)
+            ],
+        }
+
+        with open(partpath, "wb") as f:
+            f.truncate(size)
+        _save_state(statepath, state)
+
+    if pbar:
+        pbar.update(sum(offset - start for start, _, offset in state["parts"]))
+
+    # Hash the contiguous prefix of the file as it is downloaded, including any
+    # ranges that were downloaded before the download was resumed.
+    hasher = _PrefixHasher(partpath, state["parts"])
+    hasher.catch_up()
+
+    lock = threading.Lock()
+
+    def fetch(idx):
+        _, end, offset = state["parts"][idx]
+        attempt = 0
+
+        with open(partpath, "r+b") as f:
+            while offset < end:
+                try:
+                    request = Request(url, headers={"Range": f"bytes={offset}-{end-1}"})
+                    with urlopen(request, timeout=TIMEOUT) as response:
+                        if response.status != 206:
+                            raise DownloadError(
+                                f"server did not return partial content for {url}"
+                            )
+
+                        f.seek(offset)
+                        while offset < end:
+                            chunk = response.read(min(CHUNK, end - offset))
+                            if not chunk:
+                                raise ConnectionError("connection closed before range ended")
+
+                            f.write(chunk)
+                            f.flush()
+
+                            written = offset
+                            offset += len(chunk)
+                            attempt = 0
+
+                            with lock:
+                                state["parts"][idx][2] = offset
+                                _save_state(statepath, state)
+                                if pbar:
+                                    pbar.update(len(chunk))
+
+                            hasher.update(written, chunk)
+
+                except DownloadError:
+                    raise
+                except RETRY_ERRORS as e:
+                    attempt += 1
+                    if attempt > retries:
+                        raise DownloadError(
+                            f"could not download bytes {offset}-{end-1} of {url}: {e}"
+                        ) from e
+                    time.sleep(backoff * 2 ** (attempt - 1))
+
+    with ThreadPoolExecutor(max_workers=len(state["parts"])) as executor:
+        futures = [executor.submit(fetch, idx) for idx in range(len(state["parts"]))]
+        errors = [future.exception() for future in futures]
+
+    # Parts that completed are kept in the .part file so the download can be resumed
+    for error in errors:
+        if error is not None:
+            raise error
+
+    digest = hasher.hexdigest()
+    os.remove(statepath)
+
+    if digest != signature:
+        os.remove(partpath)
+    else:
+        os.replace(partpath, archive)
+    return digest
+
+
+class _PrefixHasher(object):
+    """
+    Computes the signature of a file that is downloaded in parallel ranges from
+    the contiguous prefix of the file that has been downloaded. Chunks that are
+    written at the end of the prefix (e.g. all of the first range) are hashed as
+    they are downloaded. Bytes that later ranges downloaded ahead of the prefix are
+    read back once the prefix reaches them, so the file does not have to be read
+    again after the download completes. The parts are the [start, end, offset]
+    ranges of the download state, in order.
+    """
+
+    def __init__(self, path, parts):
+        self.path = path
+        self.parts = parts
+        self.sig = hashlib.sha256()
+        self.hashed = 0
+        self.reread = 0
+        self.lock = threading.Lock()
+
+    def update(self, offset, chunk):
+        """
+        Hashes a chunk written at the offset if it extends the prefix, then reads
+        back any bytes downloaded ahead of the prefix that are now contiguous.
+        """
+        with self.lock:
+            if offset == self.hashed:
+                self.sig.update(chunk)
+                self.hashed += len(chunk)
+            self._catch_up()
+
+    def catch_up(self):
+        with self.lock:
+            self._catch_up()
+
+    def hexdigest(self):
+        self.catch_up()
+        return self.sig.hexdigest()
+
+    def _catch_up(self):
+        for start, _, offset in self.parts:
+            if start <= self.hashed < offset:
+                self._read(offset)
+
+    def _read(self, until):
+        with open(self.path, "rb") as f:
+            f.seek(self.hashed)
+            while self.hashed < until:
+                buf = f.read(min(CHUNK, until - self.hashed))
+                if not buf:
+                    break
+                self.sig.update(buf)
+                self.hashed += len(buf)
+                self.reread += len(buf)
+
+
+def _load_state(path, url, size, signature):
+    """
+    Loads the state of a partial download if it matches the download.
+    """
+    try:
+        with open(path, "r") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(state, dict)
+        or state.get("url") != url
+        or state.get("size") != size
+        or state.get("signature") != signature
+    ):
+        return None
+    return state
+
+
+def _save_state(path, state):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
@@ -2,6 +2,8 @@
 Computes the signature of downloaded files for hash verification.
 """
 
+import os
+import json
 import hashlib
 
 
@@ -17,3 +19,96 @@ def sha256sum(path, blocksize=65536):
             sig.update(buf)
             buf = f.read(blocksize)
     return sig.hexdigest()
+
+
+# Extension of the sidecar file that caches the verified signature of a file
+SIDECAR_EXT = ".sha256"
+
+
+def sidecar_path(path):
+    return path + SIDECAR_EXT
+
+
+def resolve_verify(verify=None):
+    """
+    If verify is None, checks the ``$CONSTRUE_VERIFY`` environment variable to
+    determine if signatures should be fully verified rather than trusting the cache.
+    """
+    if verify is None:
+        verify = os.environ.get("CONSTRUE_VERIFY", "").strip().lower()
+        return verify in ("1", "true", "yes", "on")
+    return bool(verify)
+
+
+def _stat_key(path):
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "inode": stat.st_ino}
+
+
+def write_signature(path, signature):
+    """
+    Records the signature of the file in a sidecar file keyed by the size,
+    modification time, and inode of the file so that the file is not rehashed
+    unless it changes. Failure to write the sidecar (e.g. a read-only file system)
+    is ignored since the signature can always be recomputed.
+    """
+    record = _stat_key(path)
+    record["signature"] = signature
+
+    sidecar = sidecar_path(path)
+    tmp = sidecar + ".tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(record, f)
+        os.replace(tmp, sidecar)
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def cached_signature(path):
+    """
+    Returns the signature of the file recorded in the sidecar if the file has not
+    changed (same size, modification time, and inode) since it was recorded,
+    otherwise returns None.
+    """
+    try:
+        with open(sidecar_path(path), "r") as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(record, dict) or "signature" not in record:
+        return None
+
+    signature = record.pop("signature")
+    if record != _stat_key(path):
+        return None
+    return signature
+
+
+def verified_signature(path, verify=None):
+    """
+    Returns the SHA256 signature of the file, using the signature cached in the
+    sidecar file if the file is unchanged, unless verify is True in which case the
+    file is always rehashed and the cache is updated.
+    """
+    if not resolve_verify(verify):
+        signature = cached_signature(path)
+        if signature is not None:
+            return signature
+
+    signature = sha256sum(path)
+    write_signature(path, signature)
+    return signature
+
+
+def remove_signature(path):
+    """
+    Removes the sidecar signature cache of the file if it exists.
+    """
+    sidecar = sidecar_path(path)
+    if os.path.exists(sidecar):
+        os.remove(sidecar)
+        return True
+    return False
@@ -0,0 +1,167 @@
+"""
+Read dataset instances directly from the zip archive without extracting it.
+"""
+
+import io
+import os
+import mmap
+import struct
+import fnmatch
+import zipfile
+
+
+# The fixed size portion of a zip local file header and its signature
+LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+LOCAL_HEADER_MAGIC = b"PK\003\004"
+
+
+class Archive(object):
+    """
+    An open dataset archive whose members can be read by concurrent threads.
+    Members that are stored without compression (e.g. images and audio that are
+    already compressed) are read directly from a memory map of the archive rather
+    than through the zipfile module, which serializes reads with a lock; compressed
+    members are decompressed with zipfile.
+
+    Members can still be read after the archive is closed (e.g. members that were
+    yielded from a dataset loader are often read after the loader is exhausted);
+    each is then read with a file handle that is closed once the member is read.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.zf = zipfile.ZipFile(path)
+        self.closed = False
+        self._offsets = {}
+
+        self._mm = None
+        if os.path.getsize(path) > 0:
+            with open(path, "rb") as f:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        self.closed = True
+        self.zf.close()
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def members(self, pattern=None, no_dirs=True):
+        """
+        Yields the members of the archive whose names match the glob pattern, which
+        is matched component by component as if the archive had been extracted.
+        """
+        for info in self.zf.infolist():
+            if no_dirs and info.is_dir():
+                continue
+
+            if pattern is not None and not match(info.filename.rstrip("/"), pattern):
+                continue
+
+            yield ArchiveMember(self, info)
+
+    def read(self, info):
+        """
+        Returns the bytes of the member described by the zip info.
+        """
+        mm = self._mm
+        if not self.closed:
+            # A ValueError is raised if the archive is closed by another thread
+            try:
+                if info.compress_type != zipfile.ZIP_STORED or mm is None:
+                    return self.zf.read(info)
+
+                start = self._data_offset(info, mm)
+                return mm[start:start+info.file_size]
+            except ValueError:
+                if not self.closed:
+                    raise
+
+        if info.compress_type != zipfile.ZIP_STORED:
+            with zipfile.ZipFile(self.path) as zf:
+                return zf.read(info.filename)
+
+        with open(self.path, "rb") as f:
+            f.seek(self._data_offset(info, f))
+            return f.read(info.file_size)
+
+    def _data_offset(self, info, buf):
+        # The data of a member follows its local header, whose variable length
+        # fields may differ from those in the central directory. The header is
+        # read from the memory map or, if the archive is closed, a file handle.
+        offset = self._offsets.get(info.filename)
+        if offset is None:
+            if isinstance(buf, mmap.mmap):
+                header = LOCAL_HEADER.unpack_from(buf, info.header_offset)
+            else:
+                buf.seek(info.header_offset)
+                header = LOCAL_HEADER.unpack(buf.read(LOCAL_HEADER.size))
+
+            if header[0] != LOCAL_HEADER_MAGIC:
+                raise zipfile.BadZipFile(f"bad local file header for {info.filename}")
+
+            name_length, extra_length = header[-2:]
+            offset = info.header_offset + LOCAL_HEADER.size + name_length + extra_length
+            self._offsets[info.filename] = offset
+        return offset
+
+    def __repr__(self):
+        return f"<Archive {self.path!r}>"
+
+
+class ArchiveMember(object):
+    """
+    A file in a dataset archive that is read on demand. The string representation
+    of a member is its path in the archive (e.g. for filtering by directory);
+    ``read`` returns its bytes and ``open`` returns a seekable file-like object that
+    can be passed to readers that accept files such as soundfile or PIL.
+    """
+
+    def __init__(self, archive, info):
+        self.archive = archive
+        self.info = info
+
+    @property
+    def name(self):
+        return self.info.filename
+
+    @property
+    def size(self):
+        return self.info.file_size
+
+    def read(self):
+        return self.archive.read(self.info)
+
+    def open(self):
+        return io.BytesIO(self.read())
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return f"<ArchiveMember {self.name!r} in {self.archive.path!r}>"
+
+
+def match(name, pattern):
+    """
+    Matches a path in the archive against a glob pattern with the same semantics
+    as glob.glob (without recursive=True): wildcards do not match across
+    directories and hidden files are only matched by patterns that start with a dot.
+    """
+    parts = name.split("/")
+    patterns = pattern.split("/")
+    if len(parts) != len(patterns):
+        return False
+
+    for part, pat in zip(parts, patterns):
+        if part.startswith(".") and not pat.startswith("."):
+            return False
+        if not fnmatch.fnmatchcase(part, pat):
+            return False
+    return True
@@ -6,14 +6,21 @@ from functools import partial
 
 from .path import get_data_home
 from .manifest import load_manifest
-from ..cloud.download import download_zip
+from ..cloud.download import download_zip, download_concurrently
+from ..cloud.download import PARTS, WORKERS, CONNECTIONS
 from .path import DIALECTS, LOWLIGHT, REDDIT, MOVIES, ESSAYS, AEGIS, NSFW
 
 from ..exceptions import DatasetsError
 
 
 def download_data(
-    url, signature, data_home=None, replace=False, extract=True, progress=True
+    url,
+    signature,
+    data_home=None,
+    replace=False,
+    extract=True,
+    progress=True,
+    parts=PARTS,
 ):
     """
     Downloads the zipped data set specified at the given URL, saving it to
@@ -22,12 +29,24 @@ def download_data(
     """
     data_home = get_data_home(data_home)
     download_zip(
-        url, data_home, signature, replace=replace, extract=extract, progress=progress
+        url,
+        data_home,
+        signature,
+        replace=replace,
+        extract=extract,
+        progress=progress,
+        parts=parts,
     )
 
 
 def _download_dataset(
-    name, sample=True, data_home=True, replace=False, extract=True, progress=True
+    name,
+    sample=True,
+    data_home=None,
+    replace=False,
+    extract=True,
+    progress=True,
+    parts=PARTS,
 ):
     """
     Downloads the zipped data set specified using the manifest URL, saving it to the
@@ -47,6 +66,7 @@ def _download_dataset(
         "replace": replace,
         "extract": extract,
         "progress": progress,
+        "parts": parts,
         "url": info["url"],
         "signature": info["signature"],
     }
@@ -74,13 +94,25 @@ DOWNLOADERS = [
 
 
 def download_all_datasets(
-    sample=True, data_home=True, replace=True, extract=True, progress=True
+    sample=True,
+    data_home=None,
+    replace=True,
+    extract=True,
+    progress=True,
+    workers=WORKERS,
+    connections=CONNECTIONS,
 ):
-    for f in DOWNLOADERS:
-        f(
-            sample=sample,
-            data_home=data_home,
-            replace=replace,
-            extract=extract,
-            progress=progress,
-        )
+    """
+    Downloads all datasets concurrently using at most workers threads and sharing
+    the specified number of HTTP connections, reporting to a single progress bar.
+    """
+    download_concurrently(
+        DOWNLOADERS,
+        workers=workers,
+        connections=connections,
+        progress=progress,
+        sample=sample,
+        data_home=get_data_home(data_home),
+        replace=replace,
+        extract=extract,
+    )
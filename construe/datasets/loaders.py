@@ -6,13 +6,15 @@ import os
 import glob
 import json
 import shutil
+import zipfile
 
 from functools import partial
 
+from .archive import Archive
 from .manifest import load_manifest
 from .download import download_data
 from ..exceptions import DatasetsError
-from .path import find_dataset_path, get_data_home
+from .path import find_dataset_path, get_data_home, dataset_exists
 from .path import dataset_archive, cleanup_dataset
 from .path import DIALECTS, LOWLIGHT, REDDIT, MOVIES, ESSAYS, AEGIS, NSFW
 
@@ -38,41 +40,80 @@ def _info(dataset):
     return DATASETS[dataset]
 
 
-def _load_prepare(name, sample=True, data_home=None):
+def _load_prepare(name, sample=True, data_home=None, extract=True, verify=None):
+    """
+    Downloads the dataset if required and returns the path to the extracted dataset
+    directory or, if extract=False, to the dataset archive. If verify is True, the
+    signature of a cached archive is fully verified (see resolve_verify).
+    """
     if sample and not name.endswith("-sample"):
         name = name + "-sample"
 
     info = _info(name)
-    if not dataset_archive(name, info["signature"], data_home=data_home):
+    if not dataset_archive(
+        name, info["signature"], data_home=data_home, verify=verify
+    ):
         # If the dataset does not exist, download and extract it
         kwargs = {
-            "data_home": data_home, "replace": True, "extract": True,
+            "data_home": data_home, "replace": True, "extract": extract,
             "url": info["url"], "signature": info["signature"],
         }
         download_data(**kwargs)
 
+    if not extract:
+        return find_dataset_path(name + ".zip", data_home=data_home)
+
+    # The archive may have been downloaded without being extracted
+    if not dataset_exists(name, data_home=data_home):
+        datadir = os.path.join(get_data_home(data_home), name)
+        with zipfile.ZipFile(datadir + ".zip") as zf:
+            zf.extractall(path=datadir)
+
     return find_dataset_path(name, data_home=data_home, fname=None, ext=None)
 
 
-def _load_file_dataset(name, sample=True, data_home=None, no_dirs=True, pattern=None):
+def _load_file_dataset(
+    name, sample=True, data_home=None, no_dirs=True, pattern=None, extract=True,
+    verify=None,
+):
+    """
+    Yields the paths of the files in the dataset, or if extract=False, yields
+    ArchiveMembers that read the files directly from the dataset archive.
+    """
     # Find the data path
-    data_path = _load_prepare(name, sample=sample, data_home=data_home)
+    data_path = _load_prepare(
+        name, sample=sample, data_home=data_home, extract=extract, verify=verify
+    )
 
     # Glob pattern for discovering files in the dataset
     if pattern is None:
-        pattern = os.path.join(data_path, "**", "*")
-    else:
-        pattern = os.path.join(data_path, pattern)
+        pattern = "**/*"
+
+    if not extract:
+        # Members yielded before the archive is closed can still be read after it
+        with Archive(data_path) as archive:
+            yield from archive.members(pattern, no_dirs=no_dirs)
+        return
 
-    for path in glob.glob(pattern):
+    for path in glob.glob(os.path.join(data_path, pattern)):
         if no_dirs and os.path.isdir(path):
             continue
 
         yield path
 
 
-def _load_jsonl_dataset(name, sample=True, data_home=None):
-    data_path = _load_prepare(name, sample=sample, data_home=data_home)
+def _load_jsonl_dataset(name, sample=True, data_home=None, extract=True, verify=None):
+    data_path = _load_prepare(
+        name, sample=sample, data_home=data_home, extract=extract, verify=verify
+    )
+
+    if not extract:
+        with Archive(data_path) as archive:
+            for member in archive.members("*.jsonl"):
+                for line in member.open():
+                    yield json.loads(line.strip())
+        return
+
     for path in glob.glob(os.path.join(data_path, "*.jsonl")):
         with open(path, "r") as f:
             for line in f:
@@ -107,7 +148,7 @@ load_nsfw = partial(_load_file_dataset, NSFW, pattern="nsfw/**/*.jpg")
 cleanup_nsfw = partial(_cleanup_dataset, NSFW)
 
 
-def load_all_datasets(sample=True, data_home=None):
+def load_all_datasets(sample=True, data_home=None, extract=True, verify=None):
     """
     Load all available datasets as defined by __all__
     """
@@ -120,7 +161,7 @@ def load_all_datasets(sample=True, data_home=None):
             continue
 
         f = module[name]
-        for row in f(sample=sample, data_home=data_home):
+        for row in f(sample=sample, data_home=data_home, extract=extract, verify=verify):
             yield row
 
 
@@ -6,7 +6,7 @@ import os
 import shutil
 
 from pathlib import Path
-from ..cloud.signature import sha256sum
+from ..cloud.signature import verified_signature, remove_signature
 from construe.exceptions import DatasetsError
 
 
@@ -97,18 +97,22 @@ def dataset_exists(dataset, data_home=None):
     return os.path.exists(path) and os.path.isdir(path)
 
 
-def dataset_archive(dataset, signature, data_home=None, ext=".zip"):
+def dataset_archive(dataset, signature, data_home=None, ext=".zip", verify=None):
     """
     Checks to see if the dataset archive file exists in the data home directory,
     found with ``get_data_home``. By specifying the signature, this function
     also checks to see if the archive is the latest version by comparing the
     sha256sum of the local archive with the specified signature.
+
+    The sha256sum is cached in a sidecar file and the archive is only rehashed if it
+    has changed since it was last verified, unless verify=True (or the
+    ``$CONSTRUE_VERIFY`` environment variable is set) to force a full check.
     """
     data_home = get_data_home(data_home)
     path = os.path.join(data_home, dataset + ext)
 
     if os.path.exists(path) and os.path.isfile(path):
-        return sha256sum(path) == signature
+        return verified_signature(path, verify=verify) == signature
 
     return False
 
@@ -129,9 +133,10 @@ def cleanup_dataset(dataset, data_home=None, ext=".zip"):
         shutil.rmtree(datadir)
         removed += 1
 
-    # Remove the archive file
+    # Remove the archive file and its cached signature
     if os.path.exists(archive):
         os.remove(archive)
         removed += 1
+    remove_signature(archive)
 
     return removed
@@ -35,6 +35,16 @@ class BenchmarkError(ConstrueError):
     pass
 
 
+class RegressionError(ConstrueError):
+
+    # Distinct from usage errors (2) and other errors (1) so CI can detect regressions
+    exit_code = 3
+
+
+class MetricsError(ConstrueError):
+    pass
+
+
 class DeviceError(ConstrueError):
 
     def __init__(self, e):
@@ -8,6 +8,7 @@ import tensorflow as tf
 
 from .datasets import DATASETS
 from .exceptions import DatasetsError
+from .datasets.archive import ArchiveMember
 from .benchmark import Benchmark, limit_generator
 from .models import load_lowlight as load_lowlight_model
 from .models import cleanup_lowlight as cleanup_lowlight_model
@@ -33,15 +34,27 @@ class LowLight(Benchmark):
             "model that understands how to enrich low-light images"
         )
 
+    @property
+    def fingerprint(self):
+        # Cached images depend only on the dataset
+        name = "lowlight-sample" if self.use_sample else "lowlight"
+        return {**super().fingerprint, "dataset": DATASETS[name]["signature"]}
+
     def before(self):
         # Load and setup the interpreter for the lowlight dataset
-        model = load_lowlight_model(model_home=self.model_home)
-        model.resize_tensor_input(0, [1, 400, 600, 3])
-        model.allocate_tensors()
+        self.model = load_lowlight_model(
+            model_home=self.model_home, options=self.interpreter_options,
+            verify=self.verify,
+        )
+        self.resize(self.batch_size)
 
-        self.model = model
-        self.input_details = model.get_input_details()
-        self.output_details = model.get_output_details()
+    def resize(self, batch_size):
+        # Resize the interpreter input for the batch size and reallocate tensors
+        self.model.resize_tensor_input(0, [batch_size, 400, 600, 3])
+        self.model.allocate_tensors()
+
+        self.input_details = self.model.get_input_details()
+        self.output_details = self.model.get_output_details()
 
     def after(self, cleanup=True):
         if cleanup:
@@ -50,18 +63,23 @@ class LowLight(Benchmark):
 
     def instances(self, limit=None):
         dataset = load_lowlight_dataset(
-            data_home=self.data_home, sample=self.use_sample,
+            data_home=self.data_home, sample=self.use_sample, extract=self.extract,
+            verify=self.verify,
         )
 
         def filter_instances(dataset):
             for instance in dataset:
-                if os.path.dirname(instance).endswith("low"):
+                if os.path.dirname(str(instance)).endswith("low"):
                     yield instance
 
         return limit_generator(filter_instances(dataset), limit)
 
     def preprocess(self, instance):
-        image = tf.io.read_file(instance)
+        if isinstance(instance, ArchiveMember):
+            image = instance.read()
+        else:
+            image = tf.io.read_file(instance)
+
         image = tf.image.decode_png(image, channels=3)
         image.set_shape([None, None, 3])
         image = tf.cast(image, dtype=tf.float32) / 255.0
@@ -73,3 +91,20 @@ class LowLight(Benchmark):
         self.model.set_tensor(self.input_details[0]["index"], instance)
         self.model.invoke()
         self.model.get_tensor(self.output_details[0]["index"])
+
+    def preprocess_batch(self, instances):
+        batch = np.concatenate([self.preprocess(instance) for instance in instances])
+
+        # The last batch may be smaller than the batch size; it is padded with blank
+        # images rather than resizing the interpreter so that reallocating tensors
+        # is not measured as inference (only the real instances are counted).
+        if batch.shape[0] < self.batch_size:
+            padding = np.zeros((self.batch_size - batch.shape[0], *batch.shape[1:]))
+            batch = np.concatenate([batch, padding.astype(batch.dtype)])
+        return batch
+
+    def inference_batch(self, batch):
+        return self.inference(batch)
+
+    def padded(self, size):
+        return size < self.batch_size
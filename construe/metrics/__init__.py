@@ -3,4 +3,8 @@ Collects benchmark metrics for output and display.
 """
 
 from .metrics import *
+from .sketch import Sketch
+from .histogram import Histogram
 from .serialize import *
+from .checkpoint import Checkpoint, read_checkpoint
+from .store import ResultsStore, get_results_db
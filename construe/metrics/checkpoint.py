@@ -0,0 +1,184 @@
+"""
+Append-only checkpoints of benchmark measurements written as runs complete.
+"""
+
+import os
+import json
+
+from .metrics import Measurement
+from .serialize import MetricsJSONEncoder, MetricsJSONDecoder
+from ..exceptions import BenchmarkError
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# The type of the first record of a checkpoint, which stores the runner config
+HEADER = "header"
+
+
+class Checkpoint(object):
+    """
+    Streams the measurements of each completed benchmark run to a JSON Lines file,
+    one run per line, flushing and syncing the file after every run so that if the
+    process crashes or is killed only the run in progress is lost. Because the file
+    is only ever appended to, a partially written final line is the worst possible
+    corruption and is ignored when the checkpoint is read.
+
+    If resume is True and the file exists, the completed runs are read so that the
+    runner can skip them and new runs are appended; otherwise the file is truncated.
+    The config of the runner (the options that affect the measurements) is written
+    in a header when the checkpoint is created; resuming a checkpoint whose config
+    differs raises an error so that incompatible measurements are not mixed.
+    """
+
+    def __init__(
+        self, path: str, resume: bool = False, config: Optional[Dict[str, Any]] = None
+    ):
+        self.path = path
+        self.resume = resume
+        self.config = _normalize(config or {})
+        self.records: List[Dict[str, Any]] = []
+
+        if resume and os.path.exists(path):
+            header, self.records = _read(path)
+            if header is not None:
+                self._check_config(header.get("config", {}))
+            elif self.records:
+                raise BenchmarkError(
+                    f"cannot resume checkpoint {path}: it has no config header"
+                )
+
+        self._fp = None
+
+    @property
+    def completed(self) -> Set[Tuple[str, int]]:
+        """
+        The (benchmark, run index) pairs of runs that completed without errors.
+        """
+        return {
+            (record["benchmark"], record["run"])
+            for record in self.records
+            if not record.get("errors")
+        }
+
+    @property
+    def measurements(self) -> List[Measurement]:
+        """
+        The measurements of the completed runs in the checkpoint.
+        """
+        return [
+            measurement
+            for record in self.records
+            if not record.get("errors")
+            for measurement in record.get("measurements", [])
+        ]
+
+    def open(self):
+        if self._fp is None:
+            self._fp = open(self.path, "a" if self.resume else "w")
+            if self.resume:
+                self._terminate_partial()
+
+            if self._fp.tell() == 0:
+                self._append({"type": HEADER, "config": self.config})
+        return self
+
+    def close(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def write(
+        self,
+        benchmark: str,
+        run: int,
+        measurements: Iterable[Measurement],
+        errors: Optional[List[str]] = None,
+    ):
+        """
+        Appends the record of a benchmark run and syncs it to disk.
+        """
+        if self._fp is None:
+            self.open()
+
+        record = {
+            "benchmark": benchmark,
+            "run": run,
+            "errors": errors or [],
+            "measurements": list(measurements),
+        }
+
+        self._append(record)
+        self.records.append(record)
+
+    def _append(self, record: Dict[str, Any]):
+        self._fp.write(json.dumps(record, cls=MetricsJSONEncoder) + "\n")
+        self._fp.flush()
+        os.fsync(self._fp.fileno())
+
+    def _check_config(self, recorded: Dict[str, Any]):
+        keys = sorted(set(recorded) | set(self.config))
+        changed = [key for key in keys if recorded.get(key) != self.config.get(key)]
+        if changed:
+            details = ", ".join(
+                f"{key} ({recorded.get(key)!r} != {self.config.get(key)!r})"
+                for key in changed
+            )
+            raise BenchmarkError(
+                f"cannot resume checkpoint {self.path} with a different config: "
+                f"{details}"
+            )
+
+    def _terminate_partial(self):
+        # Terminate a partially written line so the next record starts on its own line
+        if self._fp.tell() > 0:
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self._fp.write("\n")
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return f"<Checkpoint {self.path!r} runs={len(self.records)}>"
+
+
+def read_checkpoint(path: str) -> List[Dict[str, Any]]:
+    """
+    Reads the run records from a checkpoint file, skipping any partially written
+    lines (e.g. if the process was killed while writing a record).
+    """
+    return _read(path)[1]
+
+
+def _read(path: str) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+    # Returns the header and the run records of the checkpoint
+    header, records = None, []
+    decoder = MetricsJSONDecoder()
+
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                record = decoder.decode(line)
+            except json.JSONDecodeError:
+                continue
+
+            if record.get("type") == HEADER:
+                header = record
+            else:
+                records.append(record)
+
+    return header, records
+
+
+def _normalize(config: Dict[str, Any]) -> Dict[str, Any]:
+    # Round trip through JSON so the config compares equal to the recorded config
+    return json.loads(json.dumps(config, cls=MetricsJSONEncoder))
@@ -0,0 +1,207 @@
+"""
+Statistical comparison of the measurements of a baseline and candidate run.
+"""
+
+import math
+import dataclasses
+import numpy as np
+
+from .metrics import Metric, Measurement
+from ..exceptions import MetricsError
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Default thresholds for detecting a regression
+ALPHA = 0.05
+THRESHOLD = 0.05
+CONFIDENCE = 0.95
+N_BOOTSTRAP = 2000
+
+# Maximum number of resampled values held in memory at once while bootstrapping
+_BOOTSTRAP_CHUNK = 4_000_000
+
+
+@dataclasses.dataclass(init=True, repr=False, eq=True)
+class Comparison:
+    """
+    The comparison of a measurement in the baseline and candidate results. The
+    change is the relative change in the median of the candidate from the baseline
+    with a bootstrap confidence interval; the p-value is from a two-sided
+    Mann-Whitney U test. Both are None if either measurement has no raw samples.
+    """
+
+    metric: Metric
+    units: Optional[str]
+    baseline: float
+    candidate: float
+    change: float
+    ci_low: Optional[float] = None
+    ci_high: Optional[float] = None
+    p_value: Optional[float] = None
+    significant: bool = False
+    regression: bool = False
+    higher_is_better: bool = False
+
+    def dump(self) -> Dict:
+        data = dataclasses.asdict(self)
+        data["label"] = self.metric.label
+        data["sub_label"] = self.metric.sub_label
+        return data
+
+
+def higher_is_better(measurement: Measurement) -> bool:
+    """
+    Returns True if larger values of the measurement are an improvement (throughput
+    and efficiency), otherwise smaller values (latency and memory) are better.
+    """
+    units = measurement.units or ""
+    sub_label = measurement.metric.sub_label or ""
+    return units.endswith("/s") or sub_label.endswith(("efficiency", "knee"))
+
+
+def mann_whitney(x: Iterable[float], y: Iterable[float]) -> Tuple[float, float]:
+    """
+    Computes the Mann-Whitney U statistic of x and the two-sided p-value that the
+    samples come from the same distribution using the normal approximation with tie
+    and continuity corrections (appropriate for the sample sizes of benchmarks).
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n1, n2 = x.size, y.size
+    if not n1 or not n2:
+        raise ValueError("both samples must be non-empty")
+
+    # Average ranks of the pooled samples so that ties share a rank
+    values, inverse, counts = np.unique(
+        np.concatenate([x, y]), return_inverse=True, return_counts=True
+    )
+    ranks = (np.cumsum(counts) - (counts - 1) / 2)[inverse]
+
+    u = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    ties = (counts ** 3 - counts).sum()
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))) if n > 1 else 0
+
+    if sigma == 0:
+        return u.item(), 1.0
+
+    z = (abs(u - n1 * n2 / 2) - 0.5) / sigma
+    return u.item(), min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+
+def bootstrap_change(
+    baseline: Iterable[float],
+    candidate: Iterable[float],
+    n_bootstrap: int = N_BOOTSTRAP,
+    confidence: float = CONFIDENCE,
+    seed: Optional[int] = None,
+) -> Tuple[float, float]:
+    """
+    Returns the percentile bootstrap confidence interval of the relative change in
+    the median of the candidate from the baseline by resampling both with
+    replacement; resamples are drawn in vectorized chunks to bound memory.
+    """
+    baseline = np.asarray(baseline, dtype=np.float64)
+    candidate = np.asarray(candidate, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+
+    changes = []
+    chunk = max(1, _BOOTSTRAP_CHUNK // max(baseline.size, candidate.size))
+    for start in range(0, n_bootstrap, chunk):
+        size = min(chunk, n_bootstrap - start)
+        base = np.median(rng.choice(baseline, (size, baseline.size)), axis=1)
+        cand = np.median(rng.choice(candidate, (size, candidate.size)), axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            changes.append((cand - base) / base)
+
+    changes = np.concatenate(changes)
+    changes = changes[np.isfinite(changes)]
+    if not changes.size:
+        return math.nan, math.nan
+
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(changes, [tail, 100 - tail])
+    return low.item(), high.item()
+
+
+def compare_measurements(
+    baseline: Measurement,
+    candidate: Measurement,
+    threshold: float = THRESHOLD,
+    alpha: float = ALPHA,
+    n_bootstrap: int = N_BOOTSTRAP,
+    confidence: float = CONFIDENCE,
+    seed: Optional[int] = None,
+) -> Comparison:
+    """
+    Compares a candidate measurement to the baseline. The change is significant if
+    the Mann-Whitney p-value is below alpha and the confidence interval of the
+    change excludes zero; it is a regression if it is significant and the change is
+    worse than the threshold (e.g. 0.05 is 5% slower or 5% less throughput).
+    """
+    higher = higher_is_better(baseline)
+    base, cand = baseline.median, candidate.median
+    change = (cand - base) / base if base else math.nan
+
+    comparison = Comparison(
+        metric=baseline.metric,
+        units=baseline.units,
+        baseline=base,
+        candidate=cand,
+        change=change,
+        higher_is_better=higher,
+    )
+
+    # Statistical tests require the raw samples of both measurements
+    if not baseline.raw_metrics.size or not candidate.raw_metrics.size:
+        return comparison
+
+    _, comparison.p_value = mann_whitney(baseline.metrics, candidate.metrics)
+    comparison.ci_low, comparison.ci_high = bootstrap_change(
+        baseline.metrics, candidate.metrics, n_bootstrap, confidence, seed
+    )
+
+    comparison.significant = bool(
+        comparison.p_value < alpha
+        and (comparison.ci_low > 0 or comparison.ci_high < 0)
+    )
+
+    worse = -change if higher else change
+    comparison.regression = comparison.significant and worse > threshold
+    return comparison
+
+
+def compare(
+    baseline: Iterable[Measurement], candidate: Iterable[Measurement], **kwargs
+) -> List[Comparison]:
+    """
+    Aligns the baseline and candidate measurements by benchmark label and sub label
+    (env and device are ignored so that different hardware can be compared) and
+    compares each pair; measurements that are only in one set are skipped. Raises
+    a MetricsError if a set has more than one measurement with the same label and
+    sub label (e.g. results from multiple environments) since they cannot be
+    aligned. The kwargs are passed to compare_measurements.
+    """
+    baseline = _align(baseline, "baseline")
+    candidate = _align(candidate, "candidate")
+
+    return [
+        compare_measurements(baseline[k], candidate[k], **kwargs)
+        for k in baseline
+        if k in candidate
+    ]
+
+
+def _align(measurements: Iterable[Measurement], name: str) -> Dict[Tuple, Measurement]:
+    aligned = {}
+    for m in Measurement.merge(measurements):
+        key = (m.metric.label, m.metric.sub_label)
+        if key in aligned:
+            raise MetricsError(
+                f"the {name} has multiple {key[0]} {key[1]} measurements (e.g. from "
+                "different environments, devices or descriptions) that cannot be "
+                "compared; compare the results of each separately"
+            )
+        aligned[key] = m
+    return aligned
@@ -0,0 +1,134 @@
+"""
+A log-bucketed histogram of measurements similar to an HDR histogram.
+"""
+
+import numpy as np
+
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# Each power of two range of values is divided into this many linear sub-buckets so
+# the relative error of any value reconstructed from the histogram is below 1/128.
+SUB_BUCKETS = 128
+
+
+class Histogram(object):
+    """
+    A sparse histogram of positive values where bucket boundaries are determined by
+    the value alone (not the data) so that histograms with the same number of
+    sub-buckets can be merged by adding counts. Each power of two is divided into
+    linear sub-buckets, bounding the relative error of each bucket while covering
+    any range of values from nanoseconds to hours (or bytes to gigabytes) in a small
+    number of buckets. Values less than or equal to zero are counted separately.
+    """
+
+    def __init__(self, sub_buckets: int = SUB_BUCKETS):
+        if sub_buckets < 1:
+            raise ValueError("histogram requires at least one sub-bucket")
+
+        self.sub_buckets = sub_buckets
+        self.counts = Counter()
+        self.zeros = 0
+
+    @classmethod
+    def from_values(
+        cls, values: Iterable[float], sub_buckets: int = SUB_BUCKETS
+    ) -> "Histogram":
+        hist = cls(sub_buckets=sub_buckets)
+        hist.update(values)
+        return hist
+
+    def update(self, values: Iterable[float]):
+        """
+        Add the values to the histogram using vectorized bucket index computation.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        positive = values[values > 0]
+        self.zeros += values.size - positive.size
+
+        if positive.size:
+            indices, counts = np.unique(self._index(positive), return_counts=True)
+            for idx, count in zip(indices.tolist(), counts.tolist()):
+                self.counts[idx] += count
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        """
+        Returns a new histogram with the counts of both histograms.
+        """
+        if other.sub_buckets != self.sub_buckets:
+            raise ValueError("cannot merge histograms with different sub-buckets")
+
+        merged = Histogram(sub_buckets=self.sub_buckets)
+        merged.counts = self.counts + other.counts
+        merged.zeros = self.zeros + other.zeros
+        return merged
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values()) + self.zeros
+
+    def buckets(self) -> List[Tuple[float, float, int]]:
+        """
+        Returns the (lower, upper, count) of each non-empty bucket in value order;
+        values less than or equal to zero are reported in a (0, 0, count) bucket.
+        """
+        buckets = [(0.0, 0.0, self.zeros)] if self.zeros else []
+        for idx in sorted(self.counts):
+            buckets.append(self._bounds(idx) + (self.counts[idx],))
+        return buckets
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates the q-th quantile as the midpoint of the bucket that contains it.
+        """
+        total = self.total
+        if not total:
+            return None
+
+        rank = q * (total - 1)
+        seen = 0
+        for lower, upper, count in self.buckets():
+            seen += count
+            if seen > rank:
+                return (lower + upper) / 2
+        return upper
+
+    def dump(self) -> Dict[str, Any]:
+        return {
+            "sub_buckets": self.sub_buckets,
+            "zeros": self.zeros,
+            "buckets": [[idx, self.counts[idx]] for idx in sorted(self.counts)],
+        }
+
+    @classmethod
+    def load(cls, data: Dict[str, Any]) -> "Histogram":
+        hist = cls(sub_buckets=data.get("sub_buckets", SUB_BUCKETS))
+        hist.zeros = data.get("zeros", 0)
+        hist.counts = Counter({int(idx): count for idx, count in data.get("buckets", [])})
+        return hist
+
+    def _index(self, values: np.ndarray) -> np.ndarray:
+        # values = mantissa * 2**exponent where mantissa is in [0.5, 1)
+        mantissa, exponent = np.frexp(values)
+        sub = np.floor((mantissa - 0.5) * 2 * self.sub_buckets).astype(np.int64)
+        return exponent.astype(np.int64) * self.sub_buckets + sub
+
+    def _bounds(self, idx: int) -> Tuple[float, float]:
+        exponent, sub = divmod(idx, self.sub_buckets)
+        scale = 2.0 ** exponent
+        width = 1 / (2 * self.sub_buckets)
+        lower = scale * (0.5 + sub * width)
+        return lower, lower + scale * width
+
+    def __eq__(self, other):
+        if not isinstance(other, Histogram):
+            return NotImplemented
+        return (
+            self.sub_buckets == other.sub_buckets
+            and self.zeros == other.zeros
+            and self.counts == other.counts
+        )
+
+    def __repr__(self):
+        return f"<Histogram total={self.total} buckets={len(self.counts)}>"
@@ -8,6 +8,8 @@ import numpy as np
 import dataclasses
 
 from collections import defaultdict
+from .sketch import Sketch
+from .histogram import Histogram
 from typing import cast, Optional, Any, Iterable, Dict, List, Tuple
 
 
@@ -56,30 +58,67 @@ class Metric:
 _TASKSPEC_FIELDS = tuple(i.name for i in dataclasses.fields(Metric))
 
 
-@dataclasses.dataclass(init=True, repr=False)
+# Percentiles computed in a single vectorized pass over the metrics
+_PERCENTILES = np.array([25, 50, 75, 90, 95, 99, 99.9], dtype=np.float64)
+
+
+@dataclasses.dataclass(init=True, repr=False, eq=False)
 class Measurement:
     """
     The result of a benchmark measurement.
 
     This class stores one or more measurements of a given statement. It is similar to
     the pytorch measurement and provides convienence methods and serialization.
+
+    The raw metrics are stored as a float64 array and the per-run metrics and
+    statistics are computed once, on demand, using vectorized operations.
+
+    The raw metrics may also be given as a callable that returns the array, in
+    which case they are not loaded until first accessed (e.g. when reading a
+    binary result file).
+
+    For very long runs a measurement can be backed by a fixed-memory quantile sketch
+    of the per-run metrics instead of the raw metrics; if there are no raw metrics,
+    the statistics of the measurement are estimated from the sketch.
     """
 
     metric: Metric
-    raw_metrics: List[float]
+    raw_metrics: np.ndarray
     per_run: int = 1
     units: Optional[str] = None
     metadata: Optional[Dict[Any, Any]] = None
+    sketch: Optional[Sketch] = None
 
     def __post_init__(self) -> None:
-        self._sorted_metrics: Tuple[float, ...] = ()
+        if callable(self.raw_metrics):
+            # Deferred until the raw metrics are first accessed (see __getattr__)
+            self._load_raw_metrics = self.raw_metrics
+            del self.raw_metrics
+        else:
+            self.raw_metrics = np.asarray(self.raw_metrics, dtype=np.float64).ravel()
+        self._metrics: Optional[np.ndarray] = None
+        self._computed: bool = False
         self._warnings: Tuple[str, ...] = ()
         self._median: float = -1.0
         self._mean: float = -1.0
         self._p25: float = -1.0
         self._p75: float = -1.0
+        self._p90: float = -1.0
+        self._p95: float = -1.0
+        self._p99: float = -1.0
+        self._p999: float = -1.0
+        self._min: float = -1.0
+        self._max: float = -1.0
+        self._stddev: float = -1.0
+        self._histogram: Optional[Histogram] = None
 
     def __getattr__(self, name: str) -> Any:
+        # Lazily load the raw metrics from a binary result file on first access.
+        if name == "raw_metrics" and "_load_raw_metrics" in self.__dict__:
+            loader = self.__dict__.pop("_load_raw_metrics")
+            self.raw_metrics = np.asarray(loader(), dtype=np.float64).ravel()
+            return self.raw_metrics
+
         # Forward Metric fields for convenience.
         if name in _TASKSPEC_FIELDS:
             return getattr(self.task_spec, name)
@@ -89,29 +128,85 @@ class Measurement:
         """
         Comptues the internal stats for the measurements if not already computed.
         """
-        if self.raw_metrics and not self._sorted_metrics:
-            self._sorted_metrics = tuple(sorted(self.metrics))
-            _metrics = np.array(self._sorted_metrics, dtype=np.float64)
-            self._median = np.quantile(_metrics, 0.5).item()
-            self._mean = _metrics.mean()
-            self._p25 = np.quantile(_metrics, 0.25).item()
-            self._p75 = np.quantile(_metrics, 0.75).item()
-
-            if not self.meets_confidence(_IQR_GROSS_WARN_THRESHOLD):
-                self.__add_warning("This suggests significant environmental influence.")
-            elif not self.meets_confidence(_IQR_WARN_THRESHOLD):
-                self.__add_warning("This could indicate system fluctuation.")
+        if self._computed:
+            return
+
+        if self.raw_metrics.size:
+            self._computed = True
+            # np.percentile partitions rather than sorts the metrics
+            _metrics = self.metrics
+            (
+                self._p25, self._median, self._p75, self._p90,
+                self._p95, self._p99, self._p999,
+            ) = np.percentile(_metrics, _PERCENTILES).tolist()
+            self._mean = _metrics.mean().item()
+            self._min = _metrics.min().item()
+            self._max = _metrics.max().item()
+            self._stddev = _metrics.std().item()
+            self.__check_confidence()
+
+        elif self.is_sketched:
+            self._computed = True
+            self._median = self.sketch.quantile(0.5)
+            self._mean = self.sketch.mean
+            self._p25 = self.sketch.quantile(0.25)
+            self._p75 = self.sketch.quantile(0.75)
+            self._p90 = self.sketch.quantile(0.90)
+            self._p95 = self.sketch.quantile(0.95)
+            self._p99 = self.sketch.quantile(0.99)
+            self._p999 = self.sketch.quantile(0.999)
+            self._min = self.sketch.min
+            self._max = self.sketch.max
+            self._stddev = self.sketch.stddev
+            self.__check_confidence()
+
+    def __check_confidence(self) -> None:
+        if not self.meets_confidence(_IQR_GROSS_WARN_THRESHOLD):
+            self.__add_warning("This suggests significant environmental influence.")
+        elif not self.meets_confidence(_IQR_WARN_THRESHOLD):
+            self.__add_warning("This could indicate system fluctuation.")
 
     def __add_warning(self, msg: str) -> None:
-        riqr = self.iqr / self.median * 100
+        riqr = self.iqr / self.median * 100 if self.median else float("inf")
         self._warnings += (
             f"  WARNING: Interquartile range is {riqr:.1f}% "
             f"of the median measurement.\n           {msg}",
         )
 
     @property
-    def metrics(self) -> List[float]:
-        return [m / self.per_run for m in self.raw_metrics]
+    def metrics(self) -> np.ndarray:
+        """
+        The per-run metrics as a read-only float64 array.
+        """
+        if self._metrics is None:
+            metrics = self.raw_metrics
+            if self.per_run != 1:
+                metrics = metrics / self.per_run
+            else:
+                metrics = metrics.view()
+            metrics.flags.writeable = False
+            self._metrics = metrics
+        return self._metrics
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        False if the raw metrics are deferred and have not yet been accessed.
+        """
+        return "_load_raw_metrics" not in self.__dict__
+
+    @property
+    def count(self) -> int:
+        if self.is_sketched:
+            return self.sketch.count
+        return self.raw_metrics.size
+
+    @property
+    def is_sketched(self) -> bool:
+        """
+        True if the statistics of the measurement are estimated from the sketch.
+        """
+        return not self.raw_metrics.size and self.sketch is not None
 
     @property
     def median(self) -> float:
@@ -128,6 +223,84 @@ class Measurement:
         self._compute_stats()
         return self._p75 - self._p25
 
+    @property
+    def p25(self) -> float:
+        self._compute_stats()
+        return self._p25
+
+    @property
+    def p75(self) -> float:
+        self._compute_stats()
+        return self._p75
+
+    @property
+    def p90(self) -> float:
+        self._compute_stats()
+        return self._p90
+
+    @property
+    def p95(self) -> float:
+        self._compute_stats()
+        return self._p95
+
+    @property
+    def p99(self) -> float:
+        self._compute_stats()
+        return self._p99
+
+    @property
+    def p999(self) -> float:
+        self._compute_stats()
+        return self._p999
+
+    @property
+    def min(self) -> float:
+        self._compute_stats()
+        return self._min
+
+    @property
+    def max(self) -> float:
+        self._compute_stats()
+        return self._max
+
+    @property
+    def stddev(self) -> float:
+        self._compute_stats()
+        return self._stddev
+
+    @property
+    def histogram(self) -> Optional[Histogram]:
+        """
+        A log-bucketed histogram of the metrics that can be merged with the
+        histograms of other measurements (None if the measurement is sketched).
+        """
+        if self.is_sketched:
+            return None
+
+        if self._histogram is None:
+            self._histogram = Histogram.from_values(self.metrics)
+        return self._histogram
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        Summary statistics of the measurement for reporting and serialization.
+        """
+        return {
+            "n": self.count,
+            "mean": self.mean,
+            "stddev": self.stddev,
+            "min": self.min,
+            "p25": self.p25,
+            "median": self.median,
+            "p75": self.p75,
+            "p90": self.p90,
+            "p95": self.p95,
+            "p99": self.p99,
+            "p999": self.p999,
+            "max": self.max,
+        }
+
     @property
     def has_warnings(self) -> bool:
         self._compute_stats()
@@ -146,30 +319,95 @@ class Measurement:
         return self.sub_label or "[Unknown]"
 
     def meets_confidence(self, threshold: float = _IQR_WARN_THRESHOLD) -> bool:
+        if self.median == 0:
+            return self.iqr == 0
         return self.iqr / self.median < threshold
 
-    def to_array(self):
-        return np.array(self.metrics, dtype=np.float64)
+    def to_array(self) -> np.ndarray:
+        return self.metrics.copy()
+
+    def to_sketch(self) -> Sketch:
+        """
+        Returns a sketch of the per-run metrics, using the measurement's sketch if it
+        does not have raw metrics.
+        """
+        if self.is_sketched:
+            return self.sketch
+        return Sketch.from_values(self.metrics)
+
+    def dump(self) -> Dict[str, Any]:
+        """
+        Returns the measurement fields for serialization along with the summary
+        statistics and histogram; these are derived from the raw metrics so they
+        are ignored when the measurement is loaded.
+        """
+        data = {f.name: getattr(self, f.name) for f in dataclasses.fields(self)}
+        if self.raw_metrics.size:
+            data["stats"] = self.stats
+            data["histogram"] = self.histogram.dump()
+        elif self.is_sketched:
+            data["stats"] = self.stats
+        return data
+
+    @classmethod
+    def load(cls, data: Dict[str, Any]) -> "Measurement":
+        data = dict(data)
+        data.pop("stats", None)
+        data.pop("histogram", None)
+
+        if isinstance(data.get("metric"), dict):
+            data["metric"] = Metric(**data["metric"])
+        if isinstance(data.get("sketch"), dict):
+            data["sketch"] = Sketch.load(data["sketch"])
+        return cls(**data)
+
+    def __eq__(self, other):
+        if not isinstance(other, Measurement):
+            return NotImplemented
+        return (
+            self.metric == other.metric
+            and np.array_equal(self.raw_metrics, other.raw_metrics)
+            and self.per_run == other.per_run
+            and self.units == other.units
+            and self.metadata == other.metadata
+            and self.sketch == other.sketch
+        )
 
     @staticmethod
     def merge(measurements: Iterable["Measurement"]) -> List["Measurement"]:
         """
         Merge measurement replicas into a single measurement.
 
-        This method will extrapolate per_run=1 and will not transfer metadata.
+        This method will extrapolate per_run=1 and will not transfer metadata; the
+        units of the first measurement in each group are retained. If any of the
+        measurements in a group are sketched, the group is merged into a sketched
+        measurement by merging the sketches of all the measurements.
         """
         groups = defaultdict(list)
         for m in measurements:
             groups[m.metric].append(m)
 
         def merge_group(metric: Metric, group: List["Measurement"]) -> "Measurement":
-            metrics: List[float] = []
-            for m in group:
-                metrics.extend(m.metrics)
+            if any(m.is_sketched for m in group):
+                sketch = group[0].to_sketch()
+                for m in group[1:]:
+                    sketch = sketch.merge(m.to_sketch())
+
+                return Measurement(
+                    per_run=1,
+                    raw_metrics=[],
+                    units=group[0].units,
+                    metric=metric,
+                    metadata=None,
+                    sketch=sketch,
+                )
+
+            metrics = np.concatenate([m.metrics for m in group])
 
             return Measurement(
                 per_run=1,
                 raw_metrics=metrics,
+                units=group[0].units,
                 metric=metric,
                 metadata=None
             )
@@ -2,14 +2,28 @@
 Handles serialization and deserialization of metrics.
 """
 
+import io
+import os
 import json
+import zipfile
+import contextlib
 import dataclasses
+import numpy as np
 
 from functools import partial
 
+from .sketch import Sketch
 from .metrics import Metric, Measurement
 
 
+# Binary results are zip archives (readable with np.load) that store the results
+# document as JSON in RESULTS_MEMBER and the raw metrics as float64 .npy members.
+RESULTS_MEMBER = "results.json"
+ARRAYS_PREFIX = "arrays/"
+ZIP_MAGIC = b"PK\x03\x04"
+BINARY_EXT = ".npz"
+
+
 class MetricsJSONEncoder(json.JSONEncoder):
 
     def default(self, o):
@@ -19,13 +33,22 @@ class MetricsJSONEncoder(json.JSONEncoder):
         JSON serialization of primitive types.
         """
 
+        # Checked first since numpy arrays also have a dump method (to a file)
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+
+        if isinstance(o, np.generic):
+            return o.item()
+
         if hasattr(o, "dump"):
             data = o.dump()
             data["type"] = o.__class__.__name__
             return data
 
+        # Nested values are encoded by the encoder rather than dataclasses.asdict so
+        # that nested measurements are dumped with their type and statistics.
         if dataclasses.is_dataclass(o):
-            data = dataclasses.asdict(o)
+            data = {f.name: getattr(o, f.name) for f in dataclasses.fields(o)}
             data["type"] = o.__class__.__name__
             return data
 
@@ -37,10 +60,11 @@ class MetricsJSONDecoder(json.JSONDecoder):
     classmap = {
         Metric.__name__: Metric,
         Measurement.__name__: Measurement,
+        Sketch.__name__: Sketch,
     }
 
     def __init__(self, *args, **kwargs):
-        if not kwargs.get("object_hook", None) is None:
+        if kwargs.get("object_hook", None) is None:
             kwargs["object_hook"] = self.object_hook
         super(MetricsJSONDecoder, self).__init__(*args, **kwargs)
 
@@ -54,8 +78,139 @@ class MetricsJSONDecoder(json.JSONDecoder):
         return data
 
 
+class MetricsBinaryEncoder(MetricsJSONEncoder):
+    """
+    Encodes the results document as JSON but replaces the raw metrics of each
+    measurement with a reference to an array that is collected on the encoder so
+    that it can be written to the archive in binary rather than as text.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(MetricsBinaryEncoder, self).__init__(*args, **kwargs)
+        self.arrays = {}
+
+    def default(self, o):
+        if isinstance(o, Measurement):
+            data = o.dump()
+            data["type"] = o.__class__.__name__
+
+            name = f"{ARRAYS_PREFIX}{len(self.arrays)}"
+            self.arrays[name] = np.asarray(o.raw_metrics, dtype=np.float64)
+            data["raw_metrics"] = {"type": "ndarray", "name": name}
+            return data
+
+        return super(MetricsBinaryEncoder, self).default(o)
+
+
+class MetricsBinaryDecoder(MetricsJSONDecoder):
+    """
+    Decodes the results document of a binary archive, resolving array references
+    to loaders that read the array from the archive when called.
+    """
+
+    def __init__(self, archive, *args, lazy: bool = True, **kwargs):
+        self.archive = archive
+        self.lazy = lazy
+        super(MetricsBinaryDecoder, self).__init__(*args, **kwargs)
+
+    def object_hook(self, data):
+        if data.get("type") == "ndarray" and "name" in data:
+            loader = partial(self.read, data["name"])
+            return loader if self.lazy else loader()
+        return super(MetricsBinaryDecoder, self).object_hook(data)
+
+    def read(self, name):
+        if self.archive.zip is None:
+            raise ValueError(f"cannot read {name}: the results archive is closed")
+        return self.archive[name]
+
+
+def dump_binary(obj, fp, compress: bool = False):
+    """
+    Writes the object to a binary zip archive at the path or binary file object.
+    Raw metrics are stored uncompressed by default since timings compress poorly
+    and stored members can be read without decompression.
+    """
+    encoder = MetricsBinaryEncoder()
+    document = encoder.encode(obj)
+
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zipfile.ZipFile(fp, mode="w", compression=compression) as archive:
+        archive.writestr(RESULTS_MEMBER, document)
+        for name, array in encoder.arrays.items():
+            with archive.open(name + ".npy", mode="w", force_zip64=True) as f:
+                np.lib.format.write_array(f, array, allow_pickle=False)
+
+
+def load_binary(fp):
+    """
+    Reads an object from a binary zip archive at the path or binary file object,
+    reading all raw metrics and closing the archive. Use open_results to only read
+    the raw metrics that are accessed.
+    """
+    with np.load(fp, allow_pickle=False) as archive:
+        return _decode_binary(archive, lazy=False)
+
+
+@contextlib.contextmanager
+def open_results(fp):
+    """
+    Context manager that loads results from a path or file object. The raw metrics
+    of the measurements in a binary archive are only read from the archive when
+    they are first accessed and the archive is closed on exit, after which raw
+    metrics that were not accessed can no longer be read. JSON results are loaded
+    entirely on entry.
+
+    Usage::
+
+        with open_results("results.npz") as results:
+            p99 = results["measurements"][0].p99
+    """
+    if not is_binary(fp):
+        yield load(fp)
+        return
+
+    with np.load(fp, allow_pickle=False) as archive:
+        yield _decode_binary(archive, lazy=True)
+
+
+def _decode_binary(archive, lazy):
+    decoder = MetricsBinaryDecoder(archive, lazy=lazy)
+    return decoder.decode(archive.zip.read(RESULTS_MEMBER).decode("utf-8"))
+
+
+def is_binary(fp) -> bool:
+    """
+    Returns True if the path or file object is a binary result archive.
+    """
+    if isinstance(fp, (str, os.PathLike)):
+        with open(fp, "rb") as f:
+            return f.read(len(ZIP_MAGIC)) == ZIP_MAGIC
+
+    if isinstance(fp, io.TextIOBase):
+        return False
+
+    pos = fp.tell()
+    magic = fp.read(len(ZIP_MAGIC))
+    fp.seek(pos)
+    return magic == ZIP_MAGIC
+
+
+def load(fp, **kwargs):
+    """
+    Loads results from a path or file object, detecting whether it is a binary
+    archive or JSON; the kwargs are passed to json.load for JSON results.
+    """
+    if is_binary(fp):
+        return load_binary(fp)
+
+    if isinstance(fp, (str, os.PathLike)):
+        with open(fp, "r") as f:
+            return json.load(f, cls=MetricsJSONDecoder, **kwargs)
+    return json.load(fp, cls=MetricsJSONDecoder, **kwargs)
+
+
 # JSON Serialization
 dump = partial(json.dump, cls=MetricsJSONEncoder)
 dumps = partial(json.dumps, cls=MetricsJSONEncoder)
-load = partial(json.load, cls=MetricsJSONDecoder)
 loads = partial(json.loads, cls=MetricsJSONDecoder)
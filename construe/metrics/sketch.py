@@ -0,0 +1,199 @@
+"""
+A fixed-memory, mergeable quantile sketch for very long benchmark runs.
+
+This module is based on the DDSketch algorithm, see https://arxiv.org/abs/1908.10693
+"""
+
+import math
+import numpy as np
+
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional
+
+
+# Quantiles estimated by the sketch are within this relative error of the true value
+RELATIVE_ACCURACY = 0.01
+
+# Maximum number of bins to store; at 1% accuracy 2048 bins cover values spanning
+# more than 17 orders of magnitude so collapsing is rare for latency and memory.
+MAX_BINS = 2048
+
+
+class Sketch(object):
+    """
+    A DDSketch quantile sketch that stores counts of values in logarithmically sized
+    bins such that any quantile is estimated within the relative accuracy of the true
+    value. The memory used by the sketch is bounded by max_bins regardless of how
+    many values are added; if the bound is reached, the lowest bins are collapsed
+    which only affects the accuracy of the lowest quantiles (tail latencies are
+    preserved). Sketches with the same relative accuracy are merged by adding bin
+    counts, so sketches from many runs can be combined without the raw samples.
+
+    The count, sum, sum of squares, min and max are tracked exactly so the mean,
+    standard deviation and extrema are not approximated. Values less than or equal
+    to zero are counted in a separate zero bin.
+    """
+
+    def __init__(
+        self, relative_accuracy: float = RELATIVE_ACCURACY, max_bins: int = MAX_BINS
+    ):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative accuracy must be between 0 and 1")
+        if max_bins < 1:
+            raise ValueError("sketch requires at least one bin")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+
+        self.bins = Counter()
+        self.zeros = 0
+        self.count = 0
+        self.sum = 0.0
+        self.sumsq = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @classmethod
+    def from_values(cls, values: Iterable[float], **kwargs) -> "Sketch":
+        sketch = cls(**kwargs)
+        sketch.update(values)
+        return sketch
+
+    def add(self, value: float):
+        """
+        Add a single value to the sketch.
+        """
+        self.count += 1
+        self.sum += value
+        self.sumsq += value * value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        if value <= 0:
+            self.zeros += 1
+        else:
+            self.bins[math.ceil(math.log(value) / self._log_gamma)] += 1
+            self._collapse()
+
+    def update(self, values: Iterable[float]):
+        """
+        Add many values to the sketch using vectorized bin index computation.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if not values.size:
+            return
+
+        self.count += values.size
+        self.sum += values.sum().item()
+        self.sumsq += np.dot(values, values).item()
+        self.min = min(self.min, values.min().item())
+        self.max = max(self.max, values.max().item())
+
+        positive = values[values > 0]
+        self.zeros += values.size - positive.size
+        if positive.size:
+            indices = np.ceil(np.log(positive) / self._log_gamma).astype(np.int64)
+            indices, counts = np.unique(indices, return_counts=True)
+            for idx, count in zip(indices.tolist(), counts.tolist()):
+                self.bins[idx] += count
+            self._collapse()
+
+    def merge(self, other: "Sketch") -> "Sketch":
+        """
+        Returns a new sketch containing the values of both sketches.
+        """
+        if not math.isclose(self.relative_accuracy, other.relative_accuracy):
+            raise ValueError("cannot merge sketches with different accuracies")
+
+        merged = Sketch(self.relative_accuracy, max(self.max_bins, other.max_bins))
+        merged.bins = self.bins + other.bins
+        merged.zeros = self.zeros + other.zeros
+        merged.count = self.count + other.count
+        merged.sum = self.sum + other.sum
+        merged.sumsq = self.sumsq + other.sumsq
+        merged.min = min(self.min, other.min)
+        merged.max = max(self.max, other.max)
+        merged._collapse()
+        return merged
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates the q-th quantile of the values added to the sketch.
+        """
+        if not self.count:
+            return None
+
+        rank = q * (self.count - 1)
+        if rank < self.zeros:
+            return min(max(0.0, self.min), self.max)
+
+        seen = self.zeros
+        for idx in sorted(self.bins):
+            seen += self.bins[idx]
+            if seen > rank:
+                value = 2 * self.gamma ** idx / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> Optional[float]:
+        if not self.count:
+            return None
+        return self.sum / self.count
+
+    @property
+    def stddev(self) -> Optional[float]:
+        if not self.count:
+            return None
+        variance = self.sumsq / self.count - self.mean ** 2
+        return math.sqrt(max(variance, 0.0))
+
+    def dump(self) -> Dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "count": self.count,
+            "sum": self.sum,
+            "sumsq": self.sumsq,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "zeros": self.zeros,
+            "bins": [[idx, self.bins[idx]] for idx in sorted(self.bins)],
+        }
+
+    @classmethod
+    def load(cls, data: Dict[str, Any]) -> "Sketch":
+        sketch = cls(
+            relative_accuracy=data.get("relative_accuracy", RELATIVE_ACCURACY),
+            max_bins=data.get("max_bins", MAX_BINS),
+        )
+        sketch.count = data.get("count", 0)
+        sketch.sum = data.get("sum", 0.0)
+        sketch.sumsq = data.get("sumsq", 0.0)
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        sketch.zeros = data.get("zeros", 0)
+        sketch.bins = Counter({int(idx): count for idx, count in data.get("bins", [])})
+        return sketch
+
+    def _collapse(self):
+        # Merge the lowest bins into the next lowest until within the bin limit
+        excess = len(self.bins) - self.max_bins
+        if excess <= 0:
+            return
+
+        indices = sorted(self.bins)
+        target = indices[excess]
+        for idx in indices[:excess]:
+            self.bins[target] += self.bins.pop(idx)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sketch):
+            return NotImplemented
+        return self.dump() == other.dump()
+
+    def __repr__(self):
+        return f"<Sketch count={self.count} bins={len(self.bins)}>"
@@ -0,0 +1,319 @@
+"""
+A local SQLite database of benchmark results for querying across environments.
+"""
+
+import os
+import json
+import sqlite3
+import dataclasses
+import numpy as np
+
+from .sketch import Sketch
+from .serialize import load, MetricsJSONEncoder
+from .metrics import Metric, Measurement
+
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# Default path to the results database, can be set with $CONSTRUE_RESULTS_DB
+RESULTS_DB = "construe-results.db"
+
+# Columns that measurements can be compared by
+COMPARE_BY = ("env", "device", "version")
+
+# Summary statistics of each measurement stored in the database
+STATS = (
+    "count", "median", "mean", "p25", "p75", "p90", "p95", "p99", "p999",
+    "min", "max", "stddev",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    env TEXT,
+    device TEXT,
+    version TEXT,
+    started TEXT NOT NULL,
+    duration REAL,
+    n_runs INTEGER,
+    instance_limit INTEGER,
+    successes INTEGER,
+    failures INTEGER,
+    options TEXT,
+    source TEXT,
+    ingested TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS measurements (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    result_id INTEGER NOT NULL REFERENCES results(id) ON DELETE CASCADE,
+    env TEXT,
+    device TEXT,
+    version TEXT,
+    started TEXT NOT NULL,
+    label TEXT,
+    sub_label TEXT,
+    description TEXT,
+    units TEXT,
+    count INTEGER,
+    median REAL,
+    mean REAL,
+    p25 REAL,
+    p75 REAL,
+    p90 REAL,
+    p95 REAL,
+    p99 REAL,
+    p999 REAL,
+    min REAL,
+    max REAL,
+    stddev REAL,
+    samples BLOB,
+    sketch TEXT
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS results_run_idx
+    ON results (IFNULL(env, ''), IFNULL(device, ''), started);
+CREATE INDEX IF NOT EXISTS measurements_series_idx
+    ON measurements (label COLLATE NOCASE, sub_label COLLATE NOCASE, env, device, started);
+CREATE INDEX IF NOT EXISTS measurements_env_idx ON measurements (env, started);
+CREATE INDEX IF NOT EXISTS measurements_device_idx ON measurements (device, started);
+CREATE INDEX IF NOT EXISTS measurements_version_idx ON measurements (version, started);
+CREATE INDEX IF NOT EXISTS measurements_result_idx ON measurements (result_id);
+"""
+
+
+def get_results_db(path: Optional[str] = None) -> str:
+    """
+    Return the path to the results database, which by default is in the current
+    working directory alongside the results files but can be set by the
+    ``$CONSTRUE_RESULTS_DB`` environment variable or by giving a path.
+    """
+    if path is None:
+        path = os.environ.get("CONSTRUE_RESULTS_DB", RESULTS_DB)
+
+    path = os.path.expanduser(path)
+    path = os.path.expandvars(path)
+    return path
+
+
+class ResultsStore(object):
+    """
+    Stores the summary statistics of the measurements in benchmark results files in
+    a SQLite database indexed by the benchmark label and sub label, environment,
+    device, construe version and start time of the run so that measurements can be
+    queried across many results files without loading and parsing each file. The
+    per-run samples (or the quantile sketch of sketch-only measurements) are also
+    stored so that the original measurement can be reconstructed.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = get_results_db(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def ingest(self, path: str) -> Optional[int]:
+        """
+        Loads a JSON or binary results file and adds it to the store. Returns the
+        id of the results or None if the results have already been ingested.
+        """
+        return self.add(load(path), source=os.path.abspath(path))
+
+    def add(self, results: Any, source: Optional[str] = None) -> Optional[int]:
+        """
+        Adds results (either a Results dataclass or results loaded from a file) to
+        the store in a single transaction. Returns the id of the results or None if
+        results with the same env, device and start time already exist.
+        """
+        if dataclasses.is_dataclass(results):
+            results = {f.name: getattr(results, f.name) for f in dataclasses.fields(results)}
+
+        env, device = results.get("env"), results.get("device")
+        version, started = results.get("version"), results["started"]
+
+        with self.conn:
+            cursor = self.conn.execute(
+                (
+                    "INSERT OR IGNORE INTO results (env, device, version, started, "
+                    "duration, n_runs, instance_limit, successes, failures, options, "
+                    "source) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                ),
+                (
+                    env, device, version, started, results.get("duration"),
+                    results.get("n_runs"), results.get("limit"),
+                    results.get("successes"), results.get("failures"),
+                    json.dumps(results.get("options"), cls=MetricsJSONEncoder),
+                    source,
+                ),
+            )
+
+            if not cursor.rowcount:
+                return None
+
+            result_id = cursor.lastrowid
+            self.conn.executemany(
+                (
+                    "INSERT INTO measurements (result_id, env, device, version, "
+                    "started, label, sub_label, description, units, "
+                    f"{', '.join(STATS)}, samples, sketch) VALUES "
+                    f"({', '.join(['?'] * (11 + len(STATS)))})"
+                ),
+                [
+                    self._measurement_row(result_id, env, device, version, started, m)
+                    for m in results.get("measurements") or []
+                ],
+            )
+        return result_id
+
+    def query(
+        self,
+        label: Optional[str] = None,
+        sub_label: Optional[str] = None,
+        env: Optional[str] = None,
+        device: Optional[str] = None,
+        version: Optional[str] = None,
+        since: Optional[str] = None,
+        last: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the summary statistics of the matching measurements, most recent
+        first within each series. Labels are matched case-insensitively and env,
+        device and version are matched as glob patterns (e.g. "rpi5*"). If last is
+        specified, only the last N runs of each (label, sub_label, env, device)
+        series are returned; since filters runs started on or after the timestamp.
+        """
+        where, params = [], []
+        if label is not None:
+            where.append("label = ? COLLATE NOCASE")
+            params.append(label)
+        if sub_label is not None:
+            where.append("sub_label = ? COLLATE NOCASE")
+            params.append(sub_label)
+        for column, pattern in (("env", env), ("device", device), ("version", version)):
+            if pattern is not None:
+                where.append(f"{column} GLOB ?")
+                params.append(pattern)
+        if since is not None:
+            where.append("started >= ?")
+            params.append(since)
+
+        columns = (
+            "id, result_id, env, device, version, started, label, sub_label, "
+            f"description, units, {', '.join(STATS)}"
+        )
+        sql = (
+            f"SELECT {columns}, ROW_NUMBER() OVER (PARTITION BY label, sub_label, "
+            "env, device ORDER BY started DESC) AS run FROM measurements"
+        )
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+
+        sql = f"SELECT {columns} FROM ({sql})"
+        if last is not None:
+            sql += " WHERE run <= ?"
+            params.append(last)
+        sql += " ORDER BY label, sub_label, env, device, started DESC"
+
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def compare(self, by: str = "env", **kwargs) -> List[Dict[str, Any]]:
+        """
+        Summarizes the matching measurements (filtered using the query kwargs) for
+        each benchmark label and sub label grouped by env, device, or version: the
+        number of runs and the median, min and max of the median of each run.
+        """
+        if by not in COMPARE_BY:
+            raise ValueError(f"cannot compare by {by!r}, choose from {COMPARE_BY}")
+
+        groups = {}
+        for row in self.query(**kwargs):
+            key = (row["label"], row["sub_label"], row[by])
+            groups.setdefault(key, {"units": row["units"], "medians": []})
+            groups[key]["medians"].append(row["median"])
+
+        summary = []
+        for (label, sub_label, value), group in sorted(
+            groups.items(), key=lambda item: tuple(str(k) for k in item[0])
+        ):
+            medians = np.array(
+                [m for m in group["medians"] if m is not None], dtype=np.float64
+            )
+            summary.append({
+                "label": label,
+                "sub_label": sub_label,
+                by: value,
+                "units": group["units"],
+                "runs": len(group["medians"]),
+                "median": np.median(medians).item() if medians.size else None,
+                "min": medians.min().item() if medians.size else None,
+                "max": medians.max().item() if medians.size else None,
+            })
+        return summary
+
+    def measurement(self, measurement_id: int) -> Measurement:
+        """
+        Reconstructs a measurement from the store including its samples or sketch.
+        """
+        row = self.conn.execute(
+            "SELECT * FROM measurements WHERE id = ?", (measurement_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"no measurement with id {measurement_id}")
+
+        samples = row["samples"]
+        return Measurement(
+            metric=Metric(
+                label=row["label"],
+                sub_label=row["sub_label"],
+                description=row["description"],
+                device=row["device"],
+                env=row["env"],
+            ),
+            raw_metrics=np.frombuffer(samples, dtype="<f8") if samples else [],
+            units=row["units"],
+            sketch=Sketch.load(json.loads(row["sketch"])) if row["sketch"] else None,
+        )
+
+    def _measurement_row(
+        self,
+        result_id: int,
+        env: Optional[str],
+        device: Optional[str],
+        version: Optional[str],
+        started: str,
+        measurement: Measurement,
+    ) -> tuple:
+        stats = measurement.stats if measurement.count else {}
+        samples = None
+        if measurement.raw_metrics.size:
+            samples = measurement.metrics.astype("<f8").tobytes()
+
+        sketch = None
+        if measurement.sketch is not None:
+            sketch = json.dumps(measurement.sketch.dump())
+
+        metric = measurement.metric
+        return (
+            result_id, env, device, version, started, metric.label,
+            metric.sub_label, metric.description, measurement.units,
+            measurement.count, *(stats.get(stat) for stat in STATS[1:]),
+            samples, sketch,
+        )
+
+
+def ingest(paths: Iterable[str], db: Optional[str] = None) -> List[Optional[int]]:
+    """
+    Ingests the results files into the results database.
+    """
+    with ResultsStore(db) as store:
+        return [store.ingest(path) for path in paths]
@@ -37,7 +37,10 @@ class MobileViT(Benchmark):
             cleanup_movies(data_home=self.data_home, sample=self.use_sample)
 
     def instances(self, limit=None):
-        dataset = load_movies(data_home=self.data_home, sample=self.use_sample)
+        dataset = load_movies(
+            data_home=self.data_home, sample=self.use_sample, extract=self.extract,
+            verify=self.verify,
+        )
         return limit_generator(dataset, limit)
 
     def preprocess(self, instance):
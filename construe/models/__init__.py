@@ -5,3 +5,4 @@ Manages models used for inferencing
 from .loaders import * # noqa
 from .download import download_model
 from .path import get_model_home, cleanup_model
+from .options import InterpreterOptions
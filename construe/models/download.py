@@ -6,7 +6,8 @@ from functools import partial
 
 from .path import get_model_home
 from .manifest import load_manifest
-from ..cloud.download import download_zip
+from ..cloud.download import download_zip, download_concurrently
+from ..cloud.download import PARTS, WORKERS, CONNECTIONS
 from .path import NSFW, LOWLIGHT, OFFENSIVE, GLINER
 from .path import MOONDREAM, WHISPER, MOBILENET, MOBILEVIT
 
@@ -14,7 +15,13 @@ from ..exceptions import ModelsError
 
 
 def download_model(
-    url, signature, model_home=None, replace=False, extract=True, progress=True
+    url,
+    signature,
+    model_home=None,
+    replace=False,
+    extract=True,
+    progress=True,
+    parts=PARTS,
 ):
     """
     Downloads the zipped model file specified at the given URL saving it to the models
@@ -23,11 +30,19 @@ def download_model(
     """
     model_home = get_model_home(model_home)
     download_zip(
-        url, model_home, signature, replace=replace, extract=extract, progress=progress
+        url,
+        model_home,
+        signature,
+        replace=replace,
+        extract=extract,
+        progress=progress,
+        parts=parts,
     )
 
 
-def _download_model(name, model_home=None, replace=False, extract=True, progress=True):
+def _download_model(
+    name, model_home=None, replace=False, extract=True, progress=True, parts=PARTS
+):
     """
     Downloads the zipped model file specified using the manifest URL, saving it to the
     models directory specified by ``get_model_home``. The download is verified with
@@ -43,6 +58,7 @@ def _download_model(name, model_home=None, replace=False, extract=True, progress
         "replace": replace,
         "extract": extract,
         "progress": progress,
+        "parts": parts,
         "url": info["url"],
         "signature": info["signature"],
     }
@@ -71,6 +87,24 @@ DOWNLOADERS = [
 ]
 
 
-def download_all_models(model_home=None, replace=True, extract=True, progress=True):
-    for f in DOWNLOADERS:
-        f(model_home=model_home, replace=replace, extract=extract, progress=progress)
+def download_all_models(
+    model_home=None,
+    replace=True,
+    extract=True,
+    progress=True,
+    workers=WORKERS,
+    connections=CONNECTIONS,
+):
+    """
+    Downloads all models concurrently using at most workers threads and sharing the
+    specified number of HTTP connections, reporting to a single progress bar.
+    """
+    download_concurrently(
+        DOWNLOADERS,
+        workers=workers,
+        connections=connections,
+        progress=progress,
+        model_home=get_model_home(model_home),
+        replace=replace,
+        extract=extract,
+    )
@@ -14,9 +14,7 @@ from .path import model_archive, cleanup_model
 from .path import find_model_path, get_model_home
 from .path import NSFW, LOWLIGHT, OFFENSIVE, GLINER
 from .path import MOONDREAM, WHISPER, MOBILENET, MOBILEVIT
-
-from tensorflow import lite as tflite
-from transformers import WhisperProcessor
+from .options import InterpreterOptions
 
 
 __all__ = [
@@ -41,9 +39,9 @@ def _info(model):
     return MODELS[model]
 
 
-def _model_path(name, tflite=True, model_home=None):
+def _model_path(name, tflite=True, model_home=None, verify=None):
     info = _info(name)
-    if not model_archive(name, info["signature"], model_home=model_home):
+    if not model_archive(name, info["signature"], model_home=model_home, verify=verify):
         # If the model does not exist, download and extract it
         kwargs = {
             "model_home": model_home, "replace": True, "extract": True,
@@ -56,18 +54,29 @@ def _model_path(name, tflite=True, model_home=None):
     return find_model_path(name, model_home=model_home)
 
 
+def _interpreter(path, options=None):
+    # Tensorflow is only imported when a model is loaded to keep the CLI startup fast
+    from tensorflow import lite as tflite
+
+    options = options or InterpreterOptions()
+    return tflite.Interpreter(path, **options.interpreter_kwargs())
+
+
 def load_moondream(model_home=None):
     pass
 
 
-def load_whisper(model_home=None):
+def load_whisper(model_home=None, options=None, verify=None):
     """
     Returns a tflite interpreter with the whisper model and the whisper prepocessor.
+    The interpreter is configured with the InterpreterOptions if specified.
     """
-    model_path = _model_path(WHISPER, model_home=model_home)
-    proccessor_path = _model_path(WHISPER, tflite=False, model_home=model_home)
+    model_path = _model_path(WHISPER, model_home=model_home, verify=verify)
+    proccessor_path = find_model_path(WHISPER, model_home=model_home)
+
+    from transformers import WhisperProcessor
 
-    model = tflite.Interpreter(model_path)
+    model = _interpreter(model_path, options)
     processor = WhisperProcessor.from_pretrained(proccessor_path)
     return model, processor
 
@@ -84,9 +93,9 @@ def load_nsfw(model_home=None):
     pass
 
 
-def load_lowlight(model_home=None):
-    path = _model_path(LOWLIGHT, model_home=model_home)
-    return tflite.Interpreter(path)
+def load_lowlight(model_home=None, options=None, verify=None):
+    path = _model_path(LOWLIGHT, model_home=model_home, verify=verify)
+    return _interpreter(path, options)
 
 
 def load_offensive(model_home=None):
@@ -0,0 +1,67 @@
+"""
+Options for configuring the tflite interpreters that models are loaded into.
+"""
+
+import dataclasses
+
+from construe.exceptions import ModelsError
+
+from typing import Any, Dict, Optional
+
+
+# Op resolvers supported by the tflite interpreter (see OpResolverType)
+AUTO = "auto"
+BUILTIN = "builtin"
+BUILTIN_REF = "builtin_ref"
+BUILTIN_WITHOUT_DEFAULT_DELEGATES = "builtin_without_default_delegates"
+OP_RESOLVERS = (AUTO, BUILTIN, BUILTIN_REF, BUILTIN_WITHOUT_DEFAULT_DELEGATES)
+
+
+@dataclasses.dataclass(init=True, repr=True, eq=True, frozen=True)
+class InterpreterOptions:
+    """
+    The number of threads and op resolver of a tflite interpreter. If num_threads
+    is None the interpreter chooses its default. XNNPACK is the default delegate of
+    the builtin op resolvers; disabling it uses the builtin kernels without any
+    default delegates. The reference kernels are intended for debugging only.
+    """
+
+    num_threads: Optional[int] = None
+    xnnpack: bool = True
+    op_resolver: str = AUTO
+
+    def __post_init__(self):
+        if self.num_threads is not None and self.num_threads < 1:
+            raise ModelsError("the number of interpreter threads must be at least one")
+
+        if self.op_resolver not in OP_RESOLVERS:
+            raise ModelsError(
+                f"unknown op resolver {self.op_resolver!r}, choose from {OP_RESOLVERS}"
+            )
+
+        if not self.xnnpack and self.op_resolver not in (AUTO, BUILTIN):
+            raise ModelsError(
+                "xnnpack can only be disabled with the auto or builtin op resolver"
+            )
+
+    @property
+    def resolver(self) -> str:
+        """
+        The op resolver used by the interpreter taking xnnpack into account.
+        """
+        if not self.xnnpack:
+            return BUILTIN_WITHOUT_DEFAULT_DELEGATES
+        return self.op_resolver
+
+    def interpreter_kwargs(self) -> Dict[str, Any]:
+        """
+        Returns the keyword arguments to create a tflite.Interpreter with.
+        """
+        # Tensorflow is only imported when a model is loaded
+        from tensorflow import lite as tflite
+
+        resolver = tflite.experimental.OpResolverType[self.resolver.upper()]
+        return {"num_threads": self.num_threads, "experimental_op_resolver_type": resolver}
+
+    def dump(self) -> Dict[str, Any]:
+        return dataclasses.asdict(self)
@@ -6,7 +6,7 @@ import os
 import shutil
 
 from pathlib import Path
-from ..cloud.signature import sha256sum
+from ..cloud.signature import verified_signature, remove_signature
 from construe.exceptions import ModelsError
 
 
@@ -98,16 +98,20 @@ def model_tflite_exists(model, model_home):
     return model_exists(model, model_home=model_home, ext=".tflite")
 
 
-def model_archive(model, signature, model_home=None, ext=".zip"):
+def model_archive(model, signature, model_home=None, ext=".zip", verify=None):
     """
     Checks to see if the model archive file exists and determines if it is the latest
     version by comparing the signature specified with the archive signature.
+
+    The archive signature is cached in a sidecar file and the archive is only
+    rehashed if it has changed since it was last verified, unless verify=True (or
+    the ``$CONSTRUE_VERIFY`` environment variable is set) to force a full check.
     """
     model_home = get_model_home(model_home)
     path = os.path.join(model_home, model+ext)
 
     if os.path.exists(path) and os.path.isfile(path):
-        return sha256sum(path) == signature
+        return verified_signature(path, verify=verify) == signature
     return False
 
 
@@ -126,5 +130,6 @@ def cleanup_model(model, model_home=None, archive=".zip"):
     if os.path.exists(archive):
         os.remove(archive)
         removed += 1
+    remove_signature(archive)
 
     return removed
@@ -40,7 +40,10 @@ class MoonDream(Benchmark):
             cleanup_nsfw(data_home=self.data_home, sample=self.use_sample)
 
     def instances(self, limit=None):
-        dataset = load_nsfw(data_home=self.data_home, sample=self.use_sample)
+        dataset = load_nsfw(
+            data_home=self.data_home, sample=self.use_sample, extract=self.extract,
+            verify=self.verify,
+        )
         return limit_generator(dataset, limit)
 
     def preprocess(self, instance):
@@ -40,7 +40,10 @@ class NSFW(Benchmark):
             cleanup_nsfw_dataset(data_home=self.data_home, sample=self.use_sample)
 
     def instances(self, limit=None):
-        dataset = load_nsfw_dataset(data_home=self.data_home, sample=self.use_sample)
+        dataset = load_nsfw_dataset(
+            data_home=self.data_home, sample=self.use_sample, extract=self.extract,
+            verify=self.verify,
+        )
         return limit_generator(dataset, limit)
 
     def preprocess(self, instance):
@@ -0,0 +1,169 @@
+"""
+Operator microbenchmarks at the shapes stressed by the models that construe
+benchmarks: GEMM at transformer shapes, conv2d at MobileNet and MobileViT shapes,
+softmax and layer norm, and scaled dot product attention across sequence lengths.
+
+Each operator records the number of floating point operations it performs so that
+its measurements can be reported as GFLOP/s. Operators are only described here;
+their input tensors are created when they are timed so that torch is only imported
+by the basic benchmarks.
+"""
+
+import dataclasses
+
+from typing import Any, Dict, Tuple
+
+
+# Approximate floating point operations per element of the normalization operators:
+# softmax takes the max, subtracts it, exponentiates, sums and divides; layer norm
+# sums for the mean and variance, centers, squares, scales and applies the affine.
+SOFTMAX_FLOPS = 5
+LAYER_NORM_FLOPS = 7
+
+
+@dataclasses.dataclass(init=True, repr=False, eq=True)
+class Operator:
+    """
+    An operator timed at a specific shape. The statement is executed with random
+    tensors of the specified shapes, the params, torch, and torch.nn.functional (as
+    F) as its globals. The suite is the label of its measurements, the op is the
+    description and the name is the sub label.
+    """
+
+    suite: str
+    op: str
+    name: str
+    stmt: str
+    flops: int
+    tensors: Dict[str, Tuple[int, ...]]
+    params: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    def globals(self) -> Dict[str, Any]:
+        """
+        Creates the input tensors of the operator for timing.
+        """
+        import torch
+
+        tensors = {name: torch.randn(shape) for name, shape in self.tensors.items()}
+        return {"torch": torch, "F": torch.nn.functional, **self.params, **tensors}
+
+    def __repr__(self):
+        return f"<Operator {self.op} {self.name!r}>"
+
+
+def gemm(name: str, m: int, k: int, n: int) -> Operator:
+    """
+    Multiplies an m x k matrix by a k x n matrix, e.g. the tokens of a sequence by
+    the weights of a projection.
+    """
+    return Operator(
+        "GEMM", "mm", f"{name} {m}x{k}x{n}", "torch.mm(a, b)", 2 * m * k * n,
+        {"a": (m, k), "b": (k, n)},
+    )
+
+
+def conv2d(
+    name: str,
+    size: int,
+    in_channels: int,
+    out_channels: int,
+    kernel: int,
+    stride: int = 1,
+    groups: int = 1,
+) -> Operator:
+    """
+    Convolves a square image with same padding; convolutions with a group per input
+    channel are depthwise convolutions.
+    """
+    padding = kernel // 2
+    out = (size + 2 * padding - kernel) // stride + 1
+    flops = 2 * out_channels * out * out * (in_channels // groups) * kernel * kernel
+
+    op = "depthwise" if groups > 1 and groups == in_channels else "conv2d"
+    return Operator(
+        "Conv2d", op,
+        f"{name} {in_channels}x{size}x{size} -> {out_channels} k{kernel}s{stride}",
+        "F.conv2d(x, w, stride=stride, padding=padding, groups=groups)",
+        flops,
+        {
+            "x": (1, in_channels, size, size),
+            "w": (out_channels, in_channels // groups, kernel, kernel),
+        },
+        {"stride": stride, "padding": padding, "groups": groups},
+    )
+
+
+def softmax(name: str, rows: int, cols: int) -> Operator:
+    """
+    Computes the softmax of each row, e.g. of the attention scores of each head.
+    """
+    return Operator(
+        "Softmax/LayerNorm", "softmax", f"{name} {rows}x{cols}",
+        "F.softmax(x, dim=-1)", SOFTMAX_FLOPS * rows * cols, {"x": (rows, cols)},
+    )
+
+
+def layer_norm(name: str, rows: int, dim: int) -> Operator:
+    """
+    Normalizes each row (e.g. each token embedding) with a learned affine transform.
+    """
+    return Operator(
+        "Softmax/LayerNorm", "layer_norm", f"{name} {rows}x{dim}",
+        "F.layer_norm(x, shape, w, b)", LAYER_NORM_FLOPS * rows * dim,
+        {"x": (rows, dim), "w": (dim,), "b": (dim,)},
+        {"shape": (dim,)},
+    )
+
+
+def attention(name: str, seq_len: int, heads: int = 12, head_dim: int = 64) -> Operator:
+    """
+    Scaled dot product attention of a single sequence: the scores of the queries and
+    keys and the weighted sum of the values are each 2 x heads x seq_len^2 x head_dim
+    FLOPs, plus the softmax of the scores.
+    """
+    scores = heads * seq_len * seq_len
+    flops = 4 * scores * head_dim + SOFTMAX_FLOPS * scores
+    shape = (1, heads, seq_len, head_dim)
+    return Operator(
+        "Attention", "sdpa", f"{name} {heads}x{seq_len}x{head_dim}",
+        "F.scaled_dot_product_attention(q, k, v)", flops,
+        {"q": shape, "k": shape, "v": shape},
+    )
+
+
+# The operators of each suite. Transformer shapes are those of a base encoder (e.g.
+# GLiNER and the text classifiers: 768 hidden, 3072 feed forward, 12 heads over 128
+# tokens) and of the Whisper tiny encoder (384 hidden, 1536 feed forward, 6 heads
+# over 1500 frames) and decoder (a single token); convolutions are those of the
+# MobileNetV2 blocks at 224px and the MobileViT xx-small blocks at 256px.
+SUITES = {
+    "gemm": (
+        gemm("encoder qkv", 128, 768, 768),
+        gemm("encoder ffn up", 128, 768, 3072),
+        gemm("encoder ffn down", 128, 3072, 768),
+        gemm("whisper encoder qkv", 1500, 384, 384),
+        gemm("whisper encoder ffn", 1500, 384, 1536),
+        gemm("whisper decoder ffn", 1, 384, 1536),
+    ),
+    "conv2d": (
+        conv2d("mobilenet stem", 224, 3, 32, 3, stride=2),
+        conv2d("mobilenet depthwise", 112, 32, 32, 3, groups=32),
+        conv2d("mobilenet pointwise", 112, 32, 16, 1),
+        conv2d("mobilenet expand", 56, 24, 144, 1),
+        conv2d("mobilenet depthwise", 56, 144, 144, 3, stride=2, groups=144),
+        conv2d("mobilenet project", 7, 960, 320, 1),
+        conv2d("mobilevit stem", 256, 3, 16, 3, stride=2),
+        conv2d("mobilevit local", 32, 48, 48, 3),
+        conv2d("mobilevit fusion", 32, 96, 48, 3),
+    ),
+    "norm": (
+        softmax("encoder scores", 12 * 128, 128),
+        softmax("whisper scores", 6 * 1500, 1500),
+        layer_norm("encoder", 128, 768),
+        layer_norm("whisper", 1500, 384),
+    ),
+    "attention": (
+        *(attention("encoder", seq_len) for seq_len in (64, 128, 256, 512, 1024)),
+        attention("whisper", 1500, heads=6),
+    ),
+}
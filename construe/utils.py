@@ -5,7 +5,7 @@ Utilities for construe
 import os
 
 from datetime import timedelta
-from typing import Iterable, Set, Union
+from typing import Any, Dict, Iterable, Set, Union
 
 
 def resolve_exclude(
@@ -67,3 +67,29 @@ def dirsize(path: str) -> int:
             if not os.path.islink(fp):
                 bytes += os.path.getsize(fp)
     return bytes
+
+
+def format_table(rows: Iterable[Dict[str, Any]], columns: Iterable[str]) -> str:
+    """
+    Format the specified columns of the rows as a plain text table with a header for
+    printing to the terminal; floats are formatted with four significant digits.
+    """
+    def fmt(value):
+        if value is None:
+            return ""
+        if isinstance(value, float):
+            return f"{value:.4g}"
+        return str(value)
+
+    columns = list(columns)
+    cells = [[fmt(row.get(col)) for col in columns] for row in rows]
+    widths = [
+        max([len(col)] + [len(line[i]) for line in cells])
+        for i, col in enumerate(columns)
+    ]
+
+    lines = ["  ".join(col.ljust(w) for col, w in zip(columns, widths))]
+    lines.append("  ".join("-" * w for w in widths))
+    for line in cells:
+        lines.append("  ".join(cell.ljust(w) for cell, w in zip(line, widths)))
+    return "\n".join(line.rstrip() for line in lines)
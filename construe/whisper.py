@@ -9,6 +9,7 @@ from .exceptions import InferenceError
 from .benchmark import Benchmark, limit_generator
 from .models import load_whisper, cleanup_whisper
 from .datasets import load_dialects, cleanup_dialects, DATASETS
+from .datasets.archive import ArchiveMember
 
 
 class Whisper(Benchmark):
@@ -29,8 +30,21 @@ class Whisper(Benchmark):
             "transcribe audio from various UK dialects"
         )
 
+    @property
+    def fingerprint(self):
+        # Cached features depend on the dataset and the feature extractor config
+        name = "dialects-sample" if self.use_sample else "dialects"
+        return {
+            **super().fingerprint,
+            "dataset": DATASETS[name]["signature"],
+            "processor": self.processor.feature_extractor.to_json_string(),
+        }
+
     def before(self):
-        model, processor = load_whisper(model_home=self.model_home)
+        model, processor = load_whisper(
+            model_home=self.model_home, options=self.interpreter_options,
+            verify=self.verify,
+        )
         self.model = model
         self.processor = processor
         self.generate = self.model.get_signature_runner()
@@ -41,11 +55,17 @@ class Whisper(Benchmark):
             cleanup_dialects(data_home=self.data_home, sample=self.use_sample)
 
     def instances(self, limit=None):
-        dataset = load_dialects(data_home=self.data_home, sample=self.use_sample)
+        dataset = load_dialects(
+            data_home=self.data_home, sample=self.use_sample, extract=self.extract,
+            verify=self.verify,
+        )
         return limit_generator(dataset, limit)
 
     def preprocess(self, instance):
-        # Instance is a path to a a sound file on disk.
+        # Instance is a path to a a sound file on disk or a member of the archive.
+        if isinstance(instance, ArchiveMember):
+            instance = instance.open()
+
         try:
             audio, samplerate = sf.read(instance)
         except Exception as e:
@@ -57,6 +77,6 @@ class Whisper(Benchmark):
         return self.processor(audio, sampling_rate=samplerate, return_tensors="tf")
 
     def inference(self, instance):
-        audio = instance.input_features
+        audio = instance["input_features"]
         sequences = self.generate(input_features=audio)["sequences"]
         return self.processor.batch_decode(sequences, skip_special_tokens=True)
@@ -3,8 +3,10 @@ Tests for the basic benchmarking module.
 """
 
 import torch
+import pytest
 
 from construe.basic import *
+from construe.operators import gemm
 
 
 def test_batched_dot():
@@ -13,3 +15,65 @@ def test_batched_dot():
 
     # Ensure that both functions compute the same output
     assert batched_dot_mul_sum(x, x).allclose(batched_dot_bmm(x, x))
+
+
+@pytest.mark.parametrize(
+    "max_threads,expected",
+    [(1, [1]), (2, [1, 2]), (4, [1, 2, 4]), (6, [1, 2, 4, 6]), (8, [1, 2, 4, 8])],
+)
+def test_sweep_threads(max_threads, expected):
+    assert sweep_threads(max_threads) == expected
+
+
+def test_thread_scaling():
+    """
+    Test speedup and efficiency are computed relative to the fewest threads
+    """
+    tensors = {"x": torch.ones((16, 16))}
+    dataset = [(tensors, {"x": {"is_contiguous": True}}, {"k0": 16, "k1": 16})]
+
+    bench = BasicBenchmark(min_run_time=0.01)
+    results = []
+    for num_threads in (1, 2):
+        results.extend(bench.time_operators(dataset, num_threads))
+
+    speedups, efficiencies, threads = thread_scaling(results)
+    assert threads == [1, 2]
+    assert {row["op"] for row in speedups} == {"mul/sum", "bmm"}
+
+    for speedup, efficiency in zip(speedups, efficiencies):
+        assert speedup["size"] == "16     x 16"
+        assert speedup["1"] == efficiency["1"] == 1.0
+        assert efficiency["2"] == pytest.approx(speedup["2"] / 2)
+
+
+def test_throughput():
+    """
+    Test the GFLOP/s of operators are computed from the FLOPs in the metadata
+    """
+    op = gemm("test", 8, 8, 8)
+    bench = BasicBenchmark(min_run_time=0.01, suites=["gemm"])
+    results = bench.time_suites([op], 1)
+    assert results[0].metadata == {"flops": op.flops}
+
+    rows, threads = throughput(results)
+    assert threads == [1]
+    assert rows == [{
+        "op": "mm",
+        "size": "test 8x8x8",
+        "GFLOP": op.flops / 1e9,
+        "1": op.flops / results[0].median / 1e9,
+    }]
+
+    # Measurements without FLOPs (e.g. batched dot) are ignored
+    tensors = {"x": torch.ones((16, 16))}
+    dataset = [(tensors, {"x": {"is_contiguous": True}}, {"k0": 16, "k1": 16})]
+    assert throughput(bench.time_operators(dataset, 1)) == ([], [])
+
+
+def test_suites():
+    assert BasicBenchmark().suites == [DOT]
+    assert BasicBenchmark(suites=["all"]).suites == [DOT, *SUITES]
+
+    with pytest.raises(BenchmarkError, match="unknown basic benchmark suite"):
+        BasicBenchmark(suites=["foo"])
@@ -0,0 +1,85 @@
+"""
+Test the cache of preprocessed features.
+"""
+
+import os
+import numpy as np
+
+from construe.benchmark import Benchmark
+from construe.benchmark.cache import FeatureCache, instance_key
+
+
+class Squares(Benchmark):
+
+    @staticmethod
+    def total(**kwargs):
+        return 0
+
+    @property
+    def description(self):
+        return "squares"
+
+    def before(self):
+        pass
+
+    def after(self, cleanup=True):
+        pass
+
+    def instances(self, limit=None):
+        return iter([])
+
+    def preprocess(self, instance):
+        return [instance] * 4
+
+    def inference(self, instance):
+        return [i * i for i in instance]
+
+
+class Mapped(Squares):
+
+    def preprocess(self, instance):
+        return {
+            "features": np.full((2, 3), instance, dtype=np.float32),
+            "mask": np.ones(3, dtype=np.int64),
+        }
+
+
+def test_cache_round_trip(tmpdir):
+    cache = FeatureCache(str(tmpdir.join("cache")))
+    benchmark = Mapped()
+    fingerprint = cache.fingerprint(benchmark)
+
+    key = cache.key(fingerprint, [1])
+    assert cache.get(benchmark, key) is None
+    assert cache.put(benchmark, key, benchmark.preprocess(1))
+
+    features = cache.get(benchmark, key)
+    assert not isinstance(features["features"], np.memmap)
+    np.testing.assert_array_equal(features["features"], np.ones((2, 3)))
+    assert features["mask"].dtype == np.int64
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Only one entry directory exists and no temporary directories remain
+    assert os.listdir(os.path.join(cache.path, "Mapped")) == [key]
+
+
+def test_cache_keys(tmpdir):
+    cache = FeatureCache(str(tmpdir))
+    fingerprint = cache.fingerprint(Squares())
+    assert fingerprint != cache.fingerprint(Squares(batch_size=2))
+    assert fingerprint != cache.fingerprint(Mapped())
+
+    assert cache.key(fingerprint, [1, 2]) != cache.key(fingerprint, [2, 1])
+    assert cache.key(fingerprint, ["a.wav"]) == cache.key(fingerprint, ["a.wav"])
+    assert instance_key({"b": 1, "a": 2}) == instance_key({"a": 2, "b": 1})
+
+
+def test_cache_uncacheable(tmpdir):
+    cache = FeatureCache(str(tmpdir))
+    benchmark = Squares()
+    key = cache.key(cache.fingerprint(benchmark), [1])
+
+    # Ragged or non-numeric features are not cached
+    assert not cache.put(benchmark, key, [[1, 2], [3]])
+    assert not cache.put(benchmark, key, ["foo", None])
+    assert cache.get(benchmark, key) is None
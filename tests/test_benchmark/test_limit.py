@@ -1,5 +1,5 @@
 import pytest
-from construe.benchmark.limit import limit_generator
+from construe.benchmark.limit import limit_generator, batch_generator
 
 """
 Test the benchmark generator helpers.
@@ -25,3 +25,26 @@ def test_limit_generator(limit, expected):
 
     gen = limit_generator(sample_generator(), limit=limit)
     assert len(list(gen)) == expected
+
+
+@pytest.mark.parametrize(
+    "batch_size,expected",
+    [
+        (1, [1] * 10),
+        (2, [2] * 5),
+        (3, [3, 3, 3, 1]),
+        (10, [10]),
+        (15, [10]),
+    ],
+)
+def test_batch_generator(batch_size, expected):
+    gen = batch_generator(iter(range(10)), batch_size=batch_size)
+    batches = list(gen)
+
+    assert [len(batch) for batch in batches] == expected
+    assert [item for batch in batches for item in batch] == list(range(10))
+
+
+def test_batch_generator_invalid():
+    with pytest.raises(ValueError):
+        list(batch_generator(iter(range(10)), batch_size=0))
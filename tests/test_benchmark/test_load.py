@@ -0,0 +1,68 @@
+"""
+Test the open-loop load generator.
+"""
+
+import time
+import pytest
+import numpy as np
+
+from construe.benchmark.limit import batch_generator
+from construe.benchmark.load import POISSON, CONSTANT
+from construe.benchmark.load import arrivals, find_knee, LoadGenerator
+
+
+def preprocess(benchmark, batch):
+    return batch
+
+
+def inference(benchmark, batch):
+    time.sleep(0.005)
+
+
+def test_constant_arrivals():
+    offsets = arrivals(10, 5, CONSTANT)
+    assert offsets == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4])
+
+
+def test_poisson_arrivals():
+    offsets = arrivals(100, 10000, POISSON, seed=42)
+    assert offsets[0] == 0.0
+    assert np.all(np.diff(offsets) >= 0)
+
+    # The mean inter-arrival time should approach 1/rate
+    assert np.diff(offsets).mean() == pytest.approx(0.01, rel=0.05)
+
+
+@pytest.mark.parametrize("rate,distribution", [(0, POISSON), (10, "uniform")])
+def test_arrivals_invalid(rate, distribution):
+    with pytest.raises(ValueError):
+        arrivals(rate, 10, distribution)
+
+
+def test_load_generator():
+    batches = list(batch_generator(iter(range(20)), 1))
+    generator = LoadGenerator([None], preprocess, inference, distribution=CONSTANT)
+
+    # Underloaded: requests arrive slower than they are serviced
+    light = generator.run(batches, 50)
+    assert len(light.latency) == 20
+    assert all(s >= 0.005 for s in light.service)
+    assert np.median(light.wait) < 0.005
+
+    # Overloaded: requests arrive faster than they are serviced so they queue
+    heavy = generator.run(batches, 1000)
+    assert np.median(heavy.wait) > np.median(light.wait)
+    assert heavy.throughput < 1000
+
+
+@pytest.mark.parametrize(
+    "rates,latencies,expected",
+    [
+        ([1, 2, 3, 4, 5, 6], [1.0, 1.0, 1.1, 1.2, 8.0, 20.0], 4),
+        ([6, 1, 3, 2, 5, 4], [20.0, 1.0, 1.1, 1.0, 8.0, 1.2], 4),
+        ([1, 2], [1.0, 2.0], None),
+        ([1, 2, 3], [1.0, 1.0, 1.0], None),
+    ],
+)
+def test_find_knee(rates, latencies, expected):
+    assert find_knee(rates, latencies) == expected
@@ -0,0 +1,44 @@
+"""
+Test the benchmark memory tracker.
+"""
+
+import pytest
+
+from construe.benchmark import memory
+from construe.benchmark.memory import MemoryTracker, current_rss, peak_rss
+
+
+def test_current_rss():
+    rss = current_rss()
+    if rss is None:
+        pytest.skip("rss is not available on this platform")
+    assert rss > 0
+    assert peak_rss() > 0
+
+
+def test_peak_rss_without_resource(monkeypatch):
+    """
+    Test the peak RSS is unavailable rather than an error without the resource module
+    """
+    monkeypatch.setattr(memory, "resource", None)
+    monkeypatch.setattr(memory, "psutil", None)
+    assert peak_rss() is None
+
+
+def test_memory_tracker():
+    with MemoryTracker(trace_heap=True) as tracker:
+        assert tracker.is_running
+
+        tracker.reset()
+        data = [bytearray(1024) for _ in range(1024)]
+        usage = tracker.usage()
+
+        assert usage.heap >= 1024 * 1024
+        if usage.rss is not None:
+            assert usage.peak >= usage.rss
+        del data
+
+        tracker.reset()
+        assert tracker.usage().heap < 1024 * 1024
+
+    assert not tracker.is_running
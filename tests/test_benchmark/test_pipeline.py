@@ -0,0 +1,70 @@
+"""
+Test the prefetching preprocessing pipeline.
+"""
+
+import time
+import pytest
+
+from construe.benchmark.limit import batch_generator
+from construe.benchmark.pipeline import Prefetcher
+
+
+def double(batch):
+    return [i * 2 for i in batch]
+
+
+@pytest.mark.parametrize("depth,workers", [(1, 1), (2, 1), (4, 3)])
+def test_prefetcher(depth, workers):
+    batches = batch_generator(iter(range(25)), 4)
+    pipeline = Prefetcher(batches, double, depth=depth, workers=workers)
+
+    results = list(pipeline)
+    assert len(results) == 7
+    assert sum(size for _, size, _ in results) == 25
+    assert sorted(i for features, _, _ in results for i in features) == [
+        i * 2 for i in range(25)
+    ]
+
+    assert len(pipeline.stalls) == 7
+    assert all(0 <= depth <= pipeline.depth for depth in pipeline.depths)
+    assert all(timing.wall >= 0 for _, _, timing in results)
+
+
+def test_prefetcher_overlaps():
+    def slow(batch):
+        time.sleep(0.01)
+        return batch
+
+    pipeline = Prefetcher(batch_generator(iter(range(5)), 1), slow, depth=5)
+    for _ in pipeline:
+        time.sleep(0.05)
+
+    # After the first batch the queue should always be ready before the consumer
+    assert max(pipeline.stalls[1:]) < 0.01
+
+
+def test_prefetcher_error():
+    def fails(batch):
+        if batch[0] == 3:
+            raise ValueError("bad instance")
+        return batch
+
+    pipeline = Prefetcher(batch_generator(iter(range(10)), 1), fails)
+    with pytest.raises(ValueError):
+        list(pipeline)
+
+
+def test_prefetcher_early_exit():
+    pipeline = Prefetcher(batch_generator(iter(range(100)), 1), double, workers=2)
+    for i, _ in enumerate(pipeline):
+        if i == 2:
+            break
+
+    pipeline.close()
+    assert not pipeline._threads
+
+
+@pytest.mark.parametrize("depth,workers", [(0, 1), (1, 0)])
+def test_prefetcher_invalid(depth, workers):
+    with pytest.raises(ValueError):
+        Prefetcher([], double, depth=depth, workers=workers)
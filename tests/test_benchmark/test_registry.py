@@ -0,0 +1,108 @@
+"""
+Test the lazy benchmark registry.
+"""
+
+import pytest
+
+from importlib.metadata import EntryPoint
+
+from construe.benchmark import Benchmark
+from construe.benchmark import registry
+from construe.exceptions import BenchmarkError
+from construe.benchmark.registry import BENCHMARKS, ENTRY_POINTS
+from construe.benchmark.registry import register, unregister, registered, load_benchmark
+
+
+class Noop(Benchmark):
+    """
+    Does nothing at all.
+    """
+
+    @staticmethod
+    def total(**kwargs):
+        return 0
+
+    @property
+    def description(self):
+        return "does nothing"
+
+    def before(self):
+        pass
+
+    def after(self, cleanup=True):
+        pass
+
+    def instances(self, limit=None):
+        return iter([])
+
+    def preprocess(self, instance):
+        return instance
+
+    def inference(self, instance):
+        return instance
+
+
+@pytest.fixture
+def entry_points(monkeypatch):
+    """
+    Replace the installed entry points with the specified entry points
+    """
+    def patch(*eps):
+        monkeypatch.setattr(registry, "entry_points", lambda group: list(eps))
+        registry._entry_points.cache_clear()
+
+    yield patch
+    registry._entry_points.cache_clear()
+
+
+def test_load_benchmark():
+    """
+    Test that a registered benchmark is imported by name
+    """
+    cls = load_benchmark(" Whisper ")
+    assert issubclass(cls, Benchmark)
+    assert cls.__name__ == "Whisper"
+    assert BENCHMARKS["lowlight"].default
+    assert not BENCHMARKS["moondream"].default
+
+    with pytest.raises(BenchmarkError):
+        load_benchmark("foo")
+
+
+def test_register_decorator():
+    """
+    Test registering benchmarks with the decorator with and without arguments
+    """
+    try:
+        assert register(Noop) is Noop
+        assert registered()["noop"].help == "Does nothing at all."
+        assert load_benchmark("noop") is Noop
+
+        register(name="Quiet", help="shh", default=False)(Noop)
+        entry = registered()["quiet"]
+        assert (entry.help, entry.default) == ("shh", False)
+    finally:
+        unregister("noop")
+        unregister("quiet")
+
+    assert "noop" not in registered()
+
+    with pytest.raises(BenchmarkError):
+        register(object)
+
+
+def test_entry_points(entry_points):
+    """
+    Test benchmarks are discovered from entry points and loaded lazily
+    """
+    entry_points(
+        EntryPoint(name="Custom", value="construe.lowlight:LowLight", group=ENTRY_POINTS),
+        EntryPoint(name="broken", value="construe.utils:format_table", group=ENTRY_POINTS),
+    )
+
+    benchmarks = registered()
+    assert isinstance(benchmarks["custom"].target, EntryPoint)
+    assert load_benchmark("custom").__name__ == "LowLight"
+
+    with pytest.raises(BenchmarkError):
+        load_benchmark("broken")
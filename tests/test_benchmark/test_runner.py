@@ -0,0 +1,431 @@
+"""
+Test the benchmark runner using a simple benchmark that requires no downloads.
+"""
+
+import os
+import pytest
+
+from unittest import mock
+
+from construe.metrics import Measurement, load, open_results, read_checkpoint
+from construe.exceptions import BenchmarkError, ConstrueError
+from construe.benchmark import Benchmark, BenchmarkRunner, limit_generator
+from construe.benchmark.workers import WorkerPool
+
+
+class Squares(Benchmark):
+    """
+    A fast benchmark that squares integers for testing the runner.
+    """
+
+    @staticmethod
+    def total(**kwargs):
+        return 20
+
+    @property
+    def description(self):
+        return "squares integers in a list"
+
+    def before(self):
+        self.ready = True
+
+    def after(self, cleanup=True):
+        self.ready = False
+
+    def instances(self, limit=None):
+        return limit_generator(iter(range(20)), limit)
+
+    def preprocess(self, instance):
+        return [instance] * 64
+
+    def inference(self, instance):
+        return [i * i for i in instance]
+
+
+@pytest.fixture
+def runner(tmpdir):
+    def make_runner(**kwargs):
+        kwargs.setdefault("verbose", False)
+        kwargs.setdefault("benchmarks", [Squares])
+        return BenchmarkRunner(
+            data_home=str(tmpdir.ensure("data", dir=True)),
+            model_home=str(tmpdir.ensure("models", dir=True)),
+            **kwargs
+        )
+    return make_runner
+
+
+def measurements(runner):
+    return {m.metric.sub_label: m for m in runner.results_.measurements}
+
+
+def test_runner(runner):
+    runner = runner(n_runs=2, memory=False)
+    runner.run()
+
+    assert runner.is_complete
+    assert runner.results_.failures == 0
+
+    results = measurements(runner)
+    assert set(results.keys()) == {
+        "preprocessing", "preprocessing-cpu", "preprocessing-thread-cpu",
+        "inferencing", "inferencing-cpu", "inferencing-thread-cpu",
+    }
+
+    for measurement in results.values():
+        assert len(measurement.metrics) == 40
+        assert measurement.units == "s"
+
+
+def test_runner_memory(runner):
+    runner = runner(limit=10, memory=True, trace_heap=True)
+    runner.run()
+
+    results = measurements(runner)
+    for stage in ("preprocessing", "inferencing"):
+        assert len(results[stage].metrics) == 10
+        assert len(results[f"{stage}-heap"].metrics) == 10
+        assert results[f"{stage}-heap"].units == "B"
+        if f"{stage}-memory" in results:
+            peak = results[f"{stage}-memory"].metrics
+            rss = results[f"{stage}-rss"].metrics
+            assert all(m > 0 for m in peak)
+            assert all(p >= r for p, r in zip(peak, rss))
+
+
+def test_runner_memory_opt_in(runner):
+    """
+    Test memory is only sampled when it is explicitly enabled
+    """
+    runner = runner(limit=5)
+    runner.run()
+
+    results = measurements(runner)
+    assert runner.results_.memory is False
+    assert not any(name.endswith(("-memory", "-rss", "-heap")) for name in results)
+
+
+@pytest.mark.parametrize("warmup,expected", [(0, None), (5, 5), (30, 30)])
+def test_runner_warmup(runner, warmup, expected):
+    runner = runner(limit=10, warmup=warmup, memory=False)
+    runner.run()
+
+    results = measurements(runner)
+    assert len(results["inferencing"].metrics) == 10
+    if expected is None:
+        assert "warmup" not in results
+    else:
+        assert len(results["warmup"].metrics) == expected
+
+
+def test_runner_warmup_batching(runner):
+    """
+    Test warmup latencies are amortized per instance when batching
+    """
+    runner = runner(limit=8, warmup=8, batch_size=4, memory=False)
+    with mock.patch("construe.benchmark.runner.Timer") as Timer:
+        Timer.return_value.__enter__.return_value.timing.wall = 2.0
+        runner.run()
+
+    results = measurements(runner)
+    assert list(results["warmup"].metrics) == [0.5, 0.5]
+
+
+def test_runner_warmup_auto(runner):
+    runner = runner(limit=10, warmup="auto", memory=False)
+    runner.run()
+
+    results = measurements(runner)
+    assert 10 <= len(results["warmup"].metrics) <= 100
+
+
+def test_runner_batching(runner):
+    runner = runner(limit=10, batch_size=4, memory=False)
+    runner.run()
+
+    results = measurements(runner)
+    assert len(results["inferencing"].metrics) == 3
+    assert len(results["inferencing-batch"].metrics) == 3
+    assert len(results["preprocessing-batch"].metrics) == 3
+    assert results["inferencing-throughput"].units == "items/s"
+    assert all(m > 0 for m in results["inferencing-throughput"].metrics)
+
+    batch = results["inferencing-batch"].metrics
+    amortized = results["inferencing"].metrics
+    assert amortized[0] == pytest.approx(batch[0] / 4)
+    assert amortized[-1] == pytest.approx(batch[-1] / 2)
+
+
+def test_runner_batching_padded(runner):
+    """
+    Test a padded remainder batch is omitted from the amortized samples
+    """
+    class PaddedSquares(Squares):
+
+        def padded(self, size):
+            return size < self.batch_size
+
+    runner = runner(
+        benchmarks=[PaddedSquares], limit=10, batch_size=4, memory=False
+    )
+    runner.run()
+
+    results = measurements(runner)
+    for name in ("preprocessing", "inferencing", "inferencing-throughput"):
+        assert len(results[name].metrics) == 2
+
+
+@pytest.mark.parametrize("batch_size", [1, 3])
+def test_runner_prefetch(runner, batch_size):
+    runner = runner(limit=12, batch_size=batch_size, prefetch=2, prefetch_workers=2)
+    runner.run()
+
+    results = measurements(runner)
+    n_batches = 12 // batch_size
+    assert len(results["preprocessing"].metrics) == n_batches
+    assert len(results["inferencing"].metrics) == n_batches
+    assert len(results["pipeline-stall"].metrics) == n_batches
+    assert len(results["pipeline-queue-depth"].metrics) == n_batches
+    assert len(results["pipeline-throughput"].metrics) == 1
+    assert "preprocessing-memory" not in results
+
+    if "pipeline-efficiency" in results:
+        assert 0.0 <= results["pipeline-efficiency"].metrics[0] <= 1.0
+
+
+def test_runner_concurrency(runner):
+    runner = runner(limit=12, concurrency=3, warmup=2)
+    runner.run()
+
+    results = measurements(runner)
+    assert len(results["warmup"].metrics) == 6
+    assert len(results["inferencing"].metrics) == 12
+    assert sum(
+        len(results[f"worker-{i}-inferencing"].metrics) for i in range(3)
+        if f"worker-{i}-inferencing" in results
+    ) == 12
+
+    assert len(results["concurrent-throughput"].metrics) == 1
+    assert len(results["concurrent-baseline-throughput"].metrics) == 1
+    assert results["concurrent-scaling-efficiency"].metrics[0] > 0
+
+
+def test_runner_concurrency_baseline(runner):
+    """
+    Test the baseline pass is bounded, counted in the progress and reused by runs
+    """
+    runner = runner(n_runs=2, limit=12, concurrency=2, baseline_limit=4)
+    assert runner.baseline_size(Squares) == 4
+
+    passes = []
+    run = WorkerPool.run
+
+    def counted(pool, batches, progress=None):
+        batches = list(batches)
+        passes.append((len(pool.benchmarks), len(batches), progress is not None))
+        return run(pool, batches, progress)
+
+    with mock.patch.object(WorkerPool, "run", counted):
+        runner.run()
+
+    assert passes == [(1, 4, True), (2, 12, True), (2, 12, True)]
+    results = measurements(runner)
+    assert len(results["concurrent-baseline-throughput"].metrics) == 2
+    assert runner.results_.baseline_limit == 4
+
+    # The baseline can be skipped entirely
+    runner.baseline_limit = 0
+    runner.run()
+    assert "concurrent-baseline-throughput" not in measurements(runner)
+    assert "concurrent-scaling-efficiency" not in measurements(runner)
+
+
+def test_runner_concurrency_prefetch(runner):
+    with pytest.raises(BenchmarkError):
+        runner(concurrency=2, prefetch=2)
+
+
+def test_runner_load(runner):
+    runner = runner(limit=10, rates=[4000, 500, 1000], memory=False)
+    runner.run()
+
+    results = measurements(runner)
+    for rate in ("500", "1000", "4000"):
+        assert len(results[f"load-{rate}-latency"].metrics) == 10
+        assert len(results[f"load-{rate}-wait"].metrics) == 10
+        assert len(results[f"load-{rate}-service"].metrics) == 10
+        assert len(results[f"load-{rate}-throughput"].metrics) == 1
+    assert runner.results_.rates == [500, 1000, 4000]
+
+
+def test_runner_save(runner, tmpdir):
+    runner = runner(limit=5, memory=False)
+    runner.run()
+
+    path = tmpdir.join("results.json")
+    runner.save(str(path))
+
+    with open(path, "r") as f:
+        results = load(f)
+
+    assert results["type"] == "Results"
+    assert len(results["measurements"]) == len(runner.results_.measurements)
+    for measurement in results["measurements"]:
+        assert isinstance(measurement, Measurement)
+        assert len(measurement.raw_metrics) == 5
+
+
+def test_runner_sketch_only(runner):
+    runner = runner(n_runs=3, limit=10, keep_samples=False, memory=False)
+    runner.run()
+
+    results = measurements(runner)
+    for measurement in results.values():
+        assert measurement.is_sketched
+        assert measurement.raw_metrics.size == 0
+
+    assert results["inferencing"].count == 30
+    assert results["inferencing"].p99 > 0
+
+
+def test_runner_save_binary(runner, tmpdir):
+    runner = runner(limit=5, memory=False)
+    runner.run()
+
+    path = str(tmpdir.join("results.npz"))
+    runner.save(path)
+
+    with open_results(path) as results:
+        assert results["type"] == "Results"
+        for measurement in results["measurements"]:
+            assert isinstance(measurement, Measurement)
+            assert not measurement.is_loaded
+            assert len(measurement.raw_metrics) == 5
+
+
+def test_runner_checkpoint_resume(runner, tmpdir):
+    path = str(tmpdir.join("checkpoint.jsonl"))
+    first = runner(n_runs=3, limit=5, memory=False, checkpoint=path)
+    first.run()
+
+    records = read_checkpoint(path)
+    assert [(r["benchmark"], r["run"]) for r in records] == [
+        ("Squares", 0), ("Squares", 1), ("Squares", 2)
+    ]
+
+    # Simulate a crash while writing the third run (the first line is the header)
+    with open(path, "r") as f:
+        lines = f.readlines()
+    with open(path, "w") as f:
+        f.writelines(lines[:3])
+        f.write(lines[3][:20])
+
+    resumed = runner(n_runs=3, limit=5, memory=False, checkpoint=path, resume=True)
+    resumed.run()
+
+    records = read_checkpoint(path)
+    assert [r["run"] for r in records] == [0, 1, 2]
+    assert [r["run"] for r in resumed.checkpoint_.records[2:]] == [2]
+
+    results = measurements(resumed)
+    assert results["inferencing"].count == 15
+    assert resumed.results_.failures == 0
+
+    with pytest.raises(BenchmarkError):
+        runner(resume=True)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"limit": 4}, {"batch_size": 2}, {"env": "other"}, {"warmup": 2}]
+)
+def test_runner_checkpoint_resume_config(runner, tmpdir, kwargs):
+    """
+    Test resuming a checkpoint with a different config is refused
+    """
+    path = str(tmpdir.join("checkpoint.jsonl"))
+    options = {"n_runs": 2, "limit": 5, "env": "test", "checkpoint": path}
+    runner(**options).run()
+
+    # More runs can be added with the same config
+    resumed = runner(**{**options, "n_runs": 3}, resume=True)
+    resumed.run()
+    assert [r["run"] for r in read_checkpoint(path)] == [0, 1, 2]
+
+    with pytest.raises(BenchmarkError, match="different config"):
+        runner(**{**options, **kwargs}, resume=True).run()
+    assert [r["run"] for r in read_checkpoint(path)] == [0, 1, 2]
+
+
+@pytest.mark.parametrize("batch_size", [1, 4])
+def test_runner_preprocess_once(runner, batch_size):
+    runner = runner(
+        n_runs=3, limit=8, batch_size=batch_size, preprocess_once=True, memory=False
+    )
+    runner.run()
+
+    # Only the first run preprocesses, the others load features from the cache
+    results = measurements(runner)
+    n_batches = 8 // batch_size
+    assert len(results["preprocessing"].metrics) == n_batches
+    assert len(results["cache-load"].metrics) == 2 * n_batches
+    assert len(results["inferencing"].metrics) == 3 * n_batches
+    assert runner.cache_.hits == 2 * n_batches
+
+    # The temporary cache is removed after the run
+    assert not os.path.exists(runner.cache_.path)
+
+
+def test_runner_cache(runner, tmpdir):
+    path = str(tmpdir.join("cache"))
+    first = runner(limit=5, cache=path, memory=False)
+    first.run()
+    assert first.cache_.misses == 5
+
+    # A second invocation does not preprocess at all
+    second = runner(limit=5, cache=path, memory=False)
+    second.run()
+    assert second.cache_.hits == 5
+
+    results = measurements(second)
+    assert "preprocessing" not in results
+    assert len(results["cache-load"].metrics) == 5
+    assert second.results_.cache == path
+
+    with pytest.raises(BenchmarkError):
+        runner(cache=path, prefetch=2)
+
+
+def test_runner_threads_sweep(runner, monkeypatch):
+    configured = []
+    monkeypatch.setattr(
+        Squares, "before",
+        lambda self: configured.append(self.interpreter_options.num_threads),
+    )
+
+    runner = runner(n_runs=2, limit=4, threads=[4, 1, 2], memory=False)
+    runner.run()
+    assert configured == [1, 2, 4, 1, 2, 4]
+
+    results = measurements(runner)
+    assert runner.results_.threads == [1, 2, 4]
+    assert runner.results_.options["num_threads"] is None
+
+    for n in (1, 2, 4):
+        assert len(results[f"threads-{n}-inferencing"].metrics) == 8
+        assert len(results[f"threads-{n}-preprocessing"].metrics) == 8
+    assert "inferencing" not in results
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"threads": [1, 2], "num_threads": 2},
+        {"threads": [0]},
+        {"threads": [1, 2], "concurrency": 2},
+        {"num_threads": 0},
+        {"xnnpack": False, "op_resolver": "builtin_ref"},
+    ],
+)
+def test_runner_threads_invalid(runner, kwargs):
+    with pytest.raises(ConstrueError):
+        runner(**kwargs)
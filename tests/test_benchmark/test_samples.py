@@ -0,0 +1,80 @@
+"""
+Test collecting the samples of measurements during a run.
+"""
+
+import pytest
+
+from construe.benchmark.timer import Timing
+from construe.benchmark.memory import MemoryUsage
+from construe.benchmark.samples import Samples, StageSamples, MemorySamples
+
+
+def test_samples():
+    samples = Samples()
+    for value in (1.0, 2.0, 3.0):
+        samples.add(value)
+
+    assert samples.values == [1.0, 2.0, 3.0]
+    assert samples.sketch is None
+    assert len(samples) == 3
+
+
+def test_samples_sketched():
+    """
+    Test values are added to the sketch as they are produced without being stored
+    """
+    samples = Samples(keep=False)
+    for value in range(1, 1001):
+        samples.add(float(value))
+
+    assert samples.values is None
+    assert len(samples) == 1000
+    assert samples.sketch.quantile(0.5) == pytest.approx(500, rel=0.02)
+
+
+@pytest.mark.parametrize("keep", [True, False])
+def test_stage_samples(keep):
+    samples = StageSamples(keep, batched=True)
+    samples.add(Timing(wall=2.0, cpu=1.0, thread=0.5), 4)
+    samples.add(Timing(wall=1.0, cpu=1.0, thread=1.0), 2)
+
+    assert len(samples) == 2
+    assert samples.total == 3.0
+    assert samples.instances == 6
+
+    if keep:
+        assert samples.wall.values == [0.5, 0.5]
+        assert samples.cpu.values == [0.25, 0.5]
+        assert samples.batch.values == [2.0, 1.0]
+        assert samples.throughput.values == [2.0, 2.0]
+    else:
+        assert samples.wall.sketch.sum == 1.0
+        assert samples.throughput.sketch.count == 2
+
+
+def test_stage_samples_padded():
+    """
+    Test padded batches are counted in the total but not amortized
+    """
+    samples = StageSamples(batched=True)
+    samples.add(Timing(wall=2.0, cpu=1.0, thread=0.5), 4)
+    samples.add(Timing(wall=2.0, cpu=1.0, thread=0.5), 1, padded=True)
+
+    assert len(samples) == 1
+    assert samples.total == 4.0
+    assert samples.instances == 5
+    assert samples.wall.values == [0.5]
+    assert samples.throughput.values == [2.0]
+
+
+def test_memory_samples():
+    """
+    Test fields that are not available for a stage are omitted
+    """
+    samples = MemorySamples()
+    samples.add(MemoryUsage(rss=10, peak=20))
+    samples.add(MemoryUsage(rss=15, peak=30, heap=5))
+
+    assert set(samples.fields) == {"peak", "rss"}
+    assert samples.fields["peak"].values == [20, 30]
+    assert len(samples) == 2
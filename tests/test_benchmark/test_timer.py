@@ -0,0 +1,25 @@
+"""
+Test the benchmark stage timer.
+"""
+
+import time
+
+from construe.benchmark.timer import Timer
+
+
+def test_timer():
+    with Timer() as timer:
+        total = sum(i * i for i in range(100000))
+    assert total > 0
+
+    assert timer.timing.wall > 0
+    assert timer.timing.cpu > 0
+    assert timer.timing.thread > 0
+
+
+def test_timer_waiting():
+    with Timer() as timer:
+        time.sleep(0.05)
+
+    assert timer.timing.wall >= 0.05
+    assert timer.timing.thread < timer.timing.wall
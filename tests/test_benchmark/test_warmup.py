@@ -0,0 +1,45 @@
+"""
+Test the benchmark warmup helpers.
+"""
+
+import pytest
+
+from construe.exceptions import BenchmarkError
+from construe.benchmark.warmup import AUTO, resolve_warmup, is_steady
+
+
+@pytest.mark.parametrize(
+    "warmup,expected",
+    [
+        (None, 0),
+        (0, 0),
+        (10, 10),
+        ("10", 10),
+        (" 3 ", 3),
+        ("auto", AUTO),
+        ("AUTO", AUTO),
+    ],
+)
+def test_resolve_warmup(warmup, expected):
+    assert resolve_warmup(warmup) == expected
+
+
+@pytest.mark.parametrize("warmup", ["foo", "-1", -10, "1.5"])
+def test_resolve_warmup_invalid(warmup):
+    with pytest.raises(BenchmarkError):
+        resolve_warmup(warmup)
+
+
+@pytest.mark.parametrize(
+    "times,expected",
+    [
+        ([], False),
+        ([1.0] * 9, False),
+        ([1.0] * 10, True),
+        ([10.0, 8.0, 6.0, 4.0, 3.0, 2.0, 1.5, 1.2, 1.1, 1.0], False),
+        ([10.0, 5.0, 2.0, 1.0, 1.0, 1.02, 1.0, 0.99, 1.01, 1.0, 1.0], True),
+        ([0.0] * 10, True),
+    ],
+)
+def test_is_steady(times, expected):
+    assert is_steady(times) == expected
@@ -0,0 +1,53 @@
+"""
+Test the concurrent benchmark worker pool.
+"""
+
+import time
+import pytest
+
+from construe.benchmark.limit import batch_generator
+from construe.benchmark.workers import WorkerPool, throughput, scaling_efficiency
+
+
+def preprocess(benchmark, batch):
+    return batch
+
+
+def inference(benchmark, batch):
+    time.sleep(0.002)
+    benchmark.append(len(batch))
+
+
+@pytest.mark.parametrize("n_workers", [1, 2, 4])
+def test_worker_pool(n_workers):
+    replicas = [[] for _ in range(n_workers)]
+    pool = WorkerPool(replicas, preprocess, inference)
+    timings = pool.run(batch_generator(iter(range(50)), 2))
+
+    assert len(timings) == n_workers
+    assert sum(t.instances for t in timings) == 50
+    assert sum(sum(r) for r in replicas) == 50
+    assert pool.elapsed_ > 0
+
+    for replica, worker in zip(replicas, timings):
+        assert len(worker.preprocessing) == len(worker.inferencing) == len(replica)
+
+
+def test_worker_pool_error():
+    def fails(benchmark, batch):
+        raise ValueError("could not inference")
+
+    pool = WorkerPool([[], []], preprocess, fails)
+    with pytest.raises(ValueError):
+        pool.run(batch_generator(iter(range(10)), 1))
+
+
+def test_worker_pool_invalid():
+    with pytest.raises(ValueError):
+        WorkerPool([], preprocess, inference)
+
+
+def test_scaling():
+    assert throughput([], 0) is None
+    assert scaling_efficiency(300.0, 100.0, 4) == pytest.approx(0.75)
+    assert scaling_efficiency(300.0, None, 4) is None
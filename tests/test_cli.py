@@ -0,0 +1,207 @@
+"""
+Tests for the construe command line interface.
+"""
+
+import os
+import sys
+import json
+import pytest
+import subprocess
+
+from unittest import mock
+from click.testing import CliRunner
+from construe.__main__ import main
+from construe.metrics import Metric, Measurement, load, dump
+from construe.benchmark import Benchmark, limit_generator
+from construe.benchmark.registry import register, unregister
+
+
+# Frameworks that must not be imported until a benchmark that requires them is run
+HEAVY_MODULES = ("tensorflow", "torch", "transformers", "soundfile", "PIL")
+
+# Generous upper bound on the import time of the CLI in seconds
+MAX_IMPORT_TIME = 3.0
+
+
+def test_cli_import_time():
+    """
+    Benchmark the import time of the CLI and ensure no frameworks are imported
+    """
+    script = (
+        "import sys, json, time\n"
+        "started = time.perf_counter()\n"
+        "import construe.__main__\n"
+        "elapsed = time.perf_counter() - started\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    result = json.loads(output.stdout.strip().splitlines()[-1])
+
+    assert result["heavy"] == [], "CLI imports heavy frameworks on startup"
+    assert result["elapsed"] < MAX_IMPORT_TIME
+
+
+def test_cli_help():
+    """
+    Test the help of the CLI and its commands can be printed
+    """
+    runner = CliRunner()
+    result = runner.invoke(main, ["--help"])
+    assert result.exit_code == 0
+    assert "whisper" in result.output
+
+    result = runner.invoke(main, ["run", "--help"])
+    assert result.exit_code == 0
+    assert "--include" in result.output
+
+
+@pytest.fixture
+def counting():
+    """
+    Registers a benchmark that is only run when it is included
+    """
+    @register(name="counting", default=False)
+    class Counting(Benchmark):
+        """
+        Counts integers.
+        """
+
+        @staticmethod
+        def total(**kwargs):
+            return 5
+
+        @property
+        def description(self):
+            return "counts integers"
+
+        def before(self):
+            Counting.verified = self.verify
+
+        def after(self, cleanup=True):
+            pass
+
+        def instances(self, limit=None):
+            return limit_generator(iter(range(5)), limit)
+
+        def preprocess(self, instance):
+            return instance
+
+        def inference(self, instance):
+            return instance + 1
+
+    yield Counting
+    unregister("counting")
+
+
+@pytest.mark.parametrize("command", [["run", "-I", "counting"], ["counting"]])
+def test_cli_registered_benchmark(counting, tmpdir, command):
+    """
+    Test that registered benchmarks can be run with the run command or their own
+    """
+    out = str(tmpdir.join("results.json"))
+    args = [
+        "-D", str(tmpdir.ensure("data", dir=True)),
+        "-M", str(tmpdir.ensure("models", dir=True)),
+        "-o", out, "-Q", "--no-memory",
+    ]
+
+    result = CliRunner().invoke(main, args + command)
+    assert result.exit_code == 0, result.output
+
+    with open(out, "r") as f:
+        results = load(f)
+    assert results["benchmarks"] == ["Counting"]
+
+    result = CliRunner().invoke(main, args + ["run", "-I", "foo"])
+    assert result.exit_code == 2
+
+
+@pytest.mark.parametrize(
+    "command,downloader,expected",
+    [
+        (["datasets", "-d", "all"], "download_all_datasets",
+         {"workers": 4, "connections": 8}),
+        (["datasets", "-d", "all", "-w", "2", "-c", "6"], "download_all_datasets",
+         {"workers": 2, "connections": 6}),
+        (["datasets", "-d", "dialects", "-c", "2"], "download_dialects", {"parts": 2}),
+        (["models", "-d", "all", "-c", "3"], "download_all_models",
+         {"workers": 4, "connections": 3}),
+        (["models", "-d", "whisper"], "download_whisper", {"parts": 4}),
+    ],
+)
+def test_cli_download_connections(tmpdir, command, downloader, expected):
+    """
+    Test the connection cap is passed to the downloaders
+    """
+    args = ["-D", str(tmpdir), "-M", str(tmpdir)] + command
+    with mock.patch(f"construe.__main__.{downloader}") as download:
+        result = CliRunner().invoke(main, args)
+
+    assert result.exit_code == 0, result.output
+    kwargs = download.call_args.kwargs
+    assert {key: kwargs[key] for key in expected} == expected
+
+
+def test_cli_shadowed_benchmark(counting):
+    """
+    Test a benchmark registered with the name of a built-in command is warned about
+    """
+    register(counting, name="compare")
+    try:
+        with pytest.warns(UserWarning, match="'compare' is shadowed") as record:
+            result = CliRunner().invoke(main, ["--help"])
+        assert result.exit_code == 0, result.output
+        assert len(record) == 1
+
+        with pytest.warns(UserWarning, match="run --include compare"):
+            result = CliRunner().invoke(main, ["compare", "--help"])
+        assert "BASELINE" in result.output
+    finally:
+        unregister("compare")
+
+
+def test_cli_compare_exit_code(tmpdir):
+    """
+    Test a regression exits with a status distinct from usage and other errors
+    """
+    def results(name, scale):
+        path = str(tmpdir.join(f"{name}.json"))
+        latency = [(1.0 + 0.01 * (i % 7)) * scale for i in range(50)]
+        metric = Metric(label="Whisper", sub_label="inferencing")
+        with open(path, "w") as f:
+            dump({"measurements": [Measurement(metric, latency, units="s")]}, f)
+        return path
+
+    baseline, same, slower = results("a", 1), results("b", 1), results("c", 1.5)
+
+    result = CliRunner().invoke(main, ["compare", baseline, same, "-S", "1"])
+    assert result.exit_code == 0, result.output
+
+    result = CliRunner().invoke(main, ["compare", baseline, slower, "-S", "1"])
+    assert result.exit_code == 3, result.output
+    assert "REGRESSION" in result.output
+
+    result = CliRunner().invoke(main, ["compare", baseline, "missing.json"])
+    assert result.exit_code == 2
+
+
+@pytest.mark.parametrize("flag,expected", [([], None), (["-V"], True)])
+def test_cli_verify(counting, tmpdir, monkeypatch, flag, expected):
+    """
+    Test --verify is passed to the benchmarks without changing the environment
+    """
+    monkeypatch.delenv("CONSTRUE_VERIFY", raising=False)
+    args = [
+        "-D", str(tmpdir.ensure("data", dir=True)),
+        "-M", str(tmpdir.ensure("models", dir=True)),
+        "-o", str(tmpdir.join("results.json")), "-Q",
+    ]
+
+    result = CliRunner().invoke(main, args + flag + ["counting"])
+    assert result.exit_code == 0, result.output
+    assert counting.verified is expected
+    assert "CONSTRUE_VERIFY" not in os.environ
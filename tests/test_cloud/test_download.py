@@ -0,0 +1,301 @@
+"""
+Tests for downloading and extracting zip archives.
+"""
+
+import os
+import pytest
+import hashlib
+import zipfile
+import threading
+
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from construe.cloud import download
+from construe.cloud.download import download_zip, probe, PART_EXT
+from construe.cloud.download import download_concurrently, DownloadProgress
+from functools import partial
+from construe.cloud.signature import cached_signature
+from construe.exceptions import DownloadError
+
+
+@pytest.fixture
+def remote(tmp_path):
+    """
+    Creates a zip archive to download with a file:// URL.
+    """
+    src = tmp_path / "remote"
+    src.mkdir()
+
+    path = src / "dataset.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("dataset/a.txt", "a" * 1000)
+        zf.writestr("dataset/b.txt", os.urandom(2**20))
+
+    signature = hashlib.sha256(path.read_bytes()).hexdigest()
+    return path.as_uri(), signature
+
+
+def test_download_zip(remote, tmp_path):
+    url, signature = remote
+    out = tmp_path / "data"
+    out.mkdir()
+
+    # The archive must not be reread to compute its signature
+    with mock.patch("construe.cloud.signature.sha256sum") as sha:
+        download_zip(url, str(out), signature, progress=False)
+        sha.assert_not_called()
+
+    archive = str(out / "dataset.zip")
+    assert os.path.exists(out / "dataset" / "dataset" / "a.txt")
+    assert os.path.getsize(out / "dataset" / "dataset" / "b.txt") == 2**20
+    assert cached_signature(archive) == signature
+
+    with pytest.raises(DownloadError):
+        download_zip(url, str(out), signature, progress=False)
+
+    download_zip(url, str(out), signature, replace=True, extract=False, progress=False)
+    assert not os.path.exists(out / "dataset" / "dataset")
+
+
+def test_download_zip_bad_signature(remote, tmp_path):
+    url, _ = remote
+    with mock.patch.object(download, "write_signature") as write:
+        with pytest.raises(DownloadError):
+            download_zip(url, str(tmp_path), "0" * 64, progress=False)
+        write.assert_not_called()
+
+    assert not os.path.exists(tmp_path / "dataset" / "dataset")
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """
+    Serves the archive of the test server supporting HEAD and Range requests. If
+    the server has failures remaining, ranged responses are truncated halfway.
+    """
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.respond(body=False)
+
+    def do_GET(self):
+        self.respond(body=True)
+
+    def respond(self, body=True):
+        data = self.server.data
+        start, end = 0, len(data)
+
+        srange = self.headers.get("Range") if self.server.ranges else None
+        if body:
+            with self.server.lock:
+                self.server.requests.append(srange)
+
+        if srange:
+            first, last = srange.removeprefix("bytes=").split("-")
+            start, end = int(first), int(last) + 1 if last else len(data)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end-1}/{len(data)}")
+        else:
+            self.send_response(200)
+
+        self.send_header("Content-Length", str(end - start))
+        if self.server.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+        if not body:
+            return
+
+        payload = data[start:end]
+        with self.server.lock:
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+
+        try:
+            self.send_payload(payload, srange)
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+
+    def send_payload(self, payload, srange):
+        with self.server.lock:
+            fail = bool(srange) and self.server.failures > 0
+            if fail:
+                self.server.failures -= 1
+
+        if fail:
+            self.wfile.write(payload[:len(payload) // 2])
+            return
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def server(remote):
+    path = remote[0].removeprefix("file://")
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    httpd.data = open(path, "rb").read()
+    httpd.signature = remote[1]
+    httpd.ranges = True
+    httpd.failures = 0
+    httpd.requests = []
+    httpd.active = 0
+    httpd.max_active = 0
+    httpd.lock = threading.Lock()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/dataset.zip"
+
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def small_parts(monkeypatch):
+    monkeypatch.setattr(download, "MIN_PART_SIZE", 2**18)
+    monkeypatch.setattr(download, "CHUNK", 2**16)
+
+
+def assert_extracted(out):
+    assert os.path.exists(out / "dataset" / "dataset" / "a.txt")
+    assert os.path.getsize(out / "dataset" / "dataset" / "b.txt") == 2**20
+    assert not os.path.exists(out / ("dataset.zip" + PART_EXT))
+
+
+def test_probe(server):
+    assert probe(server.url) == (len(server.data), True)
+    server.ranges = False
+    assert probe(server.url) == (len(server.data), False)
+
+
+def test_download_ranges(server, tmp_path, small_parts):
+    download_zip(server.url, str(tmp_path), server.signature, progress=False, parts=4)
+    assert_extracted(tmp_path)
+    assert cached_signature(str(tmp_path / "dataset.zip")) == server.signature
+
+    assert len(server.requests) == 4
+    assert all(request.startswith("bytes=") for request in server.requests)
+
+
+def test_prefix_hasher(tmp_path):
+    data = os.urandom(2**12)
+    path = tmp_path / "data.part"
+    path.write_bytes(data)
+
+    # The last range is downloaded before the first, then the middle range
+    parts = [[0, 1024, 0], [1024, 2048, 1024], [2048, 4096, 2048]]
+    hasher = download._PrefixHasher(str(path), parts)
+
+    parts[2][2] = 4096
+    hasher.update(2048, data[2048:])
+    assert hasher.hashed == 0
+
+    parts[0][2] = 1024
+    hasher.update(0, data[:1024])
+    assert hasher.hashed == 1024
+
+    parts[1][2] = 2048
+    hasher.update(1024, data[1024:2048])
+    assert hasher.hashed == 4096
+
+    assert hasher.hexdigest() == hashlib.sha256(data).hexdigest()
+    assert hasher.reread == 2048, "only bytes ahead of the prefix should be reread"
+
+
+def test_download_ranges_retry(server, tmp_path, small_parts):
+    server.failures = 3
+    download_zip(
+        server.url, str(tmp_path), server.signature, progress=False, parts=4, backoff=0
+    )
+    assert_extracted(tmp_path)
+    assert len(server.requests) == 7
+
+
+@pytest.mark.parametrize("parts", [1, 4])
+def test_download_ranges_resume(server, tmp_path, small_parts, parts):
+    server.failures = 1
+    with pytest.raises(DownloadError):
+        download_zip(
+            server.url, str(tmp_path), server.signature,
+            progress=False, parts=parts, retries=0,
+        )
+
+    partpath = tmp_path / ("dataset.zip" + PART_EXT)
+    assert os.path.exists(partpath)
+    assert not os.path.exists(tmp_path / "dataset.zip")
+
+    # Only the remainder of the failed range is requested when resuming
+    failed = len(server.requests)
+    # The archive must not be reread after the download to compute its signature
+    with mock.patch("construe.cloud.signature.sha256sum") as sha:
+        download_zip(server.url, str(tmp_path), server.signature, progress=False, parts=parts)
+        sha.assert_not_called()
+
+    assert_extracted(tmp_path)
+    resumed = server.requests[failed:]
+    assert len(resumed) == 1
+
+    def start(request):
+        return int(request.removeprefix("bytes=").split("-")[0])
+
+    # The range resumes after the bytes that were written before the failure
+    assert start(resumed[0]) not in {start(r) for r in server.requests[:failed]}
+
+
+def test_download_ranges_bad_signature(server, tmp_path, small_parts):
+    with pytest.raises(DownloadError):
+        download_zip(server.url, str(tmp_path), "0" * 64, progress=False)
+    assert not os.path.exists(tmp_path / ("dataset.zip" + PART_EXT))
+
+
+def test_download_no_ranges(server, tmp_path, small_parts):
+    server.ranges = False
+    download_zip(server.url, str(tmp_path), server.signature, progress=False)
+    assert_extracted(tmp_path)
+    assert server.requests == [None]
+
+
+def test_download_concurrently(server, tmp_path, small_parts):
+    downloaders = [
+        partial(download_zip, server.url.replace("dataset", f"dataset{i}"), str(tmp_path))
+        for i in range(4)
+    ]
+
+    download_concurrently(
+        downloaders, workers=2, connections=4, progress=False,
+        signature=server.signature,
+    )
+
+    for i in range(4):
+        assert os.path.exists(tmp_path / f"dataset{i}" / "dataset" / "a.txt")
+
+    # Each of the two workers downloads its archive in two parts
+    assert len(server.requests) == 8
+    assert server.max_active <= 4
+
+
+def test_download_concurrently_errors(server, tmp_path):
+    downloaders = [
+        partial(download_zip, server.url, str(tmp_path / "missing")),
+        partial(download_zip, server.url, str(tmp_path)),
+    ]
+
+    with pytest.raises(DownloadError, match="1 of 2 downloads failed"):
+        download_concurrently(downloaders, progress=False, signature=server.signature)
+
+    # The other downloads are still completed
+    assert os.path.exists(tmp_path / "dataset" / "dataset" / "a.txt")
+
+
+def test_download_progress():
+    progress = DownloadProgress()
+    progress.add(100)
+    progress.add(None)
+    progress.update(40)
+    assert progress.pbar.total == 100
+    assert progress.pbar.n == 40
+    progress.close()
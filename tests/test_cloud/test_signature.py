@@ -0,0 +1,79 @@
+"""
+Tests for computing and caching file signatures.
+"""
+
+import os
+import pytest
+
+from unittest import mock
+
+from construe.cloud import signature
+from construe.cloud.signature import sha256sum, verified_signature, cached_signature
+from construe.cloud.signature import resolve_verify, remove_signature, sidecar_path
+
+
+EXPECTED = "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824"
+
+
+@pytest.fixture
+def archive(tmp_path):
+    path = tmp_path / "archive.zip"
+    path.write_bytes(b"hello")
+    return str(path)
+
+
+def test_sha256sum(archive):
+    assert sha256sum(archive) == EXPECTED
+
+
+def test_verified_signature_cache(archive):
+    assert cached_signature(archive) is None
+    assert verified_signature(archive) == EXPECTED
+    assert os.path.exists(sidecar_path(archive))
+    assert cached_signature(archive) == EXPECTED
+
+    # An unchanged archive is not rehashed
+    with mock.patch.object(signature, "sha256sum") as sha:
+        assert verified_signature(archive) == EXPECTED
+        sha.assert_not_called()
+
+    # Verify forces the archive to be rehashed
+    with mock.patch.object(signature, "sha256sum", return_value=EXPECTED) as sha:
+        assert verified_signature(archive, verify=True) == EXPECTED
+        sha.assert_called_once_with(archive)
+
+    assert remove_signature(archive)
+    assert not remove_signature(archive)
+    assert cached_signature(archive) is None
+
+
+def test_verified_signature_modified(archive):
+    verified_signature(archive)
+
+    with open(archive, "wb") as f:
+        f.write(b"goodbye")
+
+    assert cached_signature(archive) is None
+    assert verified_signature(archive) == sha256sum(archive)
+    assert verified_signature(archive) != EXPECTED
+
+
+def test_verified_signature_corrupt_sidecar(archive):
+    with open(sidecar_path(archive), "w") as f:
+        f.write("{not json")
+
+    assert cached_signature(archive) is None
+    assert verified_signature(archive) == EXPECTED
+
+
+@pytest.mark.parametrize("value,expected", [
+    (None, False), ("", False), ("0", False), ("1", True), ("true", True), ("yes", True),
+])
+def test_resolve_verify(monkeypatch, value, expected):
+    monkeypatch.delenv("CONSTRUE_VERIFY", raising=False)
+    if value is not None:
+        monkeypatch.setenv("CONSTRUE_VERIFY", value)
+
+    assert resolve_verify() is expected
+    assert resolve_verify(True) is True
+    assert resolve_verify(False) is False
@@ -0,0 +1,144 @@
+"""
+Tests reading dataset instances directly from the archive.
+"""
+
+import os
+import json
+import zipfile
+import pytest
+import numpy as np
+import soundfile as sf
+
+from io import BytesIO
+from construe.datasets import loaders
+from construe.cloud.signature import sha256sum
+from construe.datasets.archive import Archive, ArchiveMember, match
+
+
+@pytest.fixture
+def archive(tmpdir):
+    """
+    A zip archive with stored and deflated members, a directory, and a hidden file.
+    """
+    audio = BytesIO()
+    sf.write(audio, np.linspace(-0.5, 0.5, 800), 8000, format="WAV")
+
+    path = str(tmpdir.join("dialects-sample.zip"))
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("irish/", "")
+        zf.writestr("irish/a.wav", audio.getvalue(), compress_type=zipfile.ZIP_STORED)
+        zf.writestr("irish/b.txt", b"b" * 1000, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("irish/.hidden", b"hidden")
+        zf.writestr("welsh/c.wav", audio.getvalue(), compress_type=zipfile.ZIP_STORED)
+        zf.writestr("readme.txt", b"readme")
+    return path
+
+
+@pytest.mark.parametrize(
+    "name,pattern,expected",
+    [
+        ("irish/a.wav", "**/*", True),
+        ("irish/a.wav", "*/*.wav", True),
+        ("irish/a.wav", "welsh/*", False),
+        ("readme.txt", "**/*", False),
+        ("readme.txt", "*.txt", True),
+        ("lowlight/train/low/1.png", "lowlight/**/*.png", False),
+        ("lowlight/low/1.png", "lowlight/**/*.png", True),
+        ("irish/.hidden", "**/*", False),
+        ("irish/.hidden", "**/.*", True),
+    ],
+)
+def test_match(name, pattern, expected):
+    """
+    Test archive paths are matched with glob semantics
+    """
+    assert match(name, pattern) is expected
+
+
+def test_archive_members(archive):
+    """
+    Test stored and deflated members are read from the archive
+    """
+    with Archive(archive) as arc:
+        members = {str(m): m for m in arc.members("**/*")}
+        assert set(members) == {"irish/a.wav", "irish/b.txt", "welsh/c.wav"}
+
+        with zipfile.ZipFile(archive) as zf:
+            for name, member in members.items():
+                assert isinstance(member, ArchiveMember)
+                assert member.size == zf.getinfo(name).file_size
+                assert member.read() == zf.read(name)
+
+        # Members can be consumed by readers that accept file-like objects
+        audio, samplerate = sf.read(members["irish/a.wav"].open())
+        assert samplerate == 8000
+        assert audio.shape == (800,)
+
+        names = [str(m) for m in arc.members(no_dirs=False)]
+        assert "irish/" in names and "readme.txt" in names
+
+
+def test_archive_read_closed(archive):
+    """
+    Test members can still be read after the archive is closed
+    """
+    with Archive(archive) as arc:
+        members = {str(m): m for m in arc.members("**/*")}
+    assert arc.closed
+
+    with zipfile.ZipFile(archive) as zf:
+        for name, member in members.items():
+            assert member.read() == zf.read(name)
+
+
+def test_load_from_archive(archive, tmpdir, monkeypatch):
+    """
+    Test loaders read from the archive without extracting it unless extract=True
+    """
+    data_home = str(tmpdir)
+    monkeypatch.setitem(
+        loaders.DATASETS,
+        "dialects-sample",
+        {"url": "file:///dialects-sample.zip", "signature": sha256sum(archive)},
+    )
+
+    members = list(loaders.load_dialects(data_home=data_home, extract=False))
+    assert sorted(str(m) for m in members) == [
+        "irish/a.wav", "irish/b.txt", "welsh/c.wav",
+    ]
+    assert not os.path.exists(os.path.join(data_home, "dialects-sample"))
+
+    # The archive is closed when the loader is exhausted or closed
+    assert members[0].archive.closed
+    loader = loaders.load_dialects(data_home=data_home, extract=False)
+    member = next(loader)
+    assert not member.archive.closed
+    loader.close()
+    assert member.archive.closed
+    assert member.read()
+
+    # An archive that was downloaded without being extracted is extracted on demand
+    paths = list(loaders.load_dialects(data_home=data_home, extract=True))
+    assert sorted(os.path.relpath(p, data_home) for p in paths) == [
+        os.path.join("dialects-sample", "irish", "a.wav"),
+        os.path.join("dialects-sample", "irish", "b.txt"),
+        os.path.join("dialects-sample", "welsh", "c.wav"),
+    ]
+
+
+def test_load_jsonl_from_archive(tmpdir, monkeypatch):
+    """
+    Test JSON lines datasets are read from the archive
+    """
+    rows = [{"comment": "foo"}, {"comment": "bar"}]
+    path = str(tmpdir.join("reddit-sample.zip"))
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("reddit.jsonl", "\n".join(json.dumps(row) for row in rows) + "\n")
+
+    monkeypatch.setitem(
+        loaders.DATASETS,
+        "reddit-sample",
+        {"url": "file:///reddit-sample.zip", "signature": sha256sum(path)},
+    )
+
+    assert list(loaders.load_reddit(data_home=str(tmpdir), extract=False)) == rows
@@ -0,0 +1,83 @@
+"""
+Testing for the checkpoint module.
+"""
+
+import pytest
+
+from construe.exceptions import BenchmarkError
+from construe.metrics import Checkpoint, Measurement, Metric, read_checkpoint
+
+
+def make_measurement(run):
+    return Measurement(metric=Metric(label="Basic"), raw_metrics=[run, run + 1.0])
+
+
+def test_checkpoint_write(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    with Checkpoint(path) as checkpoint:
+        checkpoint.write("Basic", 0, [make_measurement(0)])
+        checkpoint.write("Basic", 1, [], errors=["failed"])
+
+    records = read_checkpoint(path)
+    assert len(records) == 2
+    assert records[0]["measurements"] == [make_measurement(0)]
+    assert records[1]["errors"] == ["failed"]
+
+
+def test_checkpoint_resume(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    with Checkpoint(path) as checkpoint:
+        checkpoint.write("Basic", 0, [make_measurement(0)])
+        checkpoint.write("Basic", 1, [], errors=["failed"])
+
+    # A partially written record is ignored and the next record is appended cleanly
+    with open(path, "a") as f:
+        f.write('{"benchmark": "Basic", "run": 2, "meas')
+
+    checkpoint = Checkpoint(path, resume=True)
+    assert checkpoint.completed == {("Basic", 0)}
+    assert checkpoint.measurements == [make_measurement(0)]
+
+    with checkpoint:
+        checkpoint.write("Basic", 1, [make_measurement(1)])
+
+    assert [r["run"] for r in read_checkpoint(path)] == [0, 1, 1]
+    assert Checkpoint(path, resume=True).completed == {("Basic", 0), ("Basic", 1)}
+
+    # Without resume the checkpoint is truncated
+    assert Checkpoint(path).completed == set()
+    with Checkpoint(path):
+        pass
+    assert read_checkpoint(path) == []
+
+
+def test_checkpoint_config(tmp_path):
+    """
+    Test the config is written in a header and checked when resuming
+    """
+    path = tmp_path / "checkpoint.jsonl"
+    config = {"batch_size": 4, "rates": (1.0, 2.0)}
+    with Checkpoint(path, config=config) as checkpoint:
+        checkpoint.write("Basic", 0, [make_measurement(0)])
+
+    with open(path) as f:
+        assert '"type": "header"' in f.readline()
+    assert len(read_checkpoint(path)) == 1
+
+    with Checkpoint(path, resume=True, config=config) as checkpoint:
+        checkpoint.write("Basic", 1, [make_measurement(1)])
+    assert Checkpoint(path, resume=True, config=config).completed == {
+        ("Basic", 0), ("Basic", 1)
+    }
+
+    with pytest.raises(BenchmarkError, match="batch_size"):
+        Checkpoint(path, resume=True, config={**config, "batch_size": 8})
+
+    # A checkpoint without a header cannot be verified
+    with open(path) as f:
+        lines = f.readlines()
+    with open(path, "w") as f:
+        f.writelines(lines[1:])
+
+    with pytest.raises(BenchmarkError, match="no config header"):
+        Checkpoint(path, resume=True, config=config)
@@ -0,0 +1,125 @@
+"""
+Testing for the compare module.
+"""
+
+import pytest
+import numpy as np
+
+from construe.exceptions import MetricsError
+from construe.metrics import Metric, Measurement, Sketch
+from construe.metrics.compare import compare, mann_whitney, bootstrap_change
+from construe.metrics.compare import higher_is_better
+
+
+def make_measurement(values, sub_label="inferencing", units="s", env="baseline"):
+    return Measurement(
+        metric=Metric(label="Whisper", sub_label=sub_label, env=env),
+        raw_metrics=values,
+        units=units,
+    )
+
+
+def test_mann_whitney():
+    u, p = mann_whitney([1, 2, 3], [4, 5, 6])
+    assert u == 0
+    assert p == pytest.approx(0.0809, abs=1e-4)
+
+    # Ties are assigned the average rank
+    u, p = mann_whitney([1, 1, 2], [1, 2, 2])
+    assert u == 3.0
+    assert p == pytest.approx(0.6193, abs=1e-4)
+
+    # Identical samples are never significant
+    assert mann_whitney([1, 1, 1], [1, 1]) == (3.0, 1.0)
+
+    with pytest.raises(ValueError):
+        mann_whitney([], [1])
+
+
+def test_bootstrap_change():
+    rng = np.random.default_rng(42)
+    baseline = rng.normal(1.0, 0.05, 200)
+    low, high = bootstrap_change(baseline, baseline * 1.2, seed=42)
+    assert low < 0.2 < high
+    assert low > 0.1
+
+    low, high = bootstrap_change(baseline, baseline, seed=42)
+    assert low <= 0 <= high
+
+
+def test_higher_is_better():
+    assert higher_is_better(make_measurement([1], "inferencing-throughput", "items/s"))
+    assert higher_is_better(make_measurement([1], "pipeline-efficiency", None))
+    assert not higher_is_better(make_measurement([1], "inferencing", "s"))
+    assert not higher_is_better(make_measurement([1], "inferencing-memory", "B"))
+
+
+def test_compare():
+    rng = np.random.default_rng(7)
+    latency = rng.normal(1.0, 0.05, 100)
+    throughput = rng.normal(100, 5, 100)
+
+    baseline = [
+        make_measurement(latency, "inferencing"),
+        make_measurement(latency, "preprocessing"),
+        make_measurement(throughput, "inferencing-throughput", "items/s"),
+        make_measurement(latency, "only-baseline"),
+    ]
+    candidate = [
+        make_measurement(latency * 1.25, "inferencing", env="candidate"),
+        make_measurement(latency * 0.98, "preprocessing", env="candidate"),
+        make_measurement(throughput * 1.25, "inferencing-throughput", "items/s"),
+    ]
+
+    results = {c.metric.sub_label: c for c in compare(baseline, candidate, seed=1)}
+    assert set(results) == {"inferencing", "preprocessing", "inferencing-throughput"}
+
+    slower = results["inferencing"]
+    assert slower.change == pytest.approx(0.25, rel=0.05)
+    assert slower.ci_low < slower.change < slower.ci_high
+    assert slower.significant and slower.regression
+
+    # A small change is not a regression even if significant
+    assert not results["preprocessing"].regression
+
+    # Higher throughput is an improvement
+    faster = results["inferencing-throughput"]
+    assert faster.significant and not faster.regression
+
+    # The threshold determines if a significant change is a regression
+    results = compare(baseline[:1], candidate[:1], threshold=0.5, seed=1)
+    assert results[0].significant and not results[0].regression
+
+
+def test_compare_sketched():
+    baseline = [make_measurement([1.0, 1.1, 0.9])]
+    candidate = [
+        Measurement(
+            metric=baseline[0].metric,
+            raw_metrics=[],
+            sketch=Sketch.from_values([2.0, 2.2, 1.8]),
+            units="s",
+        )
+    ]
+
+    result = compare(baseline, candidate)[0]
+    assert result.change == pytest.approx(1.0, rel=0.02)
+    assert result.p_value is None
+    assert not result.significant and not result.regression
+
+
+def test_compare_duplicates():
+    """
+    Test measurements that cannot be aligned are not silently overwritten
+    """
+    rng = np.random.default_rng(7)
+    latency = rng.normal(1.0, 0.05, 100)
+
+    # The same measurement of two runs is merged before aligning
+    baseline = [make_measurement(latency), make_measurement(latency)]
+    assert len(compare(baseline, [make_measurement(latency)], seed=1)) == 1
+
+    # The same measurement from different environments cannot be aligned
+    baseline.append(make_measurement(latency * 2, env="other"))
+    with pytest.raises(MetricsError, match="multiple Whisper inferencing"):
+        compare(baseline, [make_measurement(latency)])
@@ -0,0 +1,70 @@
+"""
+Testing for the histogram module.
+"""
+
+import pytest
+import numpy as np
+
+from construe.metrics import Histogram
+
+
+class TestHistogram(object):
+    """
+    Log-bucketed histogram tests
+    """
+
+    def test_buckets(self):
+        """
+        Assert that each value is within the bounds of its bucket
+        """
+        values = [1e-9, 3.2e-6, 0.0042, 0.5, 1.0, 1.5, 7.0, 1024.0, 3.6e3]
+        hist = Histogram.from_values(values)
+        buckets = hist.buckets()
+
+        assert hist.total == len(values)
+        assert len(buckets) == len(values)
+        for value, (lower, upper, count) in zip(values, buckets):
+            assert lower <= value < upper
+            assert (upper - lower) / lower <= 1 / 64
+            assert count == 1
+
+    def test_zeros(self):
+        hist = Histogram.from_values([0, 0, -1, 2.0])
+        assert hist.zeros == 3
+        assert hist.total == 4
+        assert hist.buckets()[0] == (0.0, 0.0, 3)
+        assert hist.quantile(0.5) == 0.0
+
+    @pytest.mark.parametrize("q", [0.0, 0.25, 0.5, 0.9, 0.99, 0.999, 1.0])
+    def test_quantile(self, q):
+        """
+        Assert the histogram quantile is within the relative error of the exact one
+        """
+        values = np.random.default_rng(42).lognormal(mean=-4, sigma=1, size=10000)
+        hist = Histogram.from_values(values)
+        expected = np.quantile(values, q, method="lower")
+        assert hist.quantile(q) == pytest.approx(expected, rel=1 / 128)
+
+    def test_merge(self):
+        """
+        Assert that merging histograms is the same as building from all values
+        """
+        rng = np.random.default_rng(42)
+        a, b = rng.exponential(0.1, size=500), rng.exponential(2.0, size=700)
+
+        merged = Histogram.from_values(a).merge(Histogram.from_values(b))
+        assert merged == Histogram.from_values(np.concatenate([a, b]))
+        assert merged.total == 1200
+
+        with pytest.raises(ValueError):
+            merged.merge(Histogram(sub_buckets=16))
+
+    def test_serialize(self):
+        hist = Histogram.from_values([0, 0.1, 0.2, 0.2, 3.0])
+        assert Histogram.load(hist.dump()) == hist
+
+    def test_empty(self):
+        hist = Histogram()
+        assert hist.total == 0
+        assert hist.quantile(0.5) is None
+        assert hist.buckets() == []
@@ -3,8 +3,9 @@ Testing for the metrics module.
 """
 
 import pytest
+import numpy as np
 
-from construe.metrics import Metric, Measurement
+from construe.metrics import Metric, Measurement, Sketch
 from construe.metrics import select_duration_unit
 
 
@@ -43,14 +44,103 @@ class TestMeasurement(object):
         m = Measurement(metric=Metric(), raw_metrics=[1, 2, 3])
         assert m.per_run == 1, "per run is not set to one!"
 
+    def test_array_backed(self):
+        """
+        Assert raw metrics are stored as a float64 array and merged by concatenation
+        """
+        m = Measurement(metric=Metric(), raw_metrics=[2, 4, 6, 8], per_run=2)
+        assert m.raw_metrics.dtype == np.float64
+        np.testing.assert_array_equal(m.metrics, [1, 2, 3, 4])
+        assert m.metrics is m.metrics, "per-run metrics should be computed once"
+
+        with pytest.raises(ValueError):
+            m.metrics[0] = 10
+
+        assert m == Measurement(metric=Metric(), raw_metrics=[2, 4, 6, 8], per_run=2)
+        assert m != Measurement(metric=Metric(), raw_metrics=[2, 4, 6], per_run=2)
+
+        merged = Measurement.merge([m, m])
+        assert merged[0].count == 8
+        np.testing.assert_array_equal(merged[0].metrics, [1, 2, 3, 4] * 2)
+
+    def test_zero_median(self):
+        """
+        Assert that confidence does not fail when the median is zero
+        """
+        m = Measurement(metric=Metric(), raw_metrics=[0, 0, 0, 0])
+        assert m.meets_confidence()
+        assert not m.has_warnings
+
+        m = Measurement(metric=Metric(), raw_metrics=[0, 0, 0, 1, 2])
+        assert not m.meets_confidence()
+        assert m.has_warnings
+
+    def test_sketched_stats(self):
+        """
+        Test the stats of a measurement backed only by a sketch
+        """
+        sketch = self.measurement.to_sketch()
+        m = Measurement(metric=self.measurement.metric, raw_metrics=[], sketch=sketch)
+
+        assert m.is_sketched
+        assert m.count == 100
+        assert m.histogram is None
+        assert m.median == pytest.approx(self.measurement.median, rel=0.02)
+        assert m.p99 == pytest.approx(self.measurement.p99, rel=0.02)
+        assert m.mean == pytest.approx(self.measurement.mean)
+        assert m.max == self.measurement.max
+
+    def test_merge_sketched(self):
+        """
+        Test that merging raw and sketched measurements produces a sketch
+        """
+        metric = self.measurement.metric
+        raw = Measurement(metric=metric, raw_metrics=[1.0, 2.0, 3.0], units="s")
+        sketched = Measurement(
+            metric=metric, raw_metrics=[], sketch=Sketch.from_values([4.0, 5.0])
+        )
+
+        merged = Measurement.merge([raw, sketched, raw])
+        assert len(merged) == 1
+        assert merged[0].is_sketched
+        assert merged[0].count == 8
+        assert merged[0].units == "s"
+        assert merged[0].max == 5.0
+
+        merged = Measurement.merge([raw, raw])
+        assert not merged[0].is_sketched
+        assert merged[0].count == 6
+
     def test_stats(self):
         """
         Test stats calculations of measurement
         """
         assert self.measurement.median == 23.260444076123438
-        assert self.measurement.mean == 23.112752271750523
+        assert self.measurement.mean == pytest.approx(23.112752271750523)
         assert self.measurement.iqr == 8.44631785879561
 
+    def test_tail_stats(self):
+        """
+        Test the tail percentiles and spread of the measurement
+        """
+        m = self.measurement
+        assert m.min == pytest.approx(15.064778684932376)
+        assert m.max == pytest.approx(29.932925723459075)
+        assert m.median < m.p75 < m.p90 < m.p95 < m.p99 < m.p999 <= m.max
+        assert m.stddev == pytest.approx(m.to_array().std())
+
+        stats = m.stats
+        assert stats["n"] == 100
+        assert stats["p99"] == m.p99
+
+    def test_histogram(self):
+        """
+        Test the histogram of the measurement
+        """
+        hist = self.measurement.histogram
+        assert hist.total == 100
+        assert hist.quantile(0.5) == pytest.approx(self.measurement.median, rel=0.01)
+
 
 @pytest.mark.parametrize(
     "t,expected",
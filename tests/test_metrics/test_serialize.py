@@ -3,13 +3,18 @@ Testing for serialize module.
 """
 
 import json
+import pytest
+import numpy as np
 
-from construe.metrics import dumps
-from construe.metrics import Metric, Measurement
+from unittest import mock
+from construe.metrics import dumps, loads, load
+from construe.metrics import dump_binary, load_binary, is_binary, open_results
+from construe.metrics import Metric, Measurement, Sketch
 
 
-def test_serialize_string():
-    measurement = Measurement(
+@pytest.fixture
+def measurement():
+    return Measurement(
         raw_metrics=[
             21.82307791099665,
             26.531772732839926,
@@ -29,9 +34,101 @@ def test_serialize_string():
         metadata={"testing": True},
     )
 
+
+def test_serialize_string(measurement):
     out = dumps(measurement)
     assert len(out) > 20, "no data was output from the dump method"
 
     data = json.loads(out)
     assert "type" in data, "no type was in the data struct"
     assert data["type"] == Measurement.__name__, "incorrect type added to data"
+
+    assert data["stats"]["n"] == 7
+    assert data["stats"]["p99"] == measurement.p99
+    assert data["histogram"]["buckets"], "no histogram was serialized"
+    assert data["metric"]["type"] == Metric.__name__
+
+
+def test_deserialize_string(measurement):
+    loaded = loads(dumps(measurement))
+    assert isinstance(loaded, Measurement)
+    assert isinstance(loaded.metric, Metric)
+    assert loaded.metric == measurement.metric
+    np.testing.assert_array_equal(loaded.raw_metrics, measurement.raw_metrics)
+    assert loaded.p99 == measurement.p99
+    assert loaded.histogram == measurement.histogram
+
+
+def test_deserialize_sketch(measurement):
+    sketched = Measurement(
+        metric=measurement.metric, raw_metrics=[], sketch=measurement.to_sketch()
+    )
+
+    loaded = loads(dumps(sketched))
+    assert isinstance(loaded.sketch, Sketch)
+    assert loaded.sketch == sketched.sketch
+    assert loaded.p99 == sketched.p99
+
+
+def test_binary_roundtrip(measurement, tmp_path):
+    path = tmp_path / "results.npz"
+    dump_binary({"measurements": [measurement]}, path)
+    assert is_binary(path)
+
+    loaded = load_binary(path)["measurements"][0]
+    assert isinstance(loaded, Measurement)
+    assert loaded.is_loaded
+    assert loaded == measurement
+    assert loaded.raw_metrics.dtype == np.float64
+
+    # The archive can also be read with numpy
+    with np.load(path) as archive:
+        np.testing.assert_array_equal(archive["arrays/0"], measurement.raw_metrics)
+
+
+def test_binary_lazy(measurement, tmp_path):
+    path = tmp_path / "results.npz"
+    dump_binary([measurement, measurement], path, compress=True)
+
+    with open_results(path) as loaded:
+        assert len(loaded) == 2
+        assert not loaded[0].is_loaded, "raw metrics loaded before access"
+        assert loaded[0].metric == measurement.metric
+
+        assert loaded[0].p99 == measurement.p99
+        assert loaded[0].is_loaded
+        assert not loaded[1].is_loaded
+
+    # The archive is closed on exit
+    assert loaded[0].p99 == measurement.p99
+    with pytest.raises(ValueError, match="archive is closed"):
+        loaded[1].raw_metrics
+
+
+def test_load_binary_closes(measurement, tmp_path):
+    """
+    Test loading binary results reads all raw metrics and closes the archive
+    """
+    path = tmp_path / "results.npz"
+    dump_binary([measurement, measurement], path)
+
+    with mock.patch("numpy.lib.npyio.NpzFile.close", autospec=True) as close:
+        loaded = load(path)
+        assert close.call_count >= 1
+
+    assert all(m.is_loaded for m in loaded)
+    assert loaded == [measurement, measurement]
+
+
+@pytest.mark.parametrize("binary", [True, False])
+def test_load_detects_format(measurement, tmp_path, binary):
+    path = tmp_path / "results.out"
+    if binary:
+        dump_binary(measurement, path)
+    else:
+        path.write_text(dumps(measurement))
+
+    assert is_binary(path) == binary
+    assert load(path) == measurement
+    with open(path, "rb") as f:
+        assert load(f) == measurement
@@ -0,0 +1,88 @@
+"""
+Testing for the quantile sketch module.
+"""
+
+import pytest
+import numpy as np
+
+from construe.metrics import Sketch
+
+
+@pytest.fixture(scope="module")
+def values():
+    return np.random.default_rng(42).lognormal(mean=-3, sigma=1.5, size=20000)
+
+
+class TestSketch(object):
+    """
+    DDSketch quantile sketch tests
+    """
+
+    @pytest.mark.parametrize("q", [0.0, 0.01, 0.25, 0.5, 0.75, 0.9, 0.99, 0.999, 1.0])
+    def test_quantile(self, values, q):
+        """
+        Assert the sketch quantile is within the relative accuracy of the exact one
+        """
+        sketch = Sketch.from_values(values)
+        expected = np.quantile(values, q, method="lower")
+        assert sketch.quantile(q) == pytest.approx(expected, rel=0.01)
+
+    def test_exact_stats(self, values):
+        sketch = Sketch.from_values(values)
+        assert sketch.count == values.size
+        assert sketch.min == values.min()
+        assert sketch.max == values.max()
+        assert sketch.mean == pytest.approx(values.mean())
+        assert sketch.stddev == pytest.approx(values.std())
+
+    def test_add(self, values):
+        """
+        Assert that adding values one at a time is the same as a vectorized update
+        """
+        sketch = Sketch()
+        for value in values[:1000]:
+            sketch.add(value)
+
+        expected = Sketch.from_values(values[:1000])
+        assert sketch.bins == expected.bins
+        assert sketch.count == expected.count
+        assert sketch.quantile(0.99) == expected.quantile(0.99)
+
+    def test_merge(self, values):
+        a = Sketch.from_values(values[:5000])
+        b = Sketch.from_values(values[5000:])
+        merged = a.merge(b)
+
+        expected = Sketch.from_values(values)
+        assert merged.bins == expected.bins
+        assert merged.count == expected.count
+        assert merged.quantile(0.5) == expected.quantile(0.5)
+
+        with pytest.raises(ValueError):
+            merged.merge(Sketch(relative_accuracy=0.05))
+
+    def test_fixed_memory(self, values):
+        """
+        Assert the sketch is bounded and the upper quantiles remain accurate
+        """
+        sketch = Sketch.from_values(values, max_bins=100)
+        assert len(sketch.bins) <= 100
+
+        expected = np.quantile(values, 0.99, method="lower")
+        assert sketch.quantile(0.99) == pytest.approx(expected, rel=0.01)
+
+    def test_zeros(self):
+        sketch = Sketch.from_values([0.0, 0.0, 0.0, 1.0])
+        assert sketch.zeros == 3
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(1.0, rel=0.01)
+
+    def test_serialize(self, values):
+        sketch = Sketch.from_values(values)
+        assert Sketch.load(sketch.dump()) == sketch
+        assert Sketch.load(Sketch().dump()).count == 0
+
+    def test_empty(self):
+        sketch = Sketch()
+        assert sketch.quantile(0.5) is None
+        assert sketch.mean is None
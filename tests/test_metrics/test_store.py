@@ -0,0 +1,105 @@
+"""
+Testing for the results store module.
+"""
+
+import pytest
+import numpy as np
+
+from construe.metrics import Metric, Measurement, Sketch, dump_binary
+from construe.metrics import ResultsStore, get_results_db
+
+
+def make_results(env, started, median, device="cpu", version="0.4.0"):
+    return {
+        "type": "Results",
+        "env": env,
+        "device": device,
+        "version": version,
+        "started": started,
+        "n_runs": 1,
+        "measurements": [
+            Measurement(
+                metric=Metric(label="Whisper", sub_label=sub_label, env=env, device=device),
+                raw_metrics=np.array([0.9, 1.0, 1.1]) * median,
+                units="s",
+            )
+            for sub_label in ("preprocessing", "inferencing")
+        ],
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultsStore(tmp_path / "results.db") as store:
+        for i in range(5):
+            started = f"2025-01-0{i+1}T00:00:00.000000Z"
+            store.add(make_results("rpi5-a", started, 1.0 + i))
+            store.add(make_results("rpi5-b", started, 2.0 + i))
+            store.add(make_results("genio", started, 0.5, device="apu"))
+        yield store
+
+
+def test_get_results_db(monkeypatch):
+    monkeypatch.delenv("CONSTRUE_RESULTS_DB", raising=False)
+    assert get_results_db() == "construe-results.db"
+
+    monkeypatch.setenv("CONSTRUE_RESULTS_DB", "/tmp/results.db")
+    assert get_results_db() == "/tmp/results.db"
+
+
+def test_add_duplicate(store):
+    assert store.add(make_results("genio", "2025-01-01T00:00:00.000000Z", 0.5, "apu")) is None
+    assert len(store.query()) == 30
+
+
+def test_query(store):
+    rows = store.query(label="whisper", sub_label="inferencing", env="rpi5*", last=3)
+    assert len(rows) == 6
+    assert {row["env"] for row in rows} == {"rpi5-a", "rpi5-b"}
+
+    # Most recent runs first in each series
+    medians = [row["median"] for row in rows if row["env"] == "rpi5-a"]
+    assert medians == pytest.approx([5.0, 4.0, 3.0])
+
+    rows = store.query(device="apu", since="2025-01-04")
+    assert len(rows) == 4
+
+
+def test_compare(store):
+    rows = store.compare(by="env", sub_label="inferencing")
+    assert [row["env"] for row in rows] == ["genio", "rpi5-a", "rpi5-b"]
+    assert [row["runs"] for row in rows] == [5, 5, 5]
+    assert rows[1]["median"] == pytest.approx(3.0)
+    assert rows[1]["min"] == pytest.approx(1.0)
+    assert rows[1]["max"] == pytest.approx(5.0)
+
+    with pytest.raises(ValueError):
+        store.compare(by="label")
+
+
+def test_ingest_measurement(store, tmp_path):
+    path = tmp_path / "results.npz"
+    results = make_results("jetson", "2025-02-01T00:00:00.000000Z", 3.0)
+    results["measurements"].append(Measurement(
+        metric=Metric(label="Whisper", sub_label="sketched", env="jetson"),
+        raw_metrics=[],
+        sketch=Sketch.from_values([1.0, 2.0, 3.0]),
+    ))
+    dump_binary(results, path)
+
+    assert store.ingest(path) is not None
+    assert store.ingest(path) is None
+
+    rows = store.query(env="jetson")
+    assert len(rows) == 3
+
+    for row in rows:
+        measurement = store.measurement(row["id"])
+        assert measurement.count == 3
+        assert measurement.median == pytest.approx(row["median"])
+
+        if row["sub_label"] == "sketched":
+            assert measurement.is_sketched
+        else:
+            original = results["measurements"][0]
+            np.testing.assert_array_almost_equal(measurement.metrics, original.metrics)
@@ -0,0 +1,75 @@
+"""
+Test the tflite interpreter options.
+"""
+
+import pytest
+import numpy as np
+
+from construe.exceptions import ModelsError
+from construe.models.loaders import _interpreter
+from construe.models.options import InterpreterOptions
+from construe.models.options import AUTO, BUILTIN_REF, BUILTIN_WITHOUT_DEFAULT_DELEGATES
+
+
+@pytest.fixture(scope="module")
+def model(tmp_path_factory):
+    """
+    A tiny tflite model that doubles its input
+    """
+    tf = pytest.importorskip("tensorflow")
+
+    @tf.function(input_signature=[tf.TensorSpec([1, 4], tf.float32)])
+    def double(x):
+        return x * 2.0
+
+    converter = tf.lite.TFLiteConverter.from_concrete_functions(
+        [double.get_concrete_function()], double
+    )
+
+    path = tmp_path_factory.mktemp("models") / "double.tflite"
+    path.write_bytes(converter.convert())
+    return str(path)
+
+
+def test_options_validation():
+    """
+    Test invalid interpreter options are rejected
+    """
+    assert InterpreterOptions().resolver == AUTO
+    assert InterpreterOptions(xnnpack=False).resolver == BUILTIN_WITHOUT_DEFAULT_DELEGATES
+    assert InterpreterOptions(num_threads=2).dump() == {
+        "num_threads": 2, "xnnpack": True, "op_resolver": AUTO,
+    }
+
+    with pytest.raises(ModelsError):
+        InterpreterOptions(num_threads=0)
+
+    with pytest.raises(ModelsError):
+        InterpreterOptions(op_resolver="foo")
+
+    with pytest.raises(ModelsError):
+        InterpreterOptions(xnnpack=False, op_resolver=BUILTIN_REF)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        InterpreterOptions(),
+        InterpreterOptions(num_threads=2),
+        InterpreterOptions(num_threads=1, xnnpack=False),
+        InterpreterOptions(op_resolver=BUILTIN_REF),
+    ],
+)
+def test_interpreter(model, options):
+    """
+    Test interpreters are created with the options
+    """
+    interpreter = _interpreter(model, options)
+    interpreter.allocate_tensors()
+
+    inputs = interpreter.get_input_details()[0]["index"]
+    outputs = interpreter.get_output_details()[0]["index"]
+
+    interpreter.set_tensor(inputs, np.ones((1, 4), dtype=np.float32))
+    interpreter.invoke()
+    np.testing.assert_array_equal(interpreter.get_tensor(outputs), np.full((1, 4), 2))
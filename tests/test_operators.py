@@ -0,0 +1,59 @@
+"""
+Tests for the operator microbenchmark definitions.
+"""
+
+import torch
+import pytest
+
+from construe.operators import *
+
+
+def test_gemm_flops():
+    op = gemm("test", 4, 8, 16)
+    assert op.flops == 2 * 4 * 8 * 16
+    assert op.name == "test 4x8x16"
+
+
+@pytest.mark.parametrize(
+    "size,cin,cout,kernel,stride,groups,out,op",
+    [
+        (8, 3, 16, 3, 2, 1, 4, "conv2d"),
+        (8, 4, 8, 1, 1, 1, 8, "conv2d"),
+        (8, 4, 4, 3, 1, 4, 8, "depthwise"),
+    ],
+)
+def test_conv2d_flops(size, cin, cout, kernel, stride, groups, out, op):
+    """
+    Test conv2d FLOPs are counted from the output size with same padding
+    """
+    operator = conv2d("test", size, cin, cout, kernel, stride=stride, groups=groups)
+    assert operator.op == op
+    assert operator.flops == 2 * cout * out * out * (cin // groups) * kernel * kernel
+
+    result = eval(operator.stmt, operator.globals())
+    assert result.shape == (1, cout, out, out)
+
+
+def test_attention_flops():
+    op = attention("test", 16, heads=2, head_dim=8)
+    scores = 2 * 16 * 16
+    assert op.flops == 4 * scores * 8 + SOFTMAX_FLOPS * scores
+
+
+def test_normalization_flops():
+    assert softmax("test", 4, 8).flops == SOFTMAX_FLOPS * 32
+    assert layer_norm("test", 4, 8).flops == LAYER_NORM_FLOPS * 32
+
+
+@pytest.mark.parametrize("suite", list(SUITES))
+def test_suites(suite):
+    """
+    Test the operators of each suite execute and are uniquely identified
+    """
+    operators = SUITES[suite]
+    assert len({(op.name, op.op) for op in operators}) == len(operators)
+    assert len({op.suite for op in operators}) == 1
+
+    for op in operators:
+        assert op.flops > 0
+        assert isinstance(eval(op.stmt, op.globals()), torch.Tensor)
@@ -3,6 +3,7 @@ import pytest
 from datetime import timedelta
 from construe.utils import resolve_exclude
 from construe.utils import humanize_duration
+from construe.utils import format_table
 
 
 @pytest.mark.parametrize("exclude,include,expected", [
@@ -52,3 +53,19 @@ def test_humanize_duration(duration, expected):
     Test that durations are humanized correctly
     """
     assert humanize_duration(duration) == expected
+
+
+def test_format_table():
+    """
+    Test that rows are formatted as an aligned table
+    """
+    rows = [
+        {"label": "Whisper", "median": 1.234567, "runs": 3},
+        {"label": "MobileNet", "median": None, "runs": 12},
+    ]
+    assert format_table(rows, ["label", "median", "runs"]) == (
+        "label      median  runs\n"
+        "---------  ------  ----\n"
+        "Whisper    1.235   3\n"
+        "MobileNet          12"
+    )